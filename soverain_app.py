@@ -1,8 +1,31 @@
 # ======================= Module 0: Setup, Styling, Navigation =======================
 
+import io
 import streamlit as st
-import pandas as pd
-from datetime import datetime
+from datetime import date, datetime, timedelta
+
+# pandas is only imported by the Scoreboard page, so it isn't loaded until that page is opened
+from soverain_core import (
+    SCRIPTURE_CATALOG, A_from_G, G_from_CHF, bar_html, chip_html, donut_html,
+    label_from_score, score_from_A, tag_cloud_html
+)
+from soverain_store import (
+    DB_PATH, connect, data_version, data_versions, list_profiles, load_profile, save_catalog_entry, save_entry,
+    save_goal, save_pathway_step
+)
+from soverain_events import catalog_additions, profile_as_of, start_compactor
+from soverain_cohort import groups as cohort_groups, profile_percentiles
+from soverain_nudges import nudges_for
+from soverain_pathways import PathwayError, list_pathways, load_pathway
+from soverain_trends import PILLARS, last_activity, pillar_trends
+from soverain_tags import canonical_tags, low_alignment_themes, tag_cloud
+from soverain_journal import compact, full_text, matching_ids, snippet_of
+from soverain_bundle import BundleError, export_profile, restore_profile
+from soverain_compare import FREQUENCIES, compare as compare_profiles, summary as comparison_summary
+from soverain_reports import (
+    connect as report_store, load_report, render, report_status, save_report, start_prerenderer
+)
+from soverain_cache import view_cache
 
 # Page config
 st.set_page_config(
@@ -50,13 +73,7 @@ st.markdown("> _“Write the vision; make it plain…” — Habakkuk 2:2_")
 # Initialize profile data if missing
 profile_key = f"profile_{selected_profile}"
 if profile_key not in st.session_state:
-    st.session_state[profile_key] = {
-        "scenarios": [],
-        "assessments": [],
-        "reflections": [],
-        "goal": "—",
-        "last_score": "—"
-    }
+    st.session_state[profile_key] = load_profile(selected_profile)
 
 # Update Compass Bar values
 profile_data = st.session_state[profile_key]
@@ -72,30 +89,13 @@ with st.sidebar:
         st.session_state["selected_profile"] = new_name.strip() or selected_profile
         profile_key = f"profile_{st.session_state['selected_profile']}"
         if profile_key not in st.session_state:
-            st.session_state[profile_key] = {
-                "scenarios": [],
-                "assessments": [],
-                "reflections": [],
-                "goal": new_goal.strip(),
-                "last_score": "—"
-            }
-        else:
-            st.session_state[profile_key]["goal"] = new_goal.strip()
+            st.session_state[profile_key] = load_profile(st.session_state["selected_profile"])
+        st.session_state[profile_key]["goal"] = new_goal.strip()
+        save_goal(st.session_state["selected_profile"], new_goal.strip())
         st.success("Profile updated.")
 
-# Sidebar Navigation
+# About (page navigation is built by st.navigation at the end of this file)
 with st.sidebar:
-    st.markdown("## 🧭 Navigation")
-    st.markdown("""
-    - [📊 Profile Dashboard](#profile-dashboard)
-    - [📖 Scripture Catalog](#scripture-catalog)
-    - [✍️ Add Custom Scenario](#custom-scenario)
-    - [⚡ Instant Calculator](#instant-calculator)
-    - [🧭 Life Assessment](#life-assessment)
-    - [📈 Progress Viewer](#spiritual-progress)
-    - [✝️ Greatest Commands](#greatest-commands)
-    - [🌟 Closing Reflection](#closing-reflection)
-    """, unsafe_allow_html=True)
     st.markdown("---")
     st.markdown("### ℹ️ About Soverain")
     st.markdown("""
@@ -104,6 +104,29 @@ with st.sidebar:
     Your scores are based on Christlikeness, Heart, and Faithfulness—three pillars of godly living.
     """)
 
+# Point-in-time view for the Dashboard, Scoreboard and Legacy Builder
+with st.sidebar:
+    st.markdown("### 🕰️ Point in Time")
+    st.date_input(
+        "View as of (leave empty for today)", value=None, key="as_of",
+        help="Shows the entries dated on or before this day, including restored and imported ones, and the goal as it was then."
+    )
+
+# Derived-view cache: how often pages were served without recomputing (shared by every session)
+with st.sidebar:
+    with st.expander("⚡ View Cache", expanded=False):
+        cache = view_cache.metrics()
+        st.caption(f"{cache['entries']} of {cache['max_entries']} views held")
+        for view, m in cache["views"].items():
+            rate = f"{m['hit_rate']:.0%}" if m["hit_rate"] is not None else "—"
+            st.caption(f"`{view}` · {rate} hits ({m['hits']}/{m['hits'] + m['misses']}) · {m['evictions']} evicted")
+
+# Keep event-log checkpoints current in the background (one thread per process)
+start_compactor(connect)
+
+# Keep the pre-rendered profile reports current in the background (one thread per process)
+start_prerenderer()
+
 # Optional onboarding trigger (for Module 10)
 if "onboarded" not in st.session_state:
     st.session_state["onboarded"] = False
@@ -144,54 +167,6 @@ st.markdown('<a name="core-logic"></a>', unsafe_allow_html=True)
 
 scale = True  # Set to False for 0–10 scale
 
-def G_from_CHF(C, H, F):
-    return round((C * H * F) ** (1/3), 3)
-
-def A_from_G(G):
-    return round((G - 0.5) * 2, 3)
-
-def score_from_A(A):
-    return max(0, min(10, round((A + 1) * 5)))
-
-def label_from_score(score):
-    if score >= 7: return "✅ Aligned (God)"
-    elif score >= 3: return "🟣 Mixed"
-    else: return "⛔ Not God"
-
-def pct(x):
-    return int(round(x * 100))
-
-def donut_html(score, label="Score", scale_label="0–100"):
-    return f"""
-    <div class="donut">
-      <svg viewBox="0 0 36 36">
-        <path class="circle-bg" d="M18 2.0845 a 15.9155 15.9155 0 1 0 0.00001 0" />
-        <path class="circle" stroke-dasharray="{score}, 100" d="M18 2.0845 a 15.9155 15.9155 0 1 0 0.00001 0" />
-        <text x="18" y="20.35" class="score-text" style="font-size: 10px; font-weight: bold;">{score}</text>
-      </svg>
-      <div class="donut-label">{label}</div>
-      <div class="donut-scale">{scale_label}</div>
-    </div>
-    """
-
-def chip_html(label):
-    color = "#10b981" if "Aligned" in label else "#f59e0b" if "Mixed" in label else "#ef4444"
-    return f"""
-    <div style="display:inline-block; background:{color}; color:white; padding:4px 12px; border-radius:20px; font-size:0.85rem;">
-      {label}
-    </div>
-    """
-
-def bar_html(value, label="Progress", color="#3b82f6"):
-    return f"""
-    <div style="margin-top:8px;">
-      <div style="font-size:0.85rem; color:#f1f5f9;">{label}</div>
-      <div style="background:#334155; height:8px; border-radius:4px;">
-        <div style="width:{pct(value)}%; background:{color}; height:8px; border-radius:4px;"></div>
-      </div>
-    </div>
-    """
-
 def preview_card(G, title="Score", scale=True):
     A = A_from_G(G)
     score = score_from_A(A)
@@ -209,510 +184,533 @@ def preview_card(G, title="Score", scale=True):
         st.markdown(bar_html(score_display / 100, "Score", "#10b981" if "Aligned" in label else "#f59e0b" if "Mixed" in label else "#ef4444"), unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
+def profile_at(profile_name, version, as_of=None):
+    # The stored profile at this data version, or as it stood at the end of the "as of" date
+    conn = connect()
+    current = view_cache.get("profile", profile_name, version, None, lambda: load_profile(profile_name, conn))
+    if as_of is None:
+        return current
+    return view_cache.get("profile", profile_name, version, as_of, lambda: profile_as_of(conn, profile_name, current, as_of))
+
+
+def profile_cached(view, profile_name, params, compute):
+    # compute(profile) once per data version, sidebar "as of" date and params. Every session
+    # shares the result, so it is computed from the store (not this session's copy) and must
+    # not be changed.
+    as_of = st.session_state.get("as_of")
+    if as_of is not None:
+        st.caption(f"🕰️ Showing `{profile_name}` as of {as_of:%Y-%m-%d}.")
+    version = data_version(profile_name, connect())
+    return view_cache.get(view, profile_name, version, (as_of, params), lambda: compute(profile_at(profile_name, version, as_of)))
+
+
+def show_reflection(e, key):
+    # Saved journal entries carry a snippet; the full text is decompressed only when opened
+    if "Text" in e:
+        st.markdown(f"**Reflection:** {e['Text']}")
+    elif "TextId" in e:
+        st.markdown(f"**Reflection:** {e['Snippet']}")
+        if e["Snippet"].endswith("...") and st.toggle("📖 Read full reflection", key=f"{key}_{e['TextId']}"):
+            st.markdown(full_text(connect(), e))
+
 # ======================= Module 2: Scripture Catalog & Scenario Builder =======================
 
-st.markdown('<a name="scripture-catalog"></a>', unsafe_allow_html=True)
-st.header("📖 Scripture Catalog")
-st.caption("Explore biblical moments and reflect on their spiritual alignment. Adjust sliders to preview scores.")
-
-SCRIPTURE_CATALOG = [
-    ("Genesis", "22:9–12", "Abraham", "Offer Isaac in obedience", 0.95, 0.95, 0.95, "Genesis 22:9–12"),
-    ("Exodus", "3:4", "Moses", "Respond to God's call at the burning bush", 0.90, 0.90, 0.90, "Exodus 3:4"),
-    ("Matthew", "5:1–12", "Jesus", "Teach the Beatitudes", 1.00, 1.00, 1.00, "Matthew 5:1–12"),
-    ("Luke", "15:20", "Father", "Forgive the prodigal son", 0.95, 0.95, 0.95, "Luke 15:20"),
-    ("John", "13:5", "Jesus", "Wash the disciples’ feet", 1.00, 1.00, 1.00, "John 13:5"),
-    ("Acts", "2:42–47", "Early Church", "Live in unity and generosity", 0.95, 0.95, 0.95, "Acts 2:42–47"),
-]
-
-selected = st.selectbox("Choose a Scripture moment", SCRIPTURE_CATALOG, format_func=lambda x: f"{x[0]} {x[1]} — {x[2]}: {x[3]}")
-book, verse, figure, situation, default_C, default_H, default_F, ref = selected
-
-st.markdown("### ✍️ Rate the Spiritual Alignment")
-C = st.slider("Christlikeness (C)", 0.0, 1.0, default_C, 0.01)
-H = st.slider("Heart (H)", 0.0, 1.0, default_H, 0.01)
-F = st.slider("Faithfulness (F)", 0.0, 1.0, default_F, 0.01)
-
-G = G_from_CHF(C, H, F)
-A = A_from_G(G)
-preview_card(G, title=f"{book} {verse}")
-
-st.markdown("### 🔍 Spiritual Alignment Summary")
-st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
-st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of alignment.")
-
-profile_name = st.session_state.get("selected_profile", "Me")
-if st.button("💾 Save This Scenario"):
-    scenario = {
-        "Book": book,
-        "Verse": verse,
-        "Figure": figure,
-        "Situation": situation,
-        "C": C,
-        "H": H,
-        "F": F,
-        "G": G,
-        "Score": score_from_A(A),
-        "Label": label_from_score(score_from_A(A)),
-        "Ref": ref,
-        "Saved": datetime.today().strftime("%Y-%m-%d")
-    }
-    key = f"profile_{profile_name}"
-    if key in st.session_state:
-        st.session_state[key]["scenarios"].append(scenario)
-        st.success(f"Saved to profile '{profile_name}'")
-    else:
-        st.warning("Profile not found. Please create a profile first.")
+def scripture_catalog_page():
+    st.markdown('<a name="scripture-catalog"></a>', unsafe_allow_html=True)
+    st.header("📖 Scripture Catalog")
+    st.caption("Explore biblical moments and reflect on their spiritual alignment. Adjust sliders to preview scores.")
 
-# ======================= Module 3: Custom Scenario Entry =======================
 
-st.markdown('<a name="custom-scenario"></a>', unsafe_allow_html=True)
-st.header("✍️ Add a Custom Scripture Scenario")
-st.caption("Reflect on a moment from Scripture—or your own life—and assess its spiritual alignment.")
-
-with st.form("custom_scenario_form"):
-    book = st.text_input("Book", value="", placeholder="e.g. Romans")
-    verse = st.text_input("Chapter:Verse", value="", placeholder="e.g. 12:1–2")
-    figure = st.text_input("Figure or person", value="", placeholder="e.g. Paul, Me, My team")
-    situation = st.text_area("Situation or decision", height=80, placeholder="e.g. Urging transformation and renewal")
-    C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
-    H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
-    F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
-    submitted = st.form_submit_button("💾 Save Scenario")
-
-if submitted and book.strip() and verse.strip():
+    selected = st.selectbox("Choose a Scripture moment", SCRIPTURE_CATALOG, format_func=lambda x: f"{x[0]} {x[1]} — {x[2]}: {x[3]}")
+    book, verse, figure, situation, default_C, default_H, default_F, ref = selected
+
+    st.markdown("### ✍️ Rate the Spiritual Alignment")
+    C = st.slider("Christlikeness (C)", 0.0, 1.0, default_C, 0.01)
+    H = st.slider("Heart (H)", 0.0, 1.0, default_H, 0.01)
+    F = st.slider("Faithfulness (F)", 0.0, 1.0, default_F, 0.01)
+
     G = G_from_CHF(C, H, F)
     A = A_from_G(G)
+    preview_card(G, title=f"{book} {verse}")
+
+    st.markdown("### 🔍 Spiritual Alignment Summary")
+    st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
+    st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of alignment.")
+
     profile_name = st.session_state.get("selected_profile", "Me")
-    scenario = {
-        "Book": book.strip(),
-        "Verse": verse.strip(),
-        "Figure": figure.strip(),
-        "Situation": situation.strip(),
-        "C": C,
-        "H": H,
-        "F": F,
-        "G": G,
-        "Score": score_from_A(A),
-        "Label": label_from_score(score_from_A(A)),
-        "Ref": f"{book.strip()} {verse.strip()}",
-        "Saved": datetime.today().strftime("%Y-%m-%d")
-    }
-    key = f"profile_{profile_name}"
-    if key in st.session_state:
-        st.session_state[key]["scenarios"].append(scenario)
-        st.success(f"Custom scenario saved to profile '{profile_name}'")
-        preview_card(G, title=f"{book.strip()} {verse.strip()}")
-        st.markdown("### 🔍 Spiritual Alignment Summary")
-        st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
-        st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of alignment.")
-    else:
-        st.warning("Profile not found. Please create a profile first.")
+    if st.button("💾 Save This Scenario"):
+        scenario = {
+            "Book": book,
+            "Verse": verse,
+            "Figure": figure,
+            "Situation": situation,
+            "C": C,
+            "H": H,
+            "F": F,
+            "G": G,
+            "Score": score_from_A(A),
+            "Label": label_from_score(score_from_A(A)),
+            "Ref": ref,
+            "Saved": datetime.today().strftime("%Y-%m-%d")
+        }
+        key = f"profile_{profile_name}"
+        if key in st.session_state:
+            st.session_state[key]["scenarios"].append(scenario)
+            save_entry(profile_name, "scenarios", scenario)
+            st.success(f"Saved to profile '{profile_name}'")
+        else:
+            st.warning("Profile not found. Please create a profile first.")
 
-# ======================= Module 4: Instant Score Calculator & Saved Scenarios =======================
+# ======================= Module 3: Custom Scenario Entry =======================
 
-st.markdown('<a name="instant-calculator"></a>', unsafe_allow_html=True)
-st.header("⚡ Instant Score Calculator")
-st.caption("Thinking about a decision? Use this tool to reflect on how closely it aligns with God’s character. Move each slider based on your sense of the moment’s spiritual integrity:")
+def custom_scenario_page():
+    st.markdown('<a name="custom-scenario"></a>', unsafe_allow_html=True)
+    st.header("✍️ Add a Custom Scripture Scenario")
+    st.caption("Reflect on a moment from Scripture—or your own life—and assess its spiritual alignment.")
+
+    with st.form("custom_scenario_form"):
+        book = st.text_input("Book", value="", placeholder="e.g. Romans")
+        verse = st.text_input("Chapter:Verse", value="", placeholder="e.g. 12:1–2")
+        figure = st.text_input("Figure or person", value="", placeholder="e.g. Paul, Me, My team")
+        situation = st.text_area("Situation or decision", height=80, placeholder="e.g. Urging transformation and renewal")
+        C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
+        H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
+        F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
+        submitted = st.form_submit_button("💾 Save Scenario")
+
+    if submitted and book.strip() and verse.strip():
+        G = G_from_CHF(C, H, F)
+        A = A_from_G(G)
+        profile_name = st.session_state.get("selected_profile", "Me")
+        scenario = {
+            "Book": book.strip(),
+            "Verse": verse.strip(),
+            "Figure": figure.strip(),
+            "Situation": situation.strip(),
+            "C": C,
+            "H": H,
+            "F": F,
+            "G": G,
+            "Score": score_from_A(A),
+            "Label": label_from_score(score_from_A(A)),
+            "Ref": f"{book.strip()} {verse.strip()}",
+            "Saved": datetime.today().strftime("%Y-%m-%d")
+        }
+        key = f"profile_{profile_name}"
+        if key in st.session_state:
+            st.session_state[key]["scenarios"].append(scenario)
+            save_entry(profile_name, "scenarios", scenario)
+            st.success(f"Custom scenario saved to profile '{profile_name}'")
+            preview_card(G, title=f"{book.strip()} {verse.strip()}")
+            st.markdown("### 🔍 Spiritual Alignment Summary")
+            st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
+            st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of alignment.")
+        else:
+            st.warning("Profile not found. Please create a profile first.")
 
-st.markdown("""
-- **Christlikeness (C)**: Does this decision reflect the humility, love, and truth of Jesus?  
-  _Would Christ make this choice in your place?_
-- **Heart (H)**: Is your motive pure, generous, and surrendered?  
-  _Are you acting from love, or from fear, pride, or self-interest?_
-- **Faithfulness (F)**: Does this action honor God’s Word and your spiritual commitments?  
-  _Are you walking in obedience, even when it’s costly?_
-""")
-
-# Live sliders with unique keys
-C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01, key="instant_C_slider")
-H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01, key="instant_H_slider")
-F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01, key="instant_F_slider")
-
-# Score logic
-G = G_from_CHF(C, H, F)
-A = A_from_G(G)
-score = score_from_A(A)
-label = label_from_score(score)
-score_display = score * 10
-
-# Enhanced score preview
-st.markdown("### 🔍 Spiritual Alignment Summary")
-st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this decision aligns with God’s character. A score near 1.00 suggests strong spiritual integrity.")
-st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of alignment. Positive values show movement toward Christlike living; negative values suggest drift or misalignment.")
-preview_card(G, title="Instant Score")
-
-# Divider
-st.markdown("---")
-st.markdown('<a name="saved-scenarios"></a>', unsafe_allow_html=True)
-st.header("📂 Saved Scenarios")
-st.caption("Review your saved reflections and spiritual scores.")
-
-profile_name = st.session_state.get("selected_profile", "Me")
-key = f"profile_{profile_name}"
-if key in st.session_state and st.session_state[key]["scenarios"]:
-    for i, scenario in enumerate(reversed(st.session_state[key]["scenarios"])):
-        with st.expander(f"{scenario['Book']} {scenario['Verse']} — {scenario['Figure']}: {scenario['Situation']}"):
-            st.write(f"**Saved:** {scenario['Saved']}")
-            st.write(f"**C:** `{scenario['C']}` · **H:** `{scenario['H']}` · **F:** `{scenario['F']}`")
-            st.write(f"**G (God Alignment Score):** `{scenario['G']}` — Measures how closely this moment reflects God’s character.")
-            st.write(f"**Score:** `{scenario['Score']}` — Overall spiritual integrity based on Christlikeness, Heart, and Faithfulness.")
-            st.markdown(f"{chip_html(scenario['Label'])}", unsafe_allow_html=True)
-            st.markdown(bar_html(scenario['G'], "G Alignment"), unsafe_allow_html=True)
-            st.markdown(bar_html(scenario['Score'] / 10, "Score", "#10b981" if "Aligned" in scenario['Label'] else "#f59e0b" if "Mixed" in scenario['Label'] else "#ef4444"), unsafe_allow_html=True)
-else:
-    st.info("No scenarios saved yet. Use the Scripture Catalog or Custom Scenario to begin.")
+# ======================= Module 4: Instant Score Calculator & Saved Scenarios =======================
 
-# ======================= Module 5: Life Assessment & Growth Tracker =======================
+def instant_calculator_page():
+    st.markdown('<a name="instant-calculator"></a>', unsafe_allow_html=True)
+    st.header("⚡ Instant Score Calculator")
+    st.caption("Thinking about a decision? Use this tool to reflect on how closely it aligns with God’s character. Move each slider based on your sense of the moment’s spiritual integrity:")
+
+    st.markdown("""
+    - **Christlikeness (C)**: Does this decision reflect the humility, love, and truth of Jesus?  
+      _Would Christ make this choice in your place?_
+    - **Heart (H)**: Is your motive pure, generous, and surrendered?  
+      _Are you acting from love, or from fear, pride, or self-interest?_
+    - **Faithfulness (F)**: Does this action honor God’s Word and your spiritual commitments?  
+      _Are you walking in obedience, even when it’s costly?_
+    """)
 
-st.markdown('<a name="life-assessment"></a>', unsafe_allow_html=True)
-st.header("🧭 Life Assessment & Growth Tracker")
-st.caption("Reflect on your own choices and spiritual habits. Use the sliders to assess alignment with God.")
+    # Live sliders with unique keys
+    C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01, key="instant_C_slider")
+    H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01, key="instant_H_slider")
+    F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01, key="instant_F_slider")
 
-st.markdown("""
-- **Christlikeness (C)**: Are your recent decisions marked by humility, love, and truth?  
-- **Heart (H)**: Are you acting from a place of surrender, generosity, and spiritual clarity?  
-- **Faithfulness (F)**: Are you walking in obedience to God’s Word and your calling?
-""")
-
-with st.form("life_assessment_form"):
-    C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
-    H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
-    F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
-    submitted = st.form_submit_button("💾 Save Life Assessment")
-
-if submitted:
+    # Score logic
     G = G_from_CHF(C, H, F)
     A = A_from_G(G)
+    score = score_from_A(A)
+    label = label_from_score(score)
+    score_display = score * 10
+
+    # Enhanced score preview
+    st.markdown("### 🔍 Spiritual Alignment Summary")
+    st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this decision aligns with God’s character. A score near 1.00 suggests strong spiritual integrity.")
+    st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of alignment. Positive values show movement toward Christlike living; negative values suggest drift or misalignment.")
+    preview_card(G, title="Instant Score")
+
+    # Divider
+    st.markdown("---")
+    st.markdown('<a name="saved-scenarios"></a>', unsafe_allow_html=True)
+    st.header("📂 Saved Scenarios")
+    st.caption("Review your saved reflections and spiritual scores.")
+
     profile_name = st.session_state.get("selected_profile", "Me")
-    assessment = {
-        "Type": "Life Assessment",
-        "C": C,
-        "H": H,
-        "F": F,
-        "G": G,
-        "Score": score_from_A(A),
-        "Label": label_from_score(score_from_A(A)),
-        "Saved": datetime.today().strftime("%Y-%m-%d")
-    }
     key = f"profile_{profile_name}"
-    if key in st.session_state:
-        st.session_state[key]["assessments"].append(assessment)
-        st.success(f"Life assessment saved to profile '{profile_name}'")
-        preview_card(G, title="Life Assessment")
-        st.markdown("### 🔍 Spiritual Alignment Summary")
-        st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely your choices align with God’s character.")
-        st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of your spiritual alignment.")
+    if key in st.session_state and st.session_state[key]["scenarios"]:
+        for i, scenario in enumerate(reversed(st.session_state[key]["scenarios"])):
+            with st.expander(f"{scenario['Book']} {scenario['Verse']} — {scenario['Figure']}: {scenario['Situation']}"):
+                st.write(f"**Saved:** {scenario['Saved']}")
+                st.write(f"**C:** `{scenario['C']}` · **H:** `{scenario['H']}` · **F:** `{scenario['F']}`")
+                st.write(f"**G (God Alignment Score):** `{scenario['G']}` — Measures how closely this moment reflects God’s character.")
+                st.write(f"**Score:** `{scenario['Score']}` — Overall spiritual integrity based on Christlikeness, Heart, and Faithfulness.")
+                st.markdown(f"{chip_html(scenario['Label'])}", unsafe_allow_html=True)
+                st.markdown(bar_html(scenario['G'], "G Alignment"), unsafe_allow_html=True)
+                st.markdown(bar_html(scenario['Score'] / 10, "Score", "#10b981" if "Aligned" in scenario['Label'] else "#f59e0b" if "Mixed" in scenario['Label'] else "#ef4444"), unsafe_allow_html=True)
     else:
-        st.warning("Profile not found. Please create a profile first.")
+        st.info("No scenarios saved yet. Use the Scripture Catalog or Custom Scenario to begin.")
 
-# ======================= Module 6: Progress Viewer & Greatest Commands =======================
+# ======================= Module 5: Life Assessment & Growth Tracker =======================
 
-st.markdown('<a name="progress-viewer"></a>', unsafe_allow_html=True)
-st.header("📈 Progress Viewer")
-st.caption("Review your saved life assessments and reflect on your spiritual growth over time.")
-
-profile_name = st.session_state.get("selected_profile", "Me")
-key = f"profile_{profile_name}"
-if key in st.session_state and st.session_state[key]["assessments"]:
-    for i, assessment in enumerate(reversed(st.session_state[key]["assessments"])):
-        with st.expander(f"🧭 Life Assessment — {assessment['Saved']}"):
-            st.write(f"**C:** `{assessment['C']}` · **H:** `{assessment['H']}` · **F:** `{assessment['F']}`")
-            st.write(f"**G (God Alignment Score):** `{assessment['G']}` — Measures how closely your choices reflect God’s character.")
-            st.write(f"**Score:** `{assessment['Score']}` — Overall spiritual integrity.")
-            st.markdown(f"{chip_html(assessment['Label'])}", unsafe_allow_html=True)
-            st.markdown(bar_html(assessment['G'], "G Alignment"), unsafe_allow_html=True)
-            st.markdown(bar_html(assessment['Score'] / 10, "Score", "#10b981" if "Aligned" in assessment['Label'] else "#f59e0b" if "Mixed" in assessment['Label'] else "#ef4444"), unsafe_allow_html=True)
-else:
-    st.info("No life assessments saved yet. Use the Life Assessment tool to begin.")
-
-# Divider
-st.markdown("---")
-st.markdown('<a name="greatest-commands"></a>', unsafe_allow_html=True)
-st.header("💖 Greatest Commands Reflection")
-st.caption("How are you loving God and loving your neighbor in this season?")
+def life_assessment_page():
+    st.markdown('<a name="life-assessment"></a>', unsafe_allow_html=True)
+    st.header("🧭 Life Assessment & Growth Tracker")
+    st.caption("Reflect on your own choices and spiritual habits. Use the sliders to assess alignment with God.")
 
-with st.form("greatest_commands_form"):
-    love_god = st.slider("Love of God", 0.0, 1.0, 0.85, 0.01)
-    love_neighbor = st.slider("Love of Neighbor", 0.0, 1.0, 0.85, 0.01)
-    submitted = st.form_submit_button("💾 Save Reflection")
+    st.markdown("""
+    - **Christlikeness (C)**: Are your recent decisions marked by humility, love, and truth?  
+    - **Heart (H)**: Are you acting from a place of surrender, generosity, and spiritual clarity?  
+    - **Faithfulness (F)**: Are you walking in obedience to God’s Word and your calling?
+    """)
 
-if submitted:
-    G = G_from_CHF(love_god, love_neighbor, 1.0)
-    A = A_from_G(G)
-    reflection = {
-        "Type": "Greatest Commands",
-        "LoveGod": love_god,
-        "LoveNeighbor": love_neighbor,
-        "G": G,
-        "Score": score_from_A(A),
-        "Label": label_from_score(score_from_A(A)),
-        "Saved": datetime.today().strftime("%Y-%m-%d")
-    }
-    if key in st.session_state:
-        st.session_state[key]["assessments"].append(reflection)
-        st.success("Reflection saved.")
-        preview_card(G, title="Greatest Commands")
-        st.markdown("### 🔍 Spiritual Alignment Summary")
-        st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how fully you’re living out love for God and neighbor.")
-        st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of your spiritual alignment.")
+    with st.form("life_assessment_form"):
+        C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
+        H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
+        F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
+        submitted = st.form_submit_button("💾 Save Life Assessment")
+
+    if submitted:
+        G = G_from_CHF(C, H, F)
+        A = A_from_G(G)
+        profile_name = st.session_state.get("selected_profile", "Me")
+        assessment = {
+            "Type": "Life Assessment",
+            "C": C,
+            "H": H,
+            "F": F,
+            "G": G,
+            "Score": score_from_A(A),
+            "Label": label_from_score(score_from_A(A)),
+            "Saved": datetime.today().strftime("%Y-%m-%d")
+        }
+        key = f"profile_{profile_name}"
+        if key in st.session_state:
+            st.session_state[key]["assessments"].append(assessment)
+            save_entry(profile_name, "assessments", assessment)
+            st.success(f"Life assessment saved to profile '{profile_name}'")
+            preview_card(G, title="Life Assessment")
+            st.markdown("### 🔍 Spiritual Alignment Summary")
+            st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely your choices align with God’s character.")
+            st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of your spiritual alignment.")
+        else:
+            st.warning("Profile not found. Please create a profile first.")
+
+# ======================= Module 6: Progress Viewer & Greatest Commands =======================
+
+def progress_viewer_page():
+    st.markdown('<a name="progress-viewer"></a>', unsafe_allow_html=True)
+    st.header("📈 Progress Viewer")
+    st.caption("Review your saved life assessments and reflect on your spiritual growth over time.")
+
+    profile_name = st.session_state.get("selected_profile", "Me")
+    key = f"profile_{profile_name}"
+    if key in st.session_state and st.session_state[key]["assessments"]:
+        for i, assessment in enumerate(reversed(st.session_state[key]["assessments"])):
+            with st.expander(f"🧭 Life Assessment — {assessment['Saved']}"):
+                st.write(f"**C:** `{assessment['C']}` · **H:** `{assessment['H']}` · **F:** `{assessment['F']}`")
+                st.write(f"**G (God Alignment Score):** `{assessment['G']}` — Measures how closely your choices reflect God’s character.")
+                st.write(f"**Score:** `{assessment['Score']}` — Overall spiritual integrity.")
+                st.markdown(f"{chip_html(assessment['Label'])}", unsafe_allow_html=True)
+                st.markdown(bar_html(assessment['G'], "G Alignment"), unsafe_allow_html=True)
+                st.markdown(bar_html(assessment['Score'] / 10, "Score", "#10b981" if "Aligned" in assessment['Label'] else "#f59e0b" if "Mixed" in assessment['Label'] else "#ef4444"), unsafe_allow_html=True)
     else:
-        st.warning("Profile not found. Please create a profile first.")
+        st.info("No life assessments saved yet. Use the Life Assessment tool to begin.")
 
-# ======================= Module 7: Closing Reflection & Footer =======================
 
-st.markdown('<a name="closing-reflection"></a>', unsafe_allow_html=True)
-st.header("🌟 Closing Reflection")
-st.caption("Pause and reflect on what you've seen, felt, and discerned.")
+def greatest_commands_page():
+    profile_name = st.session_state.get("selected_profile", "Me")
+    key = f"profile_{profile_name}"
 
-st.markdown("""
-> _“Search me, O God, and know my heart; test me and know my anxious thoughts.  
-> Point out anything in me that offends you, and lead me along the path of everlasting life.”_  
-> — Psalm 139:23–24
-""")
+    st.markdown('<a name="greatest-commands"></a>', unsafe_allow_html=True)
+    st.header("💖 Greatest Commands Reflection")
+    st.caption("How are you loving God and loving your neighbor in this season?")
 
-st.markdown("You’ve explored Scripture, reflected on your choices, and measured spiritual alignment. Let this be a moment of clarity—not just calculation. May your journey continue in love, truth, and transformation.")
+    with st.form("greatest_commands_form"):
+        love_god = st.slider("Love of God", 0.0, 1.0, 0.85, 0.01)
+        love_neighbor = st.slider("Love of Neighbor", 0.0, 1.0, 0.85, 0.01)
+        submitted = st.form_submit_button("💾 Save Reflection")
 
-st.markdown("---")
-st.markdown('<a name="footer"></a>', unsafe_allow_html=True)
-st.caption("🖤 Soverain · Spiritual Intelligence Platform")
-st.caption("Version 1.0 · Built with prayer, precision, and purpose")
+    if submitted:
+        G = G_from_CHF(love_god, love_neighbor, 1.0)
+        A = A_from_G(G)
+        reflection = {
+            "Type": "Greatest Commands",
+            "LoveGod": love_god,
+            "LoveNeighbor": love_neighbor,
+            "G": G,
+            "Score": score_from_A(A),
+            "Label": label_from_score(score_from_A(A)),
+            "Saved": datetime.today().strftime("%Y-%m-%d")
+        }
+        if key in st.session_state:
+            st.session_state[key]["assessments"].append(reflection)
+            save_entry(profile_name, "assessments", reflection)
+            st.success("Reflection saved.")
+            preview_card(G, title="Greatest Commands")
+            st.markdown("### 🔍 Spiritual Alignment Summary")
+            st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how fully you’re living out love for God and neighbor.")
+            st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Indicates the direction and intensity of your spiritual alignment.")
+        else:
+            st.warning("Profile not found. Please create a profile first.")
 
-# ======================= Module 8: Profile Dashboard =======================
+# ======================= Module 7: Closing Reflection & Footer =======================
 
-st.markdown('<a name="profile-dashboard"></a>', unsafe_allow_html=True)
-st.header("🧑 Profile Dashboard")
-st.caption("View your spiritual journey at a glance.")
-
-# Active profile and key
-profile_name = st.session_state.get("selected_profile", "Me")
-profile_key = f"profile_{profile_name}"
-profile_data = st.session_state.get(profile_key, {
-    "scenarios": [],
-    "assessments": [],
-    "reflections": [],
-    "goal": "—",
-    "last_score": "—"
-})
-
-# Extract data
-scenarios = profile_data.get("scenarios", [])
-assessments = profile_data.get("assessments", [])
-reflections = profile_data.get("reflections", [])
-
-# Summary stats
-total_scenarios = len(scenarios)
-total_assessments = len(assessments)
-total_reflections = len(reflections)
-
-all_scores = [s["Score"] for s in scenarios + assessments if "Score" in s]
-avg_score = round(sum(all_scores) / len(all_scores), 2) if all_scores else "—"
-
-all_G = [s["G"] for s in scenarios + assessments if "G" in s]
-avg_G = round(sum(all_G) / len(all_G), 3) if all_G else "—"
-
-all_A = [A_from_G(s["G"]) for s in scenarios + assessments if "G" in s]
-avg_A = round(sum(all_A) / len(all_A), 3) if all_A else "—"
-
-# Display summary
-st.markdown(f"### 👤 Profile: `{profile_name}`")
-st.write(f"**Spiritual Goal:** `{profile_data.get('goal', '—')}`")
-st.write(f"**Last Score:** `{profile_data.get('last_score', '—')}`")
-st.write(f"**Saved Scenarios:** `{total_scenarios}`")
-st.write(f"**Life Assessments:** `{total_assessments}`")
-st.write(f"**Reflections:** `{total_reflections}`")
-st.write(f"**Average Score:** `{avg_score}`")
-st.write(f"**Average G (God Alignment):** `{avg_G}`")
-st.write(f"**Average A (Spiritual Vector):** `{avg_A}`")
-
-# Visual preview
-if isinstance(avg_G, float):
-    preview_card(avg_G, title="Profile Alignment")
-
-# Quick links
-st.markdown("### 🔗 Quick Navigation")
-st.markdown("""
-- [📖 Scripture Catalog](#scripture-catalog)  
-- [✍️ Add Custom Scenario](#custom-scenario)  
-- [⚡ Instant Calculator](#instant-calculator)  
-- [🧭 Life Assessment](#life-assessment)  
-- [📈 Progress Viewer](#progress-viewer)  
-- [✝️ Greatest Commands](#greatest-commands)  
-- [🌟 Closing Reflection](#closing-reflection)
-""", unsafe_allow_html=True)
+def closing_reflection_page():
+    st.markdown('<a name="closing-reflection"></a>', unsafe_allow_html=True)
+    st.header("🌟 Closing Reflection")
+    st.caption("Pause and reflect on what you've seen, felt, and discerned.")
 
-# Optional: Recent reflections
-if reflections:
-    st.markdown("### 📝 Recent Reflections")
-    for r in reversed(reflections[-3:]):
-        st.markdown(f"- *{r['Saved']}*: {r['Text'][:80]}{'...' if len(r['Text']) > 80 else ''}")
+    st.markdown("""
+    > _“Search me, O God, and know my heart; test me and know my anxious thoughts.  
+    > Point out anything in me that offends you, and lead me along the path of everlasting life.”_  
+    > — Psalm 139:23–24
+    """)
 
-# ======================= Module 9: Journaling & Reflection =======================
+    st.markdown("You’ve explored Scripture, reflected on your choices, and measured spiritual alignment. Let this be a moment of clarity—not just calculation. May your journey continue in love, truth, and transformation.")
+
+# ======================= Module 8: Profile Dashboard =======================
+
+def dashboard_stats(profile_data):
+    # Summary stats for one profile version (cached by profile_cached)
+    scenarios = profile_data.get("scenarios", [])
+    assessments = profile_data.get("assessments", [])
+    reflections = profile_data.get("reflections", [])
+
+    all_scores = [s["Score"] for s in scenarios + assessments if "Score" in s]
+    all_G = [s["G"] for s in scenarios + assessments if "G" in s]
+    all_A = [A_from_G(G) for G in all_G]
+    return {
+        "goal": profile_data.get("goal", "—"),
+        "scenarios": len(scenarios),
+        "assessments": len(assessments),
+        "reflections": len(reflections),
+        "avg_score": round(sum(all_scores) / len(all_scores), 2) if all_scores else "—",
+        "avg_G": round(sum(all_G) / len(all_G), 3) if all_G else "—",
+        "avg_A": round(sum(all_A) / len(all_A), 3) if all_A else "—",
+        "recent": [(r["Saved"], snippet_of(r)) for r in reversed(reflections[-3:])],
+    }
 
-st.markdown('<a name="journaling-reflection"></a>', unsafe_allow_html=True)
-st.header("📝 Journaling & Reflection")
-st.caption("Capture spiritual insights, moments of clarity, or personal prayers.")
 
-with st.form("journal_entry_form"):
-    entry_text = st.text_area("Write your reflection", height=160, placeholder="What is God showing you today?")
-    tags = st.text_input("Tags (optional)", placeholder="e.g. obedience, forgiveness, Psalm 23")
-    link_to = st.selectbox("Link to:", ["None", "Last Scenario", "Last Assessment"])
-    submitted = st.form_submit_button("💾 Save Reflection")
+def profile_dashboard_page():
+    st.markdown('<a name="profile-dashboard"></a>', unsafe_allow_html=True)
+    st.header("🧑 Profile Dashboard")
+    st.caption("View your spiritual journey at a glance.")
 
-if submitted and entry_text.strip():
+    # Active profile
     profile_name = st.session_state.get("selected_profile", "Me")
-    profile_key = f"profile_{profile_name}"
-    linked_score = None
-    linked_G = None
-
-    # Link to last scenario or assessment if selected
-    if link_to == "Last Scenario" and st.session_state[profile_key]["scenarios"]:
-        last = st.session_state[profile_key]["scenarios"][-1]
-        linked_score = last["Score"]
-        linked_G = last["G"]
-    elif link_to == "Last Assessment" and st.session_state[profile_key]["assessments"]:
-        last = st.session_state[profile_key]["assessments"][-1]
-        linked_score = last["Score"]
-        linked_G = last["G"]
-
-    reflection = {
-        "Text": entry_text.strip(),
-        "Tags": tags.strip(),
-        "LinkedTo": link_to,
-        "Score": linked_score,
-        "G": linked_G,
-        "Saved": datetime.today().strftime("%Y-%m-%d")
-    }
+    stats = profile_cached("dashboard", profile_name, None, dashboard_stats)
+    avg_G = stats["avg_G"]
+
+    # Display summary
+    st.markdown(f"### 👤 Profile: `{profile_name}`")
+    st.write(f"**Spiritual Goal:** `{stats['goal']}`")
+    last_score = st.session_state.get(f"profile_{profile_name}", {}).get("last_score", "—")  # never stored
+    st.write(f"**Last Score:** `{last_score}`")
+    st.write(f"**Saved Scenarios:** `{stats['scenarios']}`")
+    st.write(f"**Life Assessments:** `{stats['assessments']}`")
+    st.write(f"**Reflections:** `{stats['reflections']}`")
+    st.write(f"**Average Score:** `{stats['avg_score']}`")
+    st.write(f"**Average G (God Alignment):** `{avg_G}`")
+    st.write(f"**Average A (Spiritual Vector):** `{stats['avg_A']}`")
+
+    # Visual preview
+    if isinstance(avg_G, float):
+        preview_card(avg_G, title="Profile Alignment")
+
+    # Quick links
+    st.markdown("### 🔗 Quick Navigation")
+    for page in ("scripture", "custom", "instant", "assessment", "progress", "greatest", "closing"):
+        st.page_link(PAGES[page])
+
+    # Optional: Recent reflections
+    if stats["recent"]:
+        st.markdown("### 📝 Recent Reflections")
+        for saved, snippet in stats["recent"]:
+            st.markdown(f"- *{saved}*: {snippet}")
 
-    st.session_state[profile_key]["reflections"].append(reflection)
-    st.success("Reflection saved.")
+# ======================= Module 9: Journaling & Reflection =======================
 
-    # Optional preview
-    if linked_G is not None:
-        preview_card(linked_G, title="Linked Alignment")
-        st.markdown("### 🔍 Spiritual Alignment Summary")
-        st.write(f"**G (God Alignment Score):** `{linked_G:.3f}` — Reflects the alignment of the linked moment.")
-        st.write(f"**A (Spiritual Vector):** `{A_from_G(linked_G):.3f}` — Direction and intensity of spiritual alignment.")
+def journaling_page():
+    st.markdown('<a name="journaling-reflection"></a>', unsafe_allow_html=True)
+    st.header("📝 Journaling & Reflection")
+    st.caption("Capture spiritual insights, moments of clarity, or personal prayers.")
+
+    with st.form("journal_entry_form"):
+        entry_text = st.text_area("Write your reflection", height=160, placeholder="What is God showing you today?")
+        tags = st.text_input("Tags (optional)", placeholder="e.g. obedience, forgiveness, Psalm 23")
+        link_to = st.selectbox("Link to:", ["None", "Last Scenario", "Last Assessment"])
+        submitted = st.form_submit_button("💾 Save Reflection")
+
+    if submitted and entry_text.strip():
+        profile_name = st.session_state.get("selected_profile", "Me")
+        profile_key = f"profile_{profile_name}"
+        linked_score = None
+        linked_G = None
+
+        # Link to last scenario or assessment if selected
+        if link_to == "Last Scenario" and st.session_state[profile_key]["scenarios"]:
+            last = st.session_state[profile_key]["scenarios"][-1]
+            linked_score = last["Score"]
+            linked_G = last["G"]
+        elif link_to == "Last Assessment" and st.session_state[profile_key]["assessments"]:
+            last = st.session_state[profile_key]["assessments"][-1]
+            linked_score = last["Score"]
+            linked_G = last["G"]
+
+        reflection = {
+            "Text": entry_text.strip(),
+            "Tags": tags.strip(),
+            "LinkedTo": link_to,
+            "Score": linked_score,
+            "G": linked_G,
+            "Saved": datetime.today().strftime("%Y-%m-%d")
+        }
+
+        # The session keeps the snippet; the full text is read back when an entry is opened
+        entry_id = save_entry(profile_name, "reflections", reflection)
+        st.session_state[profile_key]["reflections"].append(compact(reflection, entry_id))
+        st.success("Reflection saved.")
+        if canonical_tags(reflection["Tags"]):
+            st.caption("Tagged: " + " ".join(f"`#{t}`" for t in canonical_tags(reflection["Tags"])))
+
+        # Optional preview
+        if linked_G is not None:
+            preview_card(linked_G, title="Linked Alignment")
+            st.markdown("### 🔍 Spiritual Alignment Summary")
+            st.write(f"**G (God Alignment Score):** `{linked_G:.3f}` — Reflects the alignment of the linked moment.")
+            st.write(f"**A (Spiritual Vector):** `{A_from_G(linked_G):.3f}` — Direction and intensity of spiritual alignment.")
 
 # ======================= Module 10: Guided Onboarding Flow =======================
 
-st.markdown('<a name="guided-onboarding"></a>', unsafe_allow_html=True)
+def onboarding_page():
+    st.markdown('<a name="guided-onboarding"></a>', unsafe_allow_html=True)
 
-# 🌅 Welcome message at the top
-st.header("🌅 Welcome to Soverain")
-st.markdown("""
-> _“The unfolding of your words gives light; it gives understanding to the simple.”_  
-> — Psalm 119:130
+    # 🌅 Welcome message at the top
+    st.header("🌅 Welcome to Soverain")
+    st.markdown("""
+    > _“The unfolding of your words gives light; it gives understanding to the simple.”_  
+    > — Psalm 119:130
 
-*Soverain* is a spiritual intelligence platform that helps you reflect on decisions, Scripture, and life through the lens of Christlikeness, Heart, and Faithfulness.
+    *Soverain* is a spiritual intelligence platform that helps you reflect on decisions, Scripture, and life through the lens of Christlikeness, Heart, and Faithfulness.
 
-Your spiritual alignment is measured using:
-- **C (Christlikeness)**: Does this reflect the humility, love, and truth of Jesus?
-- **H (Heart)**: Is your motive pure, generous, and surrendered?
-- **F (Faithfulness)**: Does this honor God’s Word and your spiritual commitments?
+    Your spiritual alignment is measured using:
+    - **C (Christlikeness)**: Does this reflect the humility, love, and truth of Jesus?
+    - **H (Heart)**: Is your motive pure, generous, and surrendered?
+    - **F (Faithfulness)**: Does this honor God’s Word and your spiritual commitments?
 
-These form your **G (God Alignment Score)** and **A (Spiritual Vector)**—a snapshot of how closely your choices align with God’s character.
-""")
+    These form your **G (God Alignment Score)** and **A (Spiritual Vector)**—a snapshot of how closely your choices align with God’s character.
+    """)
 
-# Onboarding logic
-if not st.session_state.get("onboarded", False):
-    st.markdown("### ✍️ Let’s Try It Together")
-    st.markdown("Rate a recent decision or moment:")
+    # Onboarding logic
+    if not st.session_state.get("onboarded", False):
+        st.markdown("### ✍️ Let’s Try It Together")
+        st.markdown("Rate a recent decision or moment:")
 
-    C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
-    H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
-    F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
+        C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
+        H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
+        F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
 
-    G = G_from_CHF(C, H, F)
-    A = A_from_G(G)
-    score = score_from_A(A)
+        G = G_from_CHF(C, H, F)
+        A = A_from_G(G)
+        score = score_from_A(A)
 
-    preview_card(G, title="Your First Score")
-    st.markdown("### 🔍 Spiritual Alignment Summary")
-    st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
-    st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Direction and intensity of alignment.")
+        preview_card(G, title="Your First Score")
+        st.markdown("### 🔍 Spiritual Alignment Summary")
+        st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
+        st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Direction and intensity of alignment.")
 
-    if st.button("✅ Finish Onboarding"):
-        st.session_state["onboarded"] = True
-        st.success("Welcome aboard! You’re now ready to explore Soverain.")
-        st.rerun()
+        if st.button("✅ Finish Onboarding"):
+            st.session_state["onboarded"] = True
+            st.success("Welcome aboard! You’re now ready to explore Soverain.")
+            st.rerun()
 
-else:
-    st.markdown("✅ You’ve completed onboarding. Use the navigation sidebar to explore Scripture, add scenarios, or reflect on your life journey.")
+    else:
+        st.markdown("✅ You’ve completed onboarding. Use the navigation sidebar to explore Scripture, add scenarios, or reflect on your life journey.")
 
 # ======================= Module 11: Scripture Expansion & Catalog Editor =======================
 
-st.markdown('<a name="scripture-editor"></a>', unsafe_allow_html=True)
-st.header("📖 Scripture Catalog Editor")
-st.caption("View, edit, or expand the biblical moments used in spiritual reflection.")
-
-# Initialize catalog if missing
-if "scripture_catalog" not in st.session_state:
-    st.session_state["scripture_catalog"] = [
-        ("Genesis", "22:9–12", "Abraham", "Offer Isaac in obedience", 0.95, 0.95, 0.95, "Genesis 22:9–12"),
-        ("Exodus", "3:4", "Moses", "Respond to God's call at the burning bush", 0.90, 0.90, 0.90, "Exodus 3:4"),
-        ("Matthew", "5:1–12", "Jesus", "Teach the Beatitudes", 1.00, 1.00, 1.00, "Matthew 5:1–12"),
-        ("Luke", "15:20", "Father", "Forgive the prodigal son", 0.95, 0.95, 0.95, "Luke 15:20"),
-        ("John", "13:5", "Jesus", "Wash the disciples’ feet", 1.00, 1.00, 1.00, "John 13:5"),
-        ("Acts", "2:42–47", "Early Church", "Live in unity and generosity", 0.95, 0.95, 0.95, "Acts 2:42–47"),
-    ]
-
-# Display current catalog
-st.markdown("### 📂 Current Entries")
-for i, entry in enumerate(st.session_state["scripture_catalog"]):
-    book, verse, figure, situation, C, H, F, ref = entry
-    st.markdown(f"- **{book} {verse}** — {figure}: *{situation}* (C: `{C}`, H: `{H}`, F: `{F}`)")
-
-# Add new entry
-st.markdown("---")
-st.markdown("### ➕ Add New Scripture Entry")
-
-with st.form("add_scripture_form"):
-    book = st.text_input("Book", placeholder="e.g. Romans")
-    verse = st.text_input("Chapter:Verse", placeholder="e.g. 12:1–2")
-    figure = st.text_input("Figure or person", placeholder="e.g. Paul")
-    situation = st.text_area("Situation or decision", height=80, placeholder="e.g. Urging transformation and renewal")
-    C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
-    H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
-    F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
-    submitted = st.form_submit_button("💾 Add to Catalog")
-
-if submitted and book.strip() and verse.strip():
-    new_entry = (book.strip(), verse.strip(), figure.strip(), situation.strip(), C, H, F, f"{book.strip()} {verse.strip()}")
-    st.session_state["scripture_catalog"].append(new_entry)
-    st.success(f"Added {book.strip()} {verse.strip()} to Scripture Catalog.")
+def catalog_editor_page():
+    st.markdown('<a name="scripture-editor"></a>', unsafe_allow_html=True)
+    st.header("📖 Scripture Catalog Editor")
+    st.caption("View, edit, or expand the biblical moments used in spiritual reflection.")
 
-# ======================= Module 12: Discipleship Pathways =======================
+    # Initialize catalog if missing
+    if "scripture_catalog" not in st.session_state:
+        st.session_state["scripture_catalog"] = list(SCRIPTURE_CATALOG) + catalog_additions(connect())
 
-st.markdown('<a name="discipleship-pathways"></a>', unsafe_allow_html=True)
-st.header("🧭 Discipleship Pathways")
-st.caption("Choose a spiritual growth track and reflect on curated Scripture moments.")
-
-# Define pathways
-PATHWAYS = {
-    "Obedience": [
-        ("Genesis", "22:9–12", "Abraham", "Offer Isaac in obedience", 0.95, 0.95, 0.95),
-        ("Matthew", "4:19", "Jesus", "Call the disciples to follow", 0.90, 0.90, 0.90),
-    ],
-    "Love": [
-        ("Luke", "15:20", "Father", "Forgive the prodigal son", 0.95, 0.95, 0.95),
-        ("John", "13:5", "Jesus", "Wash the disciples’ feet", 1.00, 1.00, 1.00),
-    ],
-    "Wisdom": [
-        ("Proverbs", "3:5–6", "Solomon", "Trust in the Lord", 0.90, 0.90, 0.90),
-        ("James", "1:5", "James", "Ask God for wisdom", 0.90, 0.90, 0.90),
-    ]
-}
+    # Display current catalog
+    st.markdown("### 📂 Current Entries")
+    for i, entry in enumerate(st.session_state["scripture_catalog"]):
+        book, verse, figure, situation, C, H, F, ref = entry
+        st.markdown(f"- **{book} {verse}** — {figure}: *{situation}* (C: `{C}`, H: `{H}`, F: `{F}`)")
+
+    # Add new entry
+    st.markdown("---")
+    st.markdown("### ➕ Add New Scripture Entry")
+
+    with st.form("add_scripture_form"):
+        book = st.text_input("Book", placeholder="e.g. Romans")
+        verse = st.text_input("Chapter:Verse", placeholder="e.g. 12:1–2")
+        figure = st.text_input("Figure or person", placeholder="e.g. Paul")
+        situation = st.text_area("Situation or decision", height=80, placeholder="e.g. Urging transformation and renewal")
+        C = st.slider("Christlikeness (C)", 0.0, 1.0, 0.85, 0.01)
+        H = st.slider("Heart (H)", 0.0, 1.0, 0.85, 0.01)
+        F = st.slider("Faithfulness (F)", 0.0, 1.0, 0.85, 0.01)
+        submitted = st.form_submit_button("💾 Add to Catalog")
+
+    if submitted and book.strip() and verse.strip():
+        new_entry = (book.strip(), verse.strip(), figure.strip(), situation.strip(), C, H, F, f"{book.strip()} {verse.strip()}")
+        st.session_state["scripture_catalog"].append(new_entry)
+        save_catalog_entry(new_entry)
+        st.success(f"Added {book.strip()} {verse.strip()} to Scripture Catalog.")
 
-# Select pathway
-selected_pathway = st.selectbox("Choose a pathway", list(PATHWAYS.keys()))
-entries = PATHWAYS[selected_pathway]
+# ======================= Module 12: Discipleship Pathways =======================
+
+def pathways_page():
+    st.markdown('<a name="discipleship-pathways"></a>', unsafe_allow_html=True)
+    st.header("🧭 Discipleship Pathways")
+    st.caption("Choose a spiritual growth track and reflect on curated Scripture moments.")
 
-# Display entries
-for i, (book, verse, figure, situation, C_default, H_default, F_default) in enumerate(entries):
-    with st.expander(f"{book} {verse} — {figure}: {situation}"):
-        C = st.slider(f"Christlikeness (C) — {verse}", 0.0, 1.0, C_default, 0.01, key=f"C_{i}")
-        H = st.slider(f"Heart (H) — {verse}", 0.0, 1.0, H_default, 0.01, key=f"H_{i}")
-        F = st.slider(f"Faithfulness (F) — {verse}", 0.0, 1.0, F_default, 0.01, key=f"F_{i}")
+    # Pathways are loaded from pathways/*.csv on first use
+    pathway_names = list_pathways()
+    steps = None
+    if not pathway_names:
+        st.info("No pathways found. Add a CSV file to the pathways folder to begin.")
+    else:
+        selected_pathway = st.selectbox("Choose a pathway", pathway_names)
+        try:
+            steps = load_pathway(selected_pathway)
+        except PathwayError as e:
+            # Hand-edited files: report a broken one instead of failing the page
+            st.info(f"The pathway file `{selected_pathway}.csv` {e}. Fix the file or choose another pathway.")
+    if steps:
+
+        profile_name = st.session_state.get("selected_profile", "Me")
+        key = f"profile_{profile_name}"
+        progress = st.session_state[key].setdefault("pathways", {})
+        step = min(progress.get(selected_pathway, 0), len(steps) - 1)
+
+        # Stepper: only the current step builds widgets
+        st.markdown(bar_html(progress.get(selected_pathway, 0) / len(steps), f"Step {step + 1} of {len(steps)}"), unsafe_allow_html=True)
+        book, verse, figure, situation, C_default, H_default, F_default = steps[step]
+        st.markdown(f"### {book} {verse} — {figure}: {situation}")
+        widget_key = f"pathway_{selected_pathway}_{step}"
+        C = st.slider(f"Christlikeness (C) — {verse}", 0.0, 1.0, C_default, 0.01, key=f"{widget_key}_C")
+        H = st.slider(f"Heart (H) — {verse}", 0.0, 1.0, H_default, 0.01, key=f"{widget_key}_H")
+        F = st.slider(f"Faithfulness (F) — {verse}", 0.0, 1.0, F_default, 0.01, key=f"{widget_key}_F")
         G = G_from_CHF(C, H, F)
         A = A_from_G(G)
         score = score_from_A(A)
@@ -721,270 +719,533 @@ for i, (book, verse, figure, situation, C_default, H_default, F_default) in enum
         st.write(f"**G (God Alignment Score):** `{G:.3f}` — Reflects how closely this moment aligns with God’s character.")
         st.write(f"**A (Spiritual Vector):** `{A:.3f}` — Direction and intensity of alignment.")
 
-        if st.button(f"💾 Save Reflection — {verse}"):
-            profile_name = st.session_state.get("selected_profile", "Me")
-            key = f"profile_{profile_name}"
-            reflection = {
-                "Type": "Pathway Reflection",
-                "Pathway": selected_pathway,
-                "Book": book,
-                "Verse": verse,
-                "Figure": figure,
-                "Situation": situation,
-                "C": C,
-                "H": H,
-                "F": F,
-                "G": G,
-                "Score": score,
-                "Label": label_from_score(score),
-                "Saved": datetime.today().strftime("%Y-%m-%d")
-            }
-            st.session_state[key]["reflections"].append(reflection)
-            st.success(f"Reflection saved to profile '{profile_name}'")
+        def go_to_step(new_step):
+            progress[selected_pathway] = new_step
+            save_pathway_step(profile_name, selected_pathway, new_step)
+
+        col_prev, col_save, col_next = st.columns(3)
+        with col_prev:
+            if st.button("⬅️ Previous Step", key=f"{widget_key}_prev", disabled=step == 0):
+                go_to_step(step - 1)
+                st.rerun()
+        with col_save:
+            if st.button(f"💾 Save Reflection — {verse}", key=f"{widget_key}_save"):
+                reflection = {
+                    "Type": "Pathway Reflection",
+                    "Pathway": selected_pathway,
+                    "Book": book,
+                    "Verse": verse,
+                    "Figure": figure,
+                    "Situation": situation,
+                    "C": C,
+                    "H": H,
+                    "F": F,
+                    "G": G,
+                    "Score": score,
+                    "Label": label_from_score(score),
+                    "Saved": datetime.today().strftime("%Y-%m-%d")
+                }
+                st.session_state[key]["reflections"].append(reflection)
+                save_entry(profile_name, "reflections", reflection)
+                go_to_step(min(step + 1, len(steps)))
+                st.success(f"Reflection saved to profile '{profile_name}'")
+        with col_next:
+            if st.button("Next Step ➡️", key=f"{widget_key}_next", disabled=step >= len(steps) - 1):
+                go_to_step(step + 1)
+                st.rerun()
 
 # ======================= Module 13: Spiritual Scoreboard =======================
 
-import pandas as pd
-
-st.markdown('<a name="spiritual-scoreboard"></a>', unsafe_allow_html=True)
-st.header("📊 Spiritual Scoreboard")
-st.caption("Visualize your spiritual alignment over time.")
-
-# Active profile
-profile_name = st.session_state.get("selected_profile", "Me")
-profile_key = f"profile_{profile_name}"
-profile_data = st.session_state.get(profile_key, {
-    "scenarios": [],
-    "assessments": [],
-    "reflections": []
-})
-
-# Combine all scored entries
-entries = []
-for s in profile_data.get("scenarios", []):
-    entries.append({
-        "Date": s["Saved"],
-        "Type": "Scenario",
-        "Label": s["Label"],
-        "Score": s["Score"],
-        "G": s["G"]
-    })
-for a in profile_data.get("assessments", []):
-    entries.append({
-        "Date": a["Saved"],
-        "Type": "Assessment",
-        "Label": a["Label"],
-        "Score": a["Score"],
-        "G": a["G"]
-    })
-for r in profile_data.get("reflections", []):
-    if "Score" in r and "G" in r:
+def scoreboard_frame(profile_data):
+    # (entries DataFrame sorted by date, average score by type, average G), or None when
+    # nothing is scored; cached per profile version by profile_cached
+    import pandas as pd
+
+    # Combine all scored entries
+    entries = []
+    for s in profile_data.get("scenarios", []):
         entries.append({
-            "Date": r["Saved"],
-            "Type": r.get("Type", "Reflection"),
-            "Label": r.get("Label", ""),
-            "Score": r["Score"],
-            "G": r["G"]
+            "Date": s["Saved"],
+            "Type": "Scenario",
+            "Label": s["Label"],
+            "Score": s["Score"],
+            "G": s["G"]
         })
-
-# Build DataFrame
-if entries:
+    for a in profile_data.get("assessments", []):
+        entries.append({
+            "Date": a["Saved"],
+            "Type": "Assessment",
+            "Label": a["Label"],
+            "Score": a["Score"],
+            "G": a["G"]
+        })
+    for r in profile_data.get("reflections", []):
+        if "Score" in r and "G" in r:
+            entries.append({
+                "Date": r["Saved"],
+                "Type": r.get("Type", "Reflection"),
+                "Label": r.get("Label", ""),
+                "Score": r["Score"],
+                "G": r["G"]
+            })
+
+    # Build DataFrame
+    if not entries:
+        return None
     df = pd.DataFrame(entries)
     df["Date"] = pd.to_datetime(df["Date"])
     df = df.sort_values("Date")
+    return df, df.groupby("Type")["Score"].mean().round(2), round(df["G"].mean(), 3)
 
-    # Line chart
-    st.markdown("### 📈 Score Over Time")
-    st.line_chart(df.set_index("Date")["Score"])
 
-    # Breakdown by type
-    st.markdown("### 🧭 Score Breakdown by Type")
-    avg_by_type = df.groupby("Type")["Score"].mean().round(2)
-    st.bar_chart(avg_by_type)
+def scoreboard_page():
+    st.markdown('<a name="spiritual-scoreboard"></a>', unsafe_allow_html=True)
+    st.header("📊 Spiritual Scoreboard")
+    st.caption("Visualize your spiritual alignment over time.")
 
-    # Alignment preview
-    avg_G = round(df["G"].mean(), 3)
-    preview_card(avg_G, title="Average Alignment")
+    # Active profile
+    profile_name = st.session_state.get("selected_profile", "Me")
+    board = profile_cached("scoreboard", profile_name, None, scoreboard_frame)
 
-    st.markdown("### 🔍 Spiritual Alignment Summary")
-    st.write(f"**Average G (God Alignment Score):** `{avg_G}` — Reflects overall spiritual integrity across entries.")
-    st.write(f"**Average A (Spiritual Vector):** `{A_from_G(avg_G):.3f}` — Direction and intensity of alignment.")
+    if board is not None:
+        df, avg_by_type, avg_G = board
+
+        # Line chart
+        st.markdown("### 📈 Score Over Time")
+        st.line_chart(df.set_index("Date")["Score"])
+
+        # Breakdown by type
+        st.markdown("### 🧭 Score Breakdown by Type")
+        st.bar_chart(avg_by_type)
 
-else:
-    st.info("No scored entries yet. Use the Scripture Catalog, Life Assessment, or Journaling modules to begin.")
+        # Alignment preview
+        preview_card(avg_G, title="Average Alignment")
+
+        st.markdown("### 🔍 Spiritual Alignment Summary")
+        st.write(f"**Average G (God Alignment Score):** `{avg_G}` — Reflects overall spiritual integrity across entries.")
+        st.write(f"**Average A (Spiritual Vector):** `{A_from_G(avg_G):.3f}` — Direction and intensity of alignment.")
+
+    else:
+        st.info("No scored entries yet. Use the Scripture Catalog, Life Assessment, or Journaling modules to begin.")
 
 # ======================= Module 14: Spiritual Nudges & Notifications =======================
 
-from datetime import datetime, timedelta
-
-st.markdown('<a name="spiritual-nudges"></a>', unsafe_allow_html=True)
-st.header("🔔 Spiritual Nudges")
-st.caption("Gentle prompts to help you reflect, realign, and grow.")
-
-# Active profile
-profile_name = st.session_state.get("selected_profile", "Me")
-profile_key = f"profile_{profile_name}"
-profile_data = st.session_state.get(profile_key, {
-    "scenarios": [],
-    "assessments": [],
-    "reflections": []
-})
-
-# Get last activity date
-all_dates = []
-for s in profile_data["scenarios"]:
-    all_dates.append(s["Saved"])
-for a in profile_data["assessments"]:
-    all_dates.append(a["Saved"])
-for r in profile_data["reflections"]:
-    all_dates.append(r["Saved"])
-
-if all_dates:
-    last_date = max(pd.to_datetime(all_dates))
-    days_since = (datetime.today() - last_date).days
-else:
-    last_date = None
-    days_since = None
-
-# Get recent scores
-recent_scores = [e["Score"] for e in profile_data["scenarios"] + profile_data["assessments"] if "Score" in e]
-avg_score = round(sum(recent_scores[-5:]) / len(recent_scores[-5:]), 2) if recent_scores[-5:] else None
-
-# Nudges
-st.markdown("### 🧭 Your Spiritual Rhythm")
-
-if days_since is not None and days_since >= 5:
-    st.warning(f"It’s been {days_since} days since your last reflection. Consider revisiting a Scripture or journaling a moment of clarity.")
-elif days_since is not None and days_since >= 2:
-    st.info(f"{days_since} days since your last entry. A moment of quiet could bring fresh insight.")
-
-if avg_score is not None and avg_score < 6:
-    st.warning(f"Your recent average score is `{avg_score}`. You may be navigating a spiritually mixed season. Consider revisiting the **Obedience** or **Love** pathway.")
-elif avg_score is not None and avg_score >= 8:
-    st.success(f"Your recent average score is `{avg_score}`. You’re walking in strong alignment—consider journaling what’s sustaining you.")
-
-# Scripture nudge
-st.markdown("### 📖 Suggested Scripture")
-st.markdown("> _“Let us examine our ways and test them, and let us return to the Lord.”_ — Lamentations 3:40")
-
-# Action buttons
-st.markdown("### ✍️ What would you like to do next?")
-col1, col2, col3 = st.columns(3)
-with col1:
-    if st.button("📖 Open Scripture Catalog"):
-        st.markdown('<a href="#scripture-catalog">Jumping to Scripture Catalog...</a>', unsafe_allow_html=True)
-with col2:
-    if st.button("📝 Start a Journal Entry"):
-        st.markdown('<a href="#journaling-reflection">Jumping to Journaling...</a>', unsafe_allow_html=True)
-with col3:
-    if st.button("🧭 Revisit a Pathway"):
-        st.markdown('<a href="#discipleship-pathways">Jumping to Pathways...</a>', unsafe_allow_html=True)
+def nudge_inputs(conn, profile_name):
+    # (days since the last save, recent average score) for nudges_for
+    last_saved = last_activity(conn, profile_name)
+    days_since = (date.today() - date.fromisoformat(last_saved)).days if last_saved else None
+    score_trend = pillar_trends(conn, profile_name).get("Score")
+    return days_since, round(score_trend["short_mean"], 2) if score_trend else None
 
-# ======================= Module 15: Spiritual Tags & Search =======================
 
-st.markdown('<a name="spiritual-search"></a>', unsafe_allow_html=True)
-st.header("🔍 Spiritual Tags & Search")
-st.caption("Explore your spiritual journey by theme, Scripture, or score.")
-
-# Active profile
-profile_name = st.session_state.get("selected_profile", "Me")
-profile_key = f"profile_{profile_name}"
-profile_data = st.session_state.get(profile_key, {
-    "scenarios": [],
-    "assessments": [],
-    "reflections": []
-})
-
-# Combine all entries
-entries = []
-for s in profile_data["scenarios"]:
-    entries.append({**s, "Type": "Scenario"})
-for a in profile_data["assessments"]:
-    entries.append({**a, "Type": "Assessment"})
-for r in profile_data["reflections"]:
-    entries.append({**r, "Type": r.get("Type", "Reflection")})
-
-# Search inputs
-st.markdown("### 🔎 Filter Your Journey")
-search_text = st.text_input("Search by keyword, book, figure, or tag", placeholder="e.g. forgiveness, Luke, obedience")
-min_score = st.slider("Minimum Score", 0, 10, 0)
-sort_order = st.selectbox("Sort by", ["Newest", "Oldest", "Highest Score", "Lowest Score"])
-
-# Filter logic
-filtered = []
-for e in entries:
-    match_text = f"{e.get('Book','')} {e.get('Verse','')} {e.get('Figure','')} {e.get('Situation','')} {e.get('Tags','')} {e.get('Text','')}".lower()
-    if search_text.lower() in match_text and e.get("Score", 0) >= min_score:
-        filtered.append(e)
-
-# Sort logic
-if sort_order == "Newest":
-    filtered = sorted(filtered, key=lambda x: x.get("Saved", ""), reverse=True)
-elif sort_order == "Oldest":
-    filtered = sorted(filtered, key=lambda x: x.get("Saved", ""))
-elif sort_order == "Highest Score":
-    filtered = sorted(filtered, key=lambda x: x.get("Score", 0), reverse=True)
-elif sort_order == "Lowest Score":
-    filtered = sorted(filtered, key=lambda x: x.get("Score", 0))
-
-# Display results
-if filtered:
-    st.markdown(f"### 📂 {len(filtered)} Matching Entries")
-    for i, e in enumerate(filtered):
-        with st.expander(f"{e.get('Book','')} {e.get('Verse','')} — {e.get('Figure','')} ({e['Type']})"):
-            st.write(f"**Saved:** {e.get('Saved','—')}")
-            st.write(f"**Tags:** {e.get('Tags','—')}")
-            st.write(f"**Score:** `{e.get('Score','—')}` · **G:** `{e.get('G','—')}` · **Label:** {e.get('Label','—')}")
-            if "Text" in e:
-                st.markdown(f"**Reflection:** {e['Text']}")
-            preview_card(e["G"], title=f"{e.get('Book','')} {e.get('Verse','')}")
-else:
-    st.info("No matching entries found. Try adjusting your filters or search terms.")
+def nudges_page():
+    st.markdown('<a name="spiritual-nudges"></a>', unsafe_allow_html=True)
+    st.header("🔔 Spiritual Nudges")
+    st.caption("Gentle prompts to help you reflect, realign, and grow.")
 
-# ======================= Module 16: Spiritual Export & Legacy Builder =======================
+    # Active profile; last activity and recent average come from the trend tables
+    profile_name = st.session_state.get("selected_profile", "Me")
+    conn = connect()
+    days_since, avg_score = view_cache.get(
+        "nudges", profile_name, data_version(profile_name, conn), date.today(), lambda: nudge_inputs(conn, profile_name)
+    )
+
+    # Nudges
+    st.markdown("### 🧭 Your Spiritual Rhythm")
+
+    # Same rules the offline scheduler (soverain_nudges.py) applies to every profile
+    for level, message in nudges_for(days_since, avg_score):
+        getattr(st, level)(message)
+
+    # Scripture nudge
+    st.markdown("### 📖 Suggested Scripture")
+    st.markdown("> _“Let us examine our ways and test them, and let us return to the Lord.”_ — Lamentations 3:40")
+
+    # Action buttons
+    st.markdown("### ✍️ What would you like to do next?")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("📖 Open Scripture Catalog"):
+            st.switch_page(PAGES["scripture"])
+    with col2:
+        if st.button("📝 Start a Journal Entry"):
+            st.switch_page(PAGES["journal"])
+    with col3:
+        if st.button("🧭 Revisit a Pathway"):
+            st.switch_page(PAGES["pathways"])
+
+# ======================= Module 15: Spiritual Tags & Search =======================
 
-st.markdown('<a name="legacy-builder"></a>', unsafe_allow_html=True)
-st.header("📜 Spiritual Legacy Builder")
-st.caption("Curate your spiritual journey into a testimony of growth, insight, and alignment.")
-
-# Active profile
-profile_name = st.session_state.get("selected_profile", "Me")
-profile_key = f"profile_{profile_name}"
-profile_data = st.session_state.get(profile_key, {
-    "scenarios": [],
-    "assessments": [],
-    "reflections": []
-})
-
-# Filter options
-st.markdown("### 🔎 Select Entries to Include")
-entry_types = st.multiselect("Include types", ["Scenario", "Assessment", "Reflection", "Pathway Reflection"], default=["Scenario", "Assessment", "Reflection"])
-start_date = st.date_input("Start date", value=datetime.today() - timedelta(days=90))
-end_date = st.date_input("End date", value=datetime.today())
-
-# Compile entries
-entries = []
-for s in profile_data["scenarios"]:
-    if "Scenario" in entry_types and pd.to_datetime(s["Saved"]).date() >= start_date and pd.to_datetime(s["Saved"]).date() <= end_date:
+def search_entry_list(profile_data):
+    # Every entry of one profile version, labelled with its type
+    entries = []
+    for s in profile_data["scenarios"]:
         entries.append({**s, "Type": "Scenario"})
-for a in profile_data["assessments"]:
-    if "Assessment" in entry_types and pd.to_datetime(a["Saved"]).date() >= start_date and pd.to_datetime(a["Saved"]).date() <= end_date:
+    for a in profile_data["assessments"]:
         entries.append({**a, "Type": "Assessment"})
-for r in profile_data["reflections"]:
-    if r.get("Type", "Reflection") in entry_types and pd.to_datetime(r["Saved"]).date() >= start_date and pd.to_datetime(r["Saved"]).date() <= end_date:
+    for r in profile_data["reflections"]:
         entries.append({**r, "Type": r.get("Type", "Reflection")})
+    return entries
+
+
+def search_entries(conn, profile_name, entries, search_text, tag_filter, min_score, sort_order):
+    # Filter logic
+    # Journal text is matched against the word sets stored on save, not decompressed, so it
+    # matches words starting with each query word rather than any substring of the text
+    text_ids = matching_ids(conn, profile_name, search_text) or set()
+    filtered = []
+    for e in entries:
+        match_text = f"{e.get('Book','')} {e.get('Verse','')} {e.get('Figure','')} {e.get('Situation','')} {e.get('Tags','')} {e.get('Text','')}".lower()
+        if (search_text.lower() in match_text or e.get("TextId") in text_ids) and (e.get("Score") or 0) >= min_score:
+            if not tag_filter or set(tag_filter) <= set(canonical_tags(e.get("Tags"))):
+                filtered.append(e)
+
+    # Sort logic
+    if sort_order == "Newest":
+        filtered = sorted(filtered, key=lambda x: x.get("Saved", ""), reverse=True)
+    elif sort_order == "Oldest":
+        filtered = sorted(filtered, key=lambda x: x.get("Saved", ""))
+    elif sort_order == "Highest Score":
+        filtered = sorted(filtered, key=lambda x: x.get("Score") or 0, reverse=True)
+    elif sort_order == "Lowest Score":
+        filtered = sorted(filtered, key=lambda x: x.get("Score") or 0)
+    return filtered
+
+
+def search_page():
+    st.markdown('<a name="spiritual-search"></a>', unsafe_allow_html=True)
+    st.header("🔍 Spiritual Tags & Search")
+    st.caption("Explore your spiritual journey by theme, Scripture, or score.")
+
+    # Active profile
+    profile_name = st.session_state.get("selected_profile", "Me")
+
+    # Tag cloud and themes, from the tag tables updated on each save
+    conn = connect()
+    cloud, themes, all_tags = view_cache.get(
+        "tags", profile_name, data_version(profile_name, conn), None, lambda: (
+            tag_cloud(conn, profile_name),
+            low_alignment_themes(conn, profile_name),
+            [t["Tag"] for t in tag_cloud(conn, profile_name, limit=500)],
+        )
+    )
+    if cloud:
+        st.markdown("### 🏷️ Your Themes")
+        st.markdown(tag_cloud_html(cloud), unsafe_allow_html=True)
+        st.caption("Larger tags are used more often; color shows the average score of entries carrying them.")
+        if themes:
+            st.markdown("### 🔻 Themes Linked to Low Alignment")
+            for t in themes:
+                linked = f" Often tagged with {', '.join(f'`#{o}`' for o in t['Often With'])}." if t["Often With"] else ""
+                st.warning(f"`#{t['Tag']}` averages `{t['Average']}` across {t['Entries']} scored entries, against your usual `{t['Baseline']}`.{linked}")
+
+    # Search inputs
+    st.markdown("### 🔎 Filter Your Journey")
+    search_text = st.text_input(
+        "Search by keyword, book, figure, or tag", placeholder="e.g. forgiveness, Luke, obedience",
+        help="Book, verse, figure, situation and tags match any part of what you type. Journal text is "
+             "matched by word beginnings: \"forgiv\" finds \"forgiveness\", but \"ace\" does not find \"grace\".",
+    )
+    tag_filter = st.multiselect("Tagged with", all_tags)
+    min_score = st.slider("Minimum Score", 0, 10, 0)
+    sort_order = st.selectbox("Sort by", ["Newest", "Oldest", "Highest Score", "Lowest Score"])
+
+    # Search ignores the "as of" date; results are cached per filter combination
+    version = data_version(profile_name, conn)
+    entries = view_cache.get("search_entries", profile_name, version, None, lambda: search_entry_list(profile_at(profile_name, version)))
+    filtered = view_cache.get(
+        "search", profile_name, version, (search_text, tuple(sorted(tag_filter)), min_score, sort_order),
+        lambda: search_entries(conn, profile_name, entries, search_text, tag_filter, min_score, sort_order)
+    )
+
+    # Display results
+    if filtered:
+        st.markdown(f"### 📂 {len(filtered)} Matching Entries")
+        for i, e in enumerate(filtered):
+            with st.expander(f"{e.get('Book','')} {e.get('Verse','')} — {e.get('Figure','')} ({e['Type']})"):
+                st.write(f"**Saved:** {e.get('Saved','—')}")
+                st.write(f"**Tags:** {' '.join(f'`#{t}`' for t in canonical_tags(e.get('Tags'))) or '—'}")
+                st.write(f"**Score:** `{e.get('Score','—')}` · **G:** `{e.get('G','—')}` · **Label:** {e.get('Label','—')}")
+                show_reflection(e, "search_text")
+                if e.get("G") is not None:  # unlinked journal entries have no score
+                    preview_card(e["G"], title=f"{e.get('Book','')} {e.get('Verse','')}")
+    else:
+        st.info("No matching entries found. Try adjusting your filters or search terms.")
+
+# ======================= Module 16: Spiritual Export & Legacy Builder =======================
 
-# Display legacy preview
-if entries:
-    st.markdown(f"### 📖 Legacy Preview ({len(entries)} entries)")
-    for i, e in enumerate(sorted(entries, key=lambda x: x["Saved"], reverse=True)):
-        with st.expander(f"{e.get('Saved','—')} — {e['Type']}"):
-            st.write(f"**Book:** {e.get('Book','—')} · **Verse:** {e.get('Verse','—')} · **Figure:** {e.get('Figure','—')}")
-            st.write(f"**Situation:** {e.get('Situation','—')}")
-            st.write(f"**Tags:** {e.get('Tags','—')}")
-            st.write(f"**Score:** `{e.get('Score','—')}` · **G:** `{e.get('G','—')}` · **Label:** {e.get('Label','—')}")
-            if "Text" in e:
-                st.markdown(f"**Reflection:** {e['Text']}")
-            preview_card(e["G"], title=f"{e.get('Book','')} {e.get('Verse','')}")
-else:
-    st.info("No entries found for the selected filters. Try adjusting the date range or types.")
+def legacy_entries(profile_data, entry_types, start_date, end_date):
+    # The entries of the chosen types saved in the date range, newest first
+    entries = []
+    for s in profile_data["scenarios"]:
+        if "Scenario" in entry_types and start_date <= date.fromisoformat(s["Saved"]) <= end_date:
+            entries.append({**s, "Type": "Scenario"})
+    for a in profile_data["assessments"]:
+        if "Assessment" in entry_types and start_date <= date.fromisoformat(a["Saved"]) <= end_date:
+            entries.append({**a, "Type": "Assessment"})
+    for r in profile_data["reflections"]:
+        if r.get("Type", "Reflection") in entry_types and start_date <= date.fromisoformat(r["Saved"]) <= end_date:
+            entries.append({**r, "Type": r.get("Type", "Reflection")})
+    return sorted(entries, key=lambda x: x["Saved"], reverse=True)
+
+
+def legacy_builder_page():
+    st.markdown('<a name="legacy-builder"></a>', unsafe_allow_html=True)
+    st.header("📜 Spiritual Legacy Builder")
+    st.caption("Curate your spiritual journey into a testimony of growth, insight, and alignment.")
+
+    # Active profile
+    profile_name = st.session_state.get("selected_profile", "Me")
+
+    # Filter options
+    st.markdown("### 🔎 Select Entries to Include")
+    entry_types = st.multiselect("Include types", ["Scenario", "Assessment", "Reflection", "Pathway Reflection"], default=["Scenario", "Assessment", "Reflection"])
+    start_date = st.date_input("Start date", value=datetime.today() - timedelta(days=90))
+    end_date = st.date_input("End date", value=datetime.today())
+    entries = profile_cached(
+        "legacy", profile_name, (tuple(entry_types), start_date, end_date),
+        lambda data: legacy_entries(data, entry_types, start_date, end_date)
+    )
+
+    # Display legacy preview
+    if entries:
+        st.markdown(f"### 📖 Legacy Preview ({len(entries)} entries)")
+        for i, e in enumerate(entries):
+            with st.expander(f"{e.get('Saved','—')} — {e['Type']}"):
+                st.write(f"**Book:** {e.get('Book','—')} · **Verse:** {e.get('Verse','—')} · **Figure:** {e.get('Figure','—')}")
+                st.write(f"**Situation:** {e.get('Situation','—')}")
+                st.write(f"**Tags:** {' '.join(f'`#{t}`' for t in canonical_tags(e.get('Tags'))) or '—'}")
+                st.write(f"**Score:** `{e.get('Score','—')}` · **G:** `{e.get('G','—')}` · **Label:** {e.get('Label','—')}")
+                show_reflection(e, "legacy_text")
+                if e.get("G") is not None:  # unlinked journal entries have no score
+                    preview_card(e["G"], title=f"{e.get('Book','')} {e.get('Verse','')}")
+    else:
+        st.info("No entries found for the selected filters. Try adjusting the date range or types.")
+
+    # Backup & restore of the whole profile
+    st.markdown("---")
+    st.markdown("### 💾 Backup & Restore")
+    st.caption("Move a profile between sessions or servers. Restoring the same backup twice never duplicates entries.")
+    if st.button("📦 Prepare Backup"):
+        buffer = io.BytesIO()
+        export_profile(profile_name, buffer)
+        st.download_button("⬇️ Download Backup", buffer.getvalue(), file_name=f"soverain_{profile_name}.sovb", mime="application/octet-stream")
+
+    with st.form("restore_bundle_form"):
+        uploaded = st.file_uploader("Restore or merge a backup into this profile", type=["sovb"])
+        submitted = st.form_submit_button("♻️ Restore")
+
+    if submitted and uploaded is not None:
+        try:
+            result = restore_profile(uploaded, into=profile_name)
+        except BundleError as e:
+            st.session_state[f"profile_{profile_name}"] = load_profile(profile_name)  # chunks before the error were kept
+            st.warning(f"Could not restore this backup: {e}")
+        else:
+            st.session_state[f"profile_{profile_name}"] = load_profile(profile_name)
+            st.success(f"Restored {result['added']} entries into '{profile_name}' ({result['skipped']} already present).")
+
+# ======================= Module 17: Cohort Analytics =======================
+
+def cohort_analytics_page():
+    st.markdown('<a name="cohort-analytics"></a>', unsafe_allow_html=True)
+    st.header("🏛️ Cohort Analytics")
+    st.caption("See where this profile sits across everyone in your organization.")
+
+    profile_name = st.session_state.get("selected_profile", "Me")
+    conn = connect()
+    available = cohort_groups(conn)
+    if not available:
+        st.info("No organization data yet. Saved scenarios, assessments and pathway reflections will appear here.")
+        return
+
+    # Groups: all entries, one entry type, or one month
+    group_labels = {"all": "All entries"}
+    group_labels.update({g: g.split(":", 1)[1] for g in available if g != "all"})
+    by_type = [g for g in available if g.startswith("type:")]
+    by_month = sorted((g for g in available if g.startswith("month:")), reverse=True)
+    grp = st.selectbox("Compare within", ["all"] + by_type + by_month, format_func=lambda g: group_labels[g])
+
+    rows = profile_percentiles(conn, profile_name, grp)
+    st.markdown(f"### 📊 `{profile_name}` vs. Organization — {group_labels[grp]}")
+    st.table(rows)
+
+    ranked = [r for r in rows if r["Percentile"] is not None]
+    if ranked:
+        st.markdown("### 🧭 Percentile Rank")
+        for r in ranked:
+            st.markdown(bar_html(r["Percentile"] / 100, f"{r['Metric']} — {r['Percentile']:.0f}th percentile"), unsafe_allow_html=True)
+    else:
+        st.info(f"`{profile_name}` has no scored entries in this group yet, or no other profile has.")
+    st.caption("Percentiles rank this profile's average against the other profiles' averages. The median, P10 and P90 are over every entry in the organization, from quantile sketches updated on each save.")
+
+# ======================= Module 18: Pillar Trends =======================
+
+PILLAR_NAMES = {"C": "Christlikeness (C)", "H": "Heart (H)", "F": "Faithfulness (F)", "Score": "Score"}
+
+def trends_page():
+    st.markdown('<a name="pillar-trends"></a>', unsafe_allow_html=True)
+    st.header("📉 Pillar Trends")
+    st.caption("See which pillar is rising or drifting. Trends are updated on every save, so this page never re-reads your history.")
+
+    profile_name = st.session_state.get("selected_profile", "Me")
+    trends = pillar_trends(connect(), profile_name)
+    if not trends:
+        st.info("No scored entries yet. Save a scenario, assessment or pathway reflection to start your trends.")
+        return
+
+    pillars = [p for p in PILLARS if p in trends]
+    cols = st.columns(len(pillars))
+    for col, pillar in zip(cols, pillars):
+        t = trends[pillar]
+        fmt = "{:.1f}" if pillar == "Score" else "{:.2f}"
+        col.metric(PILLAR_NAMES[pillar], fmt.format(t["fast"]), fmt.format(t["fast"] - t["slow"]),
+                   help="Recent weighted average; the change is against your long-run average.")
+
+    # Shifts flagged by the change-point check, and the pillar drifting furthest below its usual level
+    st.markdown("### 🧭 What’s Moving")
+    for pillar in pillars:
+        t = trends[pillar]
+        if t["change"] == "down":
+            st.warning(f"**{PILLAR_NAMES[pillar]}** shifted down around {t['change_at']}.")
+        elif t["change"] == "up":
+            st.success(f"**{PILLAR_NAMES[pillar]}** shifted up around {t['change_at']}.")
+    drift = min((p for p in pillars if p != "Score"), key=lambda p: trends[p]["fast"] - trends[p]["slow"], default=None)
+    if drift and trends[drift]["fast"] < trends[drift]["slow"] - 0.05:
+        st.info(f"**{PILLAR_NAMES[drift]}** is the pillar drifting most: `{trends[drift]['fast']:.2f}` recently against `{trends[drift]['slow']:.2f}` over time.")
+    elif not any(trends[p]["change"] for p in pillars):
+        st.caption("No pillar is drifting right now.")
+
+    st.markdown("### 📋 Trend Details")
+    st.table([{
+        "Pillar": PILLAR_NAMES[pillar],
+        "Latest": round(trends[pillar]["last"], 2),
+        "Recent (EWMA)": round(trends[pillar]["fast"], 2),
+        "Long-run (EWMA)": round(trends[pillar]["slow"], 2),
+        "Last 5": round(trends[pillar]["short_mean"], 2),
+        "Last 30": round(trends[pillar]["long_mean"], 2),
+        "Aligned Streak": trends[pillar]["streak"],
+        "Best Streak": trends[pillar]["best_streak"],
+        "Entries": trends[pillar]["n"],
+    } for pillar in pillars])
+
+    for pillar in pillars:
+        scale = 10 if pillar == "Score" else 1
+        st.markdown(bar_html(trends[pillar]["short_mean"] / scale, f"{PILLAR_NAMES[pillar]} — last 5"), unsafe_allow_html=True)
+
+# ======================= Module 19: Profile Reports =======================
+
+def reports_page():
+    st.markdown('<a name="profile-reports"></a>', unsafe_allow_html=True)
+    st.header("📑 Profile Reports")
+    st.caption("Every profile's summary, charts and legacy document, pre-rendered in the background and refreshed when the profile changes.")
+
+    conn = report_store()
+    versions = data_versions(conn)
+    if not versions:
+        st.info("No saved profiles yet. Reports appear once a profile has saved entries.")
+        return
+    status = report_status(conn)
+    st.dataframe([{
+        "Profile": profile,
+        "Rendered": status[profile][1] if profile in status else "—",
+        "Status": "Current" if status.get(profile, (None,))[0] == version else "Updating",
+    } for profile, version in sorted(versions.items())], hide_index=True)
+
+    names = sorted(versions)
+    current = st.session_state.get("selected_profile", "Me")
+    profile = st.selectbox("Open report for", names, index=names.index(current) if current in names else 0)
+    report = load_report(conn, profile)
+    if report is None or st.button("🔄 Render Now", help="Rebuild this report now instead of waiting for the background pass."):
+        with st.spinner("Rendering report..."):
+            save_report(conn, *render(DB_PATH, profile))
+        report = load_report(conn, profile)
+    version, rendered_at, page = report
+    if version != versions[profile]:
+        st.caption(f"🕰️ Rendered {rendered_at}; newer entries will appear after the next background pass.")
+    else:
+        st.caption(f"Rendered {rendered_at}.")
+    st.download_button("⬇️ Download Report", page, file_name=f"{profile}-report.html", mime="text/html")
+    st.iframe(page, height=900)
+
+# ======================= Module 20: Profile Comparison =======================
+
+COMPARE_METRICS = {"Score": "Score", "G (God Alignment)": "G", "Christlikeness (C)": "C", "Heart (H)": "H", "Faithfulness (F)": "F"}
+COMPARE_RANGES = {"Last 90 days": 90, "Last year": 365, "Last 5 years": 5 * 365, "All time": None}
+
+def comparison_page():
+    import time
+
+    st.markdown('<a name="profile-comparison"></a>', unsafe_allow_html=True)
+    st.header("⚖️ Profile Comparison")
+    st.caption("Compare profiles side by side on a shared daily or weekly timeline, from daily totals kept up to date on each save.")
+
+    names = list_profiles(connect())
+    if not names:
+        st.info("No saved profiles yet. Save entries under a few profiles to compare them.")
+        return
+    current = st.session_state.get("selected_profile", "Me")
+    default = [current] if current in names else []
+    default += [n for n in ("Me", "Team", "Mentor", "Board") if n in names and n not in default]
+    chosen = st.multiselect("Profiles", names, default=default[:4] or names[:4])
+    c1, c2, c3 = st.columns(3)
+    metric = COMPARE_METRICS[c1.selectbox("Measure", list(COMPARE_METRICS))]
+    freq = FREQUENCIES[c2.radio("Grid", list(FREQUENCIES), horizontal=True)]
+    days = COMPARE_RANGES[c3.selectbox("Range", list(COMPARE_RANGES))]
+    if not chosen:
+        st.info("Pick at least one profile.")
+        return
+
+    started = time.perf_counter()
+    start = (date.today() - timedelta(days=days)).isoformat() if days else None
+    values, counts = compare_profiles(connect(), chosen, metric, freq, start)
+    if values.empty:
+        st.info("No scored entries for these profiles in this range.")
+        return
+    st.line_chart(values.ffill() if st.toggle("Carry values across empty periods", value=freq == "D") else values)
+    st.markdown("### 📋 Summary")
+    st.dataframe(comparison_summary(values, counts))
+    with st.expander(f"{len(values)} {'days' if freq == 'D' else 'weeks'} × {len(chosen)} profiles"):
+        st.dataframe(values.round(3).sort_index(ascending=False))
+    st.caption(f"Built in {time.perf_counter() - started:.2f}s. Weekly values average every entry in the week, so busy days weigh more than quiet ones.")
+
+# ======================= Navigation =======================
+
+# Only the selected page's module runs on each rerun
+PAGES = {
+    "dashboard": st.Page(profile_dashboard_page, title="Profile Dashboard", icon="📊", url_path="profile-dashboard", default=True),
+    "welcome": st.Page(onboarding_page, title="Welcome", icon="🌅", url_path="guided-onboarding"),
+    "scripture": st.Page(scripture_catalog_page, title="Scripture Catalog", icon="📖", url_path="scripture-catalog"),
+    "custom": st.Page(custom_scenario_page, title="Add Custom Scenario", icon="✍️", url_path="custom-scenario"),
+    "instant": st.Page(instant_calculator_page, title="Instant Calculator", icon="⚡", url_path="instant-calculator"),
+    "editor": st.Page(catalog_editor_page, title="Catalog Editor", icon="🗂️", url_path="scripture-editor"),
+    "assessment": st.Page(life_assessment_page, title="Life Assessment", icon="🧭", url_path="life-assessment"),
+    "progress": st.Page(progress_viewer_page, title="Progress Viewer", icon="📈", url_path="progress-viewer"),
+    "greatest": st.Page(greatest_commands_page, title="Greatest Commands", icon="✝️", url_path="greatest-commands"),
+    "journal": st.Page(journaling_page, title="Journaling", icon="📝", url_path="journaling-reflection"),
+    "pathways": st.Page(pathways_page, title="Discipleship Pathways", icon="🛤️", url_path="discipleship-pathways"),
+    "scoreboard": st.Page(scoreboard_page, title="Scoreboard", icon="📊", url_path="spiritual-scoreboard"),
+    "trends": st.Page(trends_page, title="Pillar Trends", icon="📉", url_path="pillar-trends"),
+    "nudges": st.Page(nudges_page, title="Nudges", icon="🔔", url_path="spiritual-nudges"),
+    "search": st.Page(search_page, title="Tags & Search", icon="🔍", url_path="spiritual-search"),
+    "legacy": st.Page(legacy_builder_page, title="Legacy Builder", icon="📜", url_path="legacy-builder"),
+    "cohort": st.Page(cohort_analytics_page, title="Cohort Analytics", icon="🏛️", url_path="cohort-analytics"),
+    "compare": st.Page(comparison_page, title="Profile Comparison", icon="⚖️", url_path="profile-comparison"),
+    "reports": st.Page(reports_page, title="Profile Reports", icon="📑", url_path="profile-reports"),
+    "closing": st.Page(closing_reflection_page, title="Closing Reflection", icon="🌟", url_path="closing-reflection"),
+}
+
+NAV_SECTIONS = {
+    "Start": ["dashboard", "welcome"],
+    "Scripture": ["scripture", "custom", "instant", "editor", "pathways"],
+    "Life": ["assessment", "progress", "greatest", "journal"],
+    "Review": ["scoreboard", "trends", "nudges", "search", "legacy", "cohort", "compare", "reports", "closing"],
+}
+
+st.navigation({section: [PAGES[p] for p in pages] for section, pages in NAV_SECTIONS.items()}).run()
+
+# Footer (shown under every page)
+st.markdown("---")
+st.markdown('<a name="footer"></a>', unsafe_allow_html=True)
+st.caption("🖤 Soverain · Spiritual Intelligence Platform")
+st.caption("Version 1.0 · Built with prayer, precision, and purpose")
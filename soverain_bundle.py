@@ -0,0 +1,222 @@
+# ======================= Soverain Bundle: Profile Backup & Restore =======================
+#
+# A bundle is a stream of length-prefixed, zlib-compressed JSON frames:
+#   header  {"format", "profile", "goal", "pathways", "exported"}
+#   chunk   up to CHUNK_SIZE entries as parallel columns: "kind", "hash", "payload"
+#   footer  {"entries": total}
+# Payloads are the store's canonical entry JSON, so export copies them straight from the
+# store (putting back reflection text from the journal table) and restore checks each one
+# against its hash without re-encoding it.
+#
+# Every entry carries its content hash. Identical entries (the same scenario saved twice
+# on one day) share a hash, so an entry is known by its hash and which copy of it it is:
+# restoring skips the n-th copy of a hash when the profile already holds n copies. So
+# restoring or merging the same bundle twice adds nothing, and a profile with repeated
+# entries restores into an empty one whole. Chunks are read, checked and saved one at a
+# time, so memory stays bounded for any bundle size; a bundle that turns out truncated
+# or damaged partway keeps the chunks saved before that point, and restoring a good copy
+# afterwards adds only the rest.
+#
+#   python soverain_bundle.py export Me me.sovb
+#   python soverain_bundle.py restore me.sovb [--into Mentor]
+
+import argparse
+import json
+import struct
+import zlib
+from datetime import date, datetime
+
+import soverain_journal
+import soverain_store
+
+MAGIC = b"SOVB\x01"
+FORMAT = 1
+CHUNK_SIZE = 10000
+
+
+class BundleError(ValueError):
+    pass
+
+
+def _write_frame(f, obj):
+    data = zlib.compress(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(), 6)
+    f.write(struct.pack(">I", len(data)))
+    f.write(data)
+
+
+def _read_frame(f):
+    size = f.read(4)
+    if len(size) < 4:
+        raise BundleError("Bundle ended early.")
+    size = struct.unpack(">I", size)[0]
+    data = f.read(size)
+    if len(data) < size:
+        raise BundleError("Bundle ended early.")
+    try:
+        frame = json.loads(zlib.decompress(data))
+    except (zlib.error, ValueError) as e:  # ValueError covers bad JSON and bad UTF-8
+        raise BundleError("Bundle is damaged.") from e
+    if not isinstance(frame, dict):
+        raise BundleError("Bundle is damaged.")
+    return frame
+
+
+def _encode_chunk(rows):
+    # rows: (kind, payload, hash)
+    kinds = soverain_store.ENTRY_KINDS
+    return {
+        "kind": [kinds.index(kind) for kind, _, _ in rows],
+        "hash": [h for _, _, h in rows],
+        "payload": [payload for _, payload, _ in rows],
+    }
+
+
+def _decode_chunk(chunk):
+    # Yields (kind, payload, hash) in row order
+    kinds = soverain_store.ENTRY_KINDS
+    for kind, payload, h in zip(chunk["kind"], chunk["payload"], chunk["hash"]):
+        if not (type(kind) is int and 0 <= kind < len(kinds) and isinstance(payload, str) and isinstance(h, str)):
+            raise TypeError("malformed row")
+        yield kinds[kind], payload, h
+
+
+def export_profile(profile, f, conn=None, chunk_size=CHUNK_SIZE):
+    conn = conn or soverain_store.connect()
+    soverain_store.entry_hashes(profile, conn)  # hashes and canonicalizes older entries
+    data = soverain_store.load_profile_info(profile, conn)
+    f.write(MAGIC)
+    _write_frame(f, {
+        "format": FORMAT,
+        "profile": profile,
+        "goal": data["goal"],
+        "pathways": data["pathways"],
+        "exported": datetime.now().isoformat(timespec="seconds"),
+    })
+    total = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, kind, payload, hash FROM entries WHERE profile = ? AND id > ? ORDER BY id LIMIT ?",
+            (profile, last_id, chunk_size)
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        texts = soverain_journal.texts(conn, [i for i, kind, _, _ in rows if kind == "reflections"])
+        _write_frame(f, _encode_chunk([
+            (kind, soverain_store.entry_payload({**json.loads(payload), "Text": texts[i]}) if i in texts else payload, h)
+            for i, kind, payload, h in rows
+        ]))
+        total += len(rows)
+    _write_frame(f, {"entries": total})
+    return total
+
+
+def _entry(payload):
+    # A bundled payload as an entry dict, checked the way the save hooks need it
+    try:
+        entry = json.loads(payload)
+        if not isinstance(entry, dict):
+            raise ValueError("not an object")
+        if date.fromisoformat(entry["Saved"]).isoformat() != entry["Saved"]:
+            raise ValueError("Saved is not YYYY-MM-DD")
+    except (KeyError, TypeError, ValueError) as e:
+        raise BundleError("Bundle is damaged.") from e
+    if not all(isinstance(entry.get(k, ""), str) for k in ("Tags", "Text")):
+        raise BundleError("Bundle is damaged.")
+    return entry
+
+
+def read_bundle(f):
+    # Yields the header, then lists of (kind, payload, hash) per chunk; checks the footer
+    if f.read(len(MAGIC)) != MAGIC:
+        raise BundleError("Not a Soverain bundle.")
+    header = _read_frame(f)
+    if header.get("format") != FORMAT:
+        raise BundleError(f"Unsupported bundle format {header.get('format')}.")
+    pathways = header.get("pathways")
+    if not (
+        isinstance(header.get("profile"), str) and isinstance(header.get("goal"), str)
+        and isinstance(pathways, dict)
+        and all(isinstance(step, int) and not isinstance(step, bool) for step in pathways.values())
+    ):
+        raise BundleError("Bundle is damaged.")
+    yield header
+    seen = 0
+    while True:
+        frame = _read_frame(f)
+        if "entries" in frame and "kind" not in frame:
+            if frame["entries"] != seen:
+                raise BundleError(f"Bundle lists {frame['entries']} entries but holds {seen}.")
+            return
+        try:
+            rows = list(_decode_chunk(frame))
+        except (KeyError, IndexError, TypeError) as e:
+            raise BundleError("Bundle is damaged.") from e
+        seen += len(rows)
+        yield rows
+
+
+def restore_profile(f, into=None, conn=None):
+    # Restore or merge a bundle into `into` (default: the bundled profile name)
+    conn = conn or soverain_store.connect()
+    frames = read_bundle(f)
+    header = next(frames)
+    profile = into or header["profile"]
+    known = soverain_store.entry_hashes(profile, conn)  # hash -> copies the profile holds
+    copies = {}  # hash -> copies read from the bundle so far
+    read = added = 0
+    try:
+        for rows in frames:
+            items = []
+            for kind, payload, h in rows:
+                copies[h] = copies.get(h, 0) + 1
+                if copies[h] <= known.get(h, 0):
+                    continue
+                if soverain_store.entry_hash(kind, payload) != h:
+                    raise BundleError("Bundle entry does not match its content hash.")
+                entry = _entry(payload)
+                known[h] = copies[h]
+                items.append((kind, entry, payload, h))
+            soverain_store.save_entries(profile, items, conn)
+            read += len(rows)
+            added += len(items)
+    except BundleError as e:
+        if added:
+            raise BundleError(
+                f"{e} The {added} entries read before that point were restored; "
+                "restoring a complete copy of the bundle adds only the rest."
+            ) from e
+        raise
+    current = soverain_store.load_profile_info(profile, conn)
+    if header["goal"] != "—" and current["goal"] == "—":
+        soverain_store.save_goal(profile, header["goal"], conn)
+    for pathway, step in header["pathways"].items():
+        if step > current["pathways"].get(pathway, 0):
+            soverain_store.save_pathway_step(profile, pathway, step, conn)
+    return {"profile": profile, "read": read, "added": added, "skipped": read - added}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Back up and restore Soverain profiles.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="write a profile to a bundle")
+    exp.add_argument("profile")
+    exp.add_argument("path")
+    res = sub.add_parser("restore", help="restore or merge a bundle into a profile")
+    res.add_argument("path")
+    res.add_argument("--into", help="target profile (default: the bundled one)")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    if args.command == "export":
+        with open(args.path, "wb") as f:
+            print(json.dumps({"profile": args.profile, "entries": export_profile(args.profile, f, conn)}))
+    else:
+        with open(args.path, "rb") as f:
+            print(json.dumps(restore_profile(f, args.into, conn)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# ======================= Soverain Cache: Versioned Derived Views =======================
+#
+# Derived views (the profile as loaded, Dashboard stats, the Scoreboard frame, Search and
+# Legacy entry lists, nudge dates) are functions of a profile's data at one version, so
+# they live in one bounded LRU per process, shared by every session and keyed by
+#   (view, profile, data version, view parameters)
+# Every save bumps the profile's data version (soverain_store), so a result is never
+# served after the data it came from changed. When a view is recomputed for a newer
+# version, the entry for the older one is dropped at once instead of waiting to age out.
+#
+# Cached values are shared between sessions and must be treated as read-only.
+# Hits, misses and evictions are counted per view.
+
+import os
+import threading
+from collections import OrderedDict
+
+MAX_ENTRIES = int(os.environ.get("SOVERAIN_CACHE_ENTRIES", 256))
+
+
+class ViewCache:
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.items = OrderedDict()  # (view, profile, version, params) -> value, oldest first
+        self.latest = {}  # (view, profile, params) -> version held
+        self.stats = {}
+
+    def _count(self, view, what):
+        self.stats.setdefault(view, {"hits": 0, "misses": 0, "evictions": 0})[what] += 1
+
+    def get(self, view, profile, version, params, compute):
+        # The cached value, or compute() stored under this key. compute runs outside the
+        # lock, so two sessions missing at once may both compute; the second result wins.
+        key = (view, profile, version, params)
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                self._count(view, "hits")
+                return self.items[key]
+            self._count(view, "misses")
+        value = compute()
+        with self.lock:
+            older = self.latest.get((view, profile, params))
+            if older is not None and older != version:
+                if older > version:
+                    return value  # computed for a version that has already been replaced
+                self.items.pop((view, profile, older, params), None)
+            self.items[key] = value
+            self.items.move_to_end(key)
+            self.latest[view, profile, params] = version
+            while len(self.items) > self.max_entries:
+                (v, p, ver, prm), _ = self.items.popitem(last=False)
+                if self.latest.get((v, p, prm)) == ver:
+                    del self.latest[v, p, prm]
+                self._count(v, "evictions")
+        return value
+
+    def metrics(self):
+        # {view: {hits, misses, evictions, hit_rate}} plus the cache's size
+        with self.lock:
+            views = {
+                view: {**s, "hit_rate": round(s["hits"] / (s["hits"] + s["misses"]), 3) if s["hits"] + s["misses"] else None}
+                for view, s in sorted(self.stats.items())
+            }
+            return {"entries": len(self.items), "max_entries": self.max_entries, "views": views}
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.latest.clear()
+            self.stats.clear()
+
+
+view_cache = ViewCache()
@@ -0,0 +1,203 @@
+# ======================= Soverain Cohort: Organization-Wide Percentiles =======================
+#
+# Every saved entry updates, in the same transaction:
+#   - one quantile sketch per (metric, group) over all profiles' entries
+#   - per-profile counters (count and sum) for the same keys
+# Groups are "all", "type:<Type>" and "month:<YYYY-MM>"; metrics are Score, G and the
+# C, H and F pillars. A profile's percentile is its average for a key ranked against the
+# other profiles' averages for that key (one indexed read of the counters), and the
+# sketches give the organization's P10/median/P90 over entries, so queries never scan
+# entries. Averages are ranked against averages: they spread much less than single
+# entries, so ranking one against the entry distribution would overstate it.
+#
+#   python soverain_cohort.py --rebuild    # backfill from the entries table
+
+import argparse
+import json
+
+from soverain_sketch import KLLSketch
+
+METRICS = ("Score", "G", "C", "H", "F")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cohort_sketches (
+    metric TEXT NOT NULL,
+    grp TEXT NOT NULL,
+    sketch TEXT NOT NULL,
+    PRIMARY KEY (metric, grp)
+);
+CREATE TABLE IF NOT EXISTS cohort_counters (
+    profile TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    grp TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    total REAL NOT NULL,
+    PRIMARY KEY (profile, metric, grp)
+);
+CREATE INDEX IF NOT EXISTS cohort_counters_by_group ON cohort_counters(metric, grp);
+"""
+
+
+def setup(conn):
+    conn.executescript(SCHEMA)
+
+
+def entry_type(kind, entry):
+    # Same type names the Scoreboard uses
+    if kind == "scenarios":
+        return "Scenario"
+    if kind == "assessments":
+        return "Assessment"
+    return entry.get("Type", "Reflection")
+
+
+def collect(items):
+    # {(metric, group): [values]} for a batch of (kind, entry) pairs
+    by_group = {}
+    for kind, entry in items:
+        by_group.setdefault((entry_type(kind, entry), entry["Saved"][:7]), []).append(entry)
+    values = {}
+    for metric in METRICS:
+        for (typ, month), entries in by_group.items():
+            batch = [float(v) for v in (e.get(metric) for e in entries) if v is not None]
+            if not batch:
+                continue
+            for grp in ("all", f"type:{typ}", f"month:{month}"):
+                values.setdefault((metric, grp), []).extend(batch)
+    return values
+
+
+def _load_sketch(conn, metric, grp):
+    row = conn.execute(
+        "SELECT sketch FROM cohort_sketches WHERE metric = ? AND grp = ?", (metric, grp)
+    ).fetchone()
+    return KLLSketch.from_dict(json.loads(row[0])) if row else KLLSketch()
+
+
+def _store_sketches(conn, sketches):
+    conn.executemany(
+        "INSERT INTO cohort_sketches(metric, grp, sketch) VALUES (?, ?, ?) "
+        "ON CONFLICT(metric, grp) DO UPDATE SET sketch = excluded.sketch",
+        [(metric, grp, json.dumps(s.to_dict())) for (metric, grp), s in sketches.items()]
+    )
+
+
+def _add_counters(conn, rows):
+    conn.executemany(
+        "INSERT INTO cohort_counters(profile, metric, grp, n, total) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(profile, metric, grp) DO UPDATE SET "
+        "n = n + excluded.n, total = total + excluded.total",
+        rows
+    )
+
+
+def record(conn, profile, kind, entry):
+    # Called inside the store's save transaction
+    record_many(conn, profile, [(kind, entry)])
+
+
+def record_many(conn, profile, items):
+    # Batch form of record() for imports: one sketch load and store per key
+    values = collect(items)
+    sketches = {}
+    for key, batch in values.items():
+        sketch = _load_sketch(conn, *key)
+        sketch.update_many(batch)
+        sketches[key] = sketch
+    _store_sketches(conn, sketches)
+    _add_counters(conn, [(profile, metric, grp, len(batch), sum(batch)) for (metric, grp), batch in values.items()])
+
+
+def rebuild(conn, chunk_size=50000):
+    # Recompute everything from the entries table, a chunk at a time
+    with conn:
+        conn.execute("DELETE FROM cohort_sketches")
+        conn.execute("DELETE FROM cohort_counters")
+        sketches = {}
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, profile, kind, payload FROM entries WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            by_profile = {}
+            for _, profile, kind, payload in rows:
+                by_profile.setdefault(profile, []).append((kind, json.loads(payload)))
+            for profile, items in by_profile.items():
+                values = collect(items)
+                _add_counters(conn, [(profile, metric, grp, len(batch), sum(batch)) for (metric, grp), batch in values.items()])
+                for key, batch in values.items():
+                    sketches.setdefault(key, KLLSketch()).update_many(batch)
+        _store_sketches(conn, sketches)
+
+
+def groups(conn):
+    return [grp for (grp,) in conn.execute(
+        "SELECT DISTINCT grp FROM cohort_sketches ORDER BY grp"
+    )]
+
+
+def profile_rank(conn, profile, metric, grp, avg):
+    # (share of other profiles whose average is below `avg`, ties counting half, on a
+    # 0–100 scale, or None; number of other profiles) for one key
+    below, equal, others = conn.execute(
+        "SELECT COALESCE(SUM(total / n < ?), 0), COALESCE(SUM(total / n = ?), 0), COUNT(*) "
+        "FROM cohort_counters WHERE metric = ? AND grp = ? AND profile != ? AND n > 0",
+        (avg, avg, metric, grp, profile)
+    ).fetchone()
+    return (round(100 * (below + equal / 2) / others, 1) if others else None), others
+
+
+def profile_percentiles(conn, profile, grp="all"):
+    # [{Metric, Your Average, Org Median, Org P10, Org P90, Percentile, Profiles, Entries}]
+    # for one group; medians and P10/P90 are over entries, Percentile over profiles
+    averages = dict(
+        ((metric, total / n) for metric, n, total in conn.execute(
+            "SELECT metric, n, total FROM cohort_counters WHERE profile = ? AND grp = ?",
+            (profile, grp)
+        ))
+    )
+    rows = []
+    for metric in METRICS:
+        row = conn.execute(
+            "SELECT sketch FROM cohort_sketches WHERE metric = ? AND grp = ?", (metric, grp)
+        ).fetchone()
+        if not row:
+            continue
+        sketch = KLLSketch.from_dict(json.loads(row[0]))
+        avg = averages.get(metric)
+        rank, others = profile_rank(conn, profile, metric, grp, avg) if avg is not None else (None, None)
+        rows.append({
+            "Metric": metric,
+            "Your Average": round(avg, 3) if avg is not None else None,
+            "Org Median": sketch.quantile(0.5),
+            "Org P10": sketch.quantile(0.1),
+            "Org P90": sketch.quantile(0.9),
+            "Percentile": rank,
+            "Profiles": others,
+            "Entries": sketch.n,
+        })
+    return rows
+
+
+def main():
+    import soverain_store
+
+    parser = argparse.ArgumentParser(description="Maintain Soverain cohort sketches.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from all entries")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    if args.rebuild:
+        rebuild(conn)
+    sketches = conn.execute("SELECT COUNT(*) FROM cohort_sketches").fetchone()[0]
+    profiles = conn.execute("SELECT COUNT(DISTINCT profile) FROM cohort_counters").fetchone()[0]
+    print(json.dumps({"sketches": sketches, "profiles": profiles, "groups": len(groups(conn))}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# ======================= Soverain Compare: Time-Aligned Profile Series =======================
+#
+# Every saved entry adds its Score, G and C/H/F values to one row per (profile, day,
+# metric) holding a count and a sum, in the same transaction. Comparing profiles reads
+# those daily aggregates for all of them in one query and resamples them in pandas:
+#   - weekly values are the week's sum over its count, not an average of daily averages
+#   - one pivot puts every profile on a shared daily or weekly grid, with empty periods NaN
+# so twenty profiles over five years is a few thousand rows per metric, however many
+# entries they hold.
+#
+#   python soverain_compare.py --rebuild    # backfill from the entries table
+
+import argparse
+import json
+
+from soverain_cohort import METRICS
+
+FREQUENCIES = {"Daily": "D", "Weekly": "W"}  # weeks run Monday to Sunday
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_values (
+    profile TEXT NOT NULL,
+    day TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    total REAL NOT NULL,
+    PRIMARY KEY (profile, metric, day)
+);
+"""
+
+
+def setup(conn):
+    # A store whose entries predate the daily table is backfilled once
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_values'"
+    ).fetchone()
+    conn.executescript(SCHEMA)
+    if not existed:
+        rebuild(conn)
+
+
+def record(conn, profile, kind, entry):
+    # Called inside the store's save transaction
+    record_many(conn, profile, [(kind, entry)])
+
+
+def record_many(conn, profile, items):
+    sums = {}
+    for _, entry in items:
+        for metric in METRICS:
+            value = entry.get(metric)
+            if value is not None:
+                s = sums.setdefault((entry["Saved"], metric), [0, 0.0])
+                s[0] += 1
+                s[1] += float(value)
+    conn.executemany(
+        "INSERT INTO daily_values(profile, day, metric, n, total) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(profile, metric, day) DO UPDATE SET n = n + excluded.n, total = total + excluded.total",
+        [(profile, day, metric, n, total) for (day, metric), (n, total) in sums.items()]
+    )
+
+
+def rebuild(conn, chunk_size=50000):
+    # Recompute every profile's daily values from the entries table
+    with conn:
+        conn.execute("DELETE FROM daily_values")
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, profile, kind, payload FROM entries WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            by_profile = {}
+            for _, profile, kind, payload in rows:
+                by_profile.setdefault(profile, []).append((kind, json.loads(payload)))
+            for profile, items in by_profile.items():
+                record_many(conn, profile, items)
+
+
+def daily_frame(conn, profiles, metric, start=None):
+    # Long DataFrame (profile, day, n, total) of one metric for the given profiles
+    import pandas as pd
+
+    marks = ", ".join("?" * len(profiles))
+    df = pd.DataFrame(conn.execute(
+        f"SELECT profile, day, n, total FROM daily_values WHERE metric = ? AND profile IN ({marks}) AND day >= ?",
+        (metric, *profiles, start or "")
+    ).fetchall(), columns=["profile", "day", "n", "total"])
+    df["day"] = pd.to_datetime(df["day"])
+    return df
+
+
+def compare(conn, profiles, metric="Score", freq="D", start=None):
+    # (values, counts): DataFrames indexed by period on a shared grid, one column per profile
+    import pandas as pd
+
+    df = daily_frame(conn, profiles, metric, start)
+    if df.empty:
+        empty = pd.DataFrame(columns=list(profiles), dtype=float)
+        return empty, empty
+    df["period"] = df["day"].dt.to_period(freq).dt.start_time
+    sums = df.pivot_table(index="period", columns="profile", values=["n", "total"], aggfunc="sum")
+    grid = pd.date_range(sums.index.min(), sums.index.max(), freq="W-MON" if freq == "W" else freq)
+    counts = sums["n"].reindex(index=grid, columns=list(profiles))
+    values = sums["total"].reindex(index=grid, columns=list(profiles)) / counts
+    return values, counts.fillna(0).astype(int)
+
+
+def summary(values, counts):
+    # One row per profile: entries, mean over the range, latest value and the change across it
+    import pandas as pd
+
+    weighted = (values * counts).sum() / counts.sum().where(counts.sum() > 0)
+    filled = values.ffill()
+    first = values.bfill().iloc[0] if len(values) else pd.Series(dtype=float)
+    return pd.DataFrame({
+        "Entries": counts.sum(),
+        "Average": weighted.round(3),
+        "Latest": filled.iloc[-1].round(3) if len(values) else None,
+        "Change": (filled.iloc[-1] - first).round(3) if len(values) else None,
+    })
+
+
+def main():
+    import soverain_store
+
+    parser = argparse.ArgumentParser(description="Maintain Soverain daily comparison values.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from all entries")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    if args.rebuild:
+        rebuild(conn)
+    rows = conn.execute("SELECT COUNT(*), COUNT(DISTINCT profile) FROM daily_values").fetchone()
+    print(json.dumps({"rows": rows[0], "profiles": rows[1]}))
+
+
+if __name__ == "__main__":
+    main()
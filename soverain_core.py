@@ -0,0 +1,94 @@
+# ======================= Soverain Core: Scoring Chain & Constant Data =======================
+#
+# Pure scoring functions, HTML snippets and catalog data shared by the app and the
+# background tools. Imported once per process, so nothing here is rebuilt on rerun.
+# The HTML helpers escape their text: labels and tags can come from entries saved by
+# other users or tools, and the app renders these snippets with unsafe_allow_html.
+
+from html import escape
+
+def G_from_CHF(C, H, F):
+    return round((C * H * F) ** (1/3), 3)
+
+def A_from_G(G):
+    return round((G - 0.5) * 2, 3)
+
+def score_from_A(A):
+    return max(0, min(10, round((A + 1) * 5)))
+
+def label_from_score(score):
+    if score >= 7: return "✅ Aligned (God)"
+    elif score >= 3: return "🟣 Mixed"
+    else: return "⛔ Not God"
+
+def pct(x):
+    return int(round(x * 100))
+
+def donut_html(score, label="Score", scale_label="0–100"):
+    return f"""
+    <div class="donut">
+      <svg viewBox="0 0 36 36">
+        <path class="circle-bg" d="M18 2.0845 a 15.9155 15.9155 0 1 0 0.00001 0" />
+        <path class="circle" stroke-dasharray="{score}, 100" d="M18 2.0845 a 15.9155 15.9155 0 1 0 0.00001 0" />
+        <text x="18" y="20.35" class="score-text" style="font-size: 10px; font-weight: bold;">{score}</text>
+      </svg>
+      <div class="donut-label">{escape(str(label))}</div>
+      <div class="donut-scale">{escape(str(scale_label))}</div>
+    </div>
+    """
+
+def chip_html(label):
+    color = "#10b981" if "Aligned" in label else "#f59e0b" if "Mixed" in label else "#ef4444"
+    return f"""
+    <div style="display:inline-block; background:{color}; color:white; padding:4px 12px; border-radius:20px; font-size:0.85rem;">
+      {escape(str(label))}
+    </div>
+    """
+
+def bar_html(value, label="Progress", color="#3b82f6"):
+    return f"""
+    <div style="margin-top:8px;">
+      <div style="font-size:0.85rem; color:#f1f5f9;">{escape(str(label))}</div>
+      <div style="background:#334155; height:8px; border-radius:4px;">
+        <div style="width:{pct(value)}%; background:{color}; height:8px; border-radius:4px;"></div>
+      </div>
+    </div>
+    """
+
+def tag_cloud_html(tags):
+    # tags: [{Tag, Entries, Average}]; size by use, color by average score
+    top = max((t["Entries"] for t in tags), default=1)
+    words = []
+    for t in tags:
+        avg = t["Average"]
+        color = "#94a3b8" if avg is None else "#10b981" if avg >= 7 else "#f59e0b" if avg >= 3 else "#ef4444"
+        size = 0.8 + 1.0 * t["Entries"] / top
+        words.append(
+            f'<span title="{escape(str(t["Entries"]))} entries" style="color:{color}; font-size:{size:.2f}rem; '
+            f'margin:0 8px; white-space:nowrap;">#{escape(str(t["Tag"]))}</span>'
+        )
+    return f'<div style="line-height:2.2; text-align:center;">{" ".join(words)}</div>'
+
+def line_svg_html(values, label="Score", top=10, color="#3b82f6", width=600, height=120):
+    # Inline SVG line of values (0–top) in order; no scripts, so it works in saved pages
+    if not values:
+        return ""
+    step = width / max(len(values) - 1, 1)
+    points = " ".join(f"{i * step:.1f},{height - height * min(max(v / top, 0), 1):.1f}" for i, v in enumerate(values))
+    return f"""
+    <div style="margin-top:8px;">
+      <div style="font-size:0.85rem; color:#f1f5f9;">{escape(str(label))}</div>
+      <svg viewBox="0 0 {width} {height}" preserveAspectRatio="none" style="width:100%; height:{height}px; background:#1e293b; border-radius:4px;">
+        <polyline fill="none" stroke="{color}" stroke-width="2" vector-effect="non-scaling-stroke" points="{points}" />
+      </svg>
+    </div>
+    """
+
+SCRIPTURE_CATALOG = [
+    ("Genesis", "22:9–12", "Abraham", "Offer Isaac in obedience", 0.95, 0.95, 0.95, "Genesis 22:9–12"),
+    ("Exodus", "3:4", "Moses", "Respond to God's call at the burning bush", 0.90, 0.90, 0.90, "Exodus 3:4"),
+    ("Matthew", "5:1–12", "Jesus", "Teach the Beatitudes", 1.00, 1.00, 1.00, "Matthew 5:1–12"),
+    ("Luke", "15:20", "Father", "Forgive the prodigal son", 0.95, 0.95, 0.95, "Luke 15:20"),
+    ("John", "13:5", "Jesus", "Wash the disciples’ feet", 1.00, 1.00, 1.00, "John 13:5"),
+    ("Acts", "2:42–47", "Early Church", "Live in unity and generosity", 0.95, 0.95, 0.95, "Acts 2:42–47"),
+]
@@ -0,0 +1,224 @@
+# ======================= Soverain Events: Append-Only Log & Checkpoints =======================
+#
+# Every save, goal change and catalog edit is appended to the events table in the same
+# transaction as the write itself; a bulk import is a single entries_imported event. A
+# stream is a profile name, or "@catalog" for the Scripture Catalog Editor.
+#
+# Replaying a stream gives its state at any moment:
+#   profile -> {"goal": goal}
+#   catalog -> {"catalog": [added entries]}
+# Entry events are kept as the record of what was saved when, but replay does not need
+# them: a profile as of a date keeps the entries dated (Saved) on or before it, not the
+# ones recorded by then, since a restored bundle or a service import is one event today
+# but carries older history. Entry payloads stay in the entries table. The goal is the
+# one recorded by the end of that day.
+#
+# Checkpoints store a stream's state every CHECKPOINT_EVERY events, so a rebuild loads
+# the nearest checkpoint and replays only the tail. A background thread writes them.
+#
+#   python soverain_events.py --backfill   # create events for a store that predates them
+#   python soverain_events.py --compact    # write any due checkpoints now
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+import traceback
+import zlib
+from datetime import datetime
+
+CATALOG_STREAM = "@catalog"
+CHECKPOINT_EVERY = 10000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream TEXT NOT NULL,
+    type TEXT NOT NULL,
+    at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_stream ON events(stream, id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    stream TEXT NOT NULL,
+    event_id INTEGER NOT NULL,
+    at TEXT NOT NULL,
+    state BLOB NOT NULL,
+    PRIMARY KEY (stream, event_id)
+);
+"""
+
+
+def setup(conn):
+    conn.executescript(SCHEMA)
+
+
+def append(conn, stream, type, data, at=None):
+    # Called inside the writer's transaction
+    at = at or datetime.now().isoformat(timespec="microseconds")
+    conn.execute(
+        "INSERT INTO events(stream, type, at, data) VALUES (?, ?, ?, ?)",
+        (stream, type, at, json.dumps(data, ensure_ascii=False))
+    )
+
+
+def initial_state(stream):
+    if stream == CATALOG_STREAM:
+        return {"catalog": []}
+    return {"goal": "—"}
+
+
+def apply(state, type, data):
+    # entry_saved and entries_imported leave the replayed state as it is
+    if type == "goal_changed":
+        state["goal"] = data["goal"]
+    elif type == "catalog_added":
+        state["catalog"].append(data["entry"])
+    return state
+
+
+def _end_of_day(day):
+    return f"{day.isoformat()}T23:59:59.999999"
+
+
+def _latest_checkpoint(conn, stream, until):
+    row = conn.execute(
+        "SELECT event_id, state FROM checkpoints WHERE stream = ? AND at <= ? "
+        "ORDER BY event_id DESC LIMIT 1",
+        (stream, until)
+    ).fetchone()
+    if row:
+        return row[0], json.loads(zlib.decompress(row[1]))
+    return 0, initial_state(stream)
+
+
+def state_as_of(conn, stream, until=None):
+    # (state, last event id) after every event up to `until` (an ISO timestamp)
+    until = until or "9999"
+    last_id, state = _latest_checkpoint(conn, stream, until)
+    for event_id, type, data in conn.execute(
+        "SELECT id, type, data FROM events WHERE stream = ? AND id > ? AND at <= ? ORDER BY id",
+        (stream, last_id, until)
+    ):
+        apply(state, type, json.loads(data))
+        last_id = event_id
+    return state, last_id
+
+
+def profile_as_of(conn, profile, current, day):
+    # `current` (the loaded profile) as it stood at the end of `day`
+    state, _ = state_as_of(conn, profile, _end_of_day(day))
+    last = day.isoformat()
+    view = dict(current)
+    for kind, entries in current.items():
+        if isinstance(entries, list):  # the entry lists; goal and pathways are not
+            view[kind] = [e for e in entries if e["Saved"] <= last]
+    view["goal"] = state["goal"]
+    return view
+
+
+def catalog_additions(conn, day=None):
+    state, _ = state_as_of(conn, CATALOG_STREAM, _end_of_day(day) if day else None)
+    return [tuple(entry) for entry in state["catalog"]]
+
+
+def checkpoint(conn, stream, every=CHECKPOINT_EVERY):
+    # Replay the tail since the last checkpoint, keeping a checkpoint every `every` events
+    last_id, state = _latest_checkpoint(conn, stream, "9999")
+    written = []
+    for n, (event_id, type, at, data) in enumerate(conn.execute(
+        "SELECT id, type, at, data FROM events WHERE stream = ? AND id > ? ORDER BY id",
+        (stream, last_id)
+    ), 1):
+        apply(state, type, json.loads(data))
+        if n % every == 0:
+            written.append((stream, event_id, at, zlib.compress(json.dumps(state).encode())))
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO checkpoints(stream, event_id, at, state) VALUES (?, ?, ?, ?)",
+            written
+        )
+    return len(written)
+
+
+def compact(conn, every=CHECKPOINT_EVERY):
+    # Checkpoint every stream with at least `every` events since its last checkpoint;
+    # returns the number of checkpoints written
+    due = conn.execute(
+        """
+        SELECT e.stream FROM events e
+        LEFT JOIN (SELECT stream, MAX(event_id) AS last FROM checkpoints GROUP BY stream) c
+               ON c.stream = e.stream
+        WHERE e.id > COALESCE(c.last, 0)
+        GROUP BY e.stream HAVING COUNT(*) >= ?
+        """,
+        (every,)
+    ).fetchall()
+    return sum(checkpoint(conn, stream, every) for (stream,) in due)
+
+
+_compactor = None
+
+
+def start_compactor(connect, interval=60):
+    # Start one daemon thread per process that keeps checkpoints up to date
+    global _compactor
+    if _compactor is not None:
+        return _compactor
+
+    def loop():
+        while True:
+            try:
+                compact(connect())
+            except sqlite3.OperationalError:
+                pass  # a busy or locked store just means trying again next round
+            except Exception:
+                traceback.print_exc()
+            time.sleep(interval)
+
+    _compactor = threading.Thread(target=loop, name="soverain-compactor", daemon=True)
+    _compactor.start()
+    return _compactor
+
+
+def backfill(conn):
+    # Give a store that predates the event log one event per existing entry and goal
+    if conn.execute("SELECT 1 FROM events LIMIT 1").fetchone():
+        return 0
+    # Goals go first and entries in date order, so event ids and timestamps rise together
+    # and a checkpoint never holds an event later than its own timestamp
+    with conn:
+        conn.execute(
+            "INSERT INTO events(stream, type, at, data) "
+            "SELECT name, 'goal_changed', '0000-01-01T00:00:00.000000', json_object('goal', goal) "
+            "FROM profiles WHERE goal != '—'"
+        )
+        conn.execute(
+            "INSERT INTO events(stream, type, at, data) "
+            "SELECT profile, 'entry_saved', saved || 'T00:00:00.000000', "
+            "json_object('kind', kind, 'entry_id', id) FROM entries ORDER BY saved, id"
+        )
+    return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+def main():
+    import soverain_store
+
+    parser = argparse.ArgumentParser(description="Maintain the Soverain event log.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--backfill", action="store_true", help="create events from existing entries")
+    parser.add_argument("--compact", action="store_true", help="write any due checkpoints")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    result = {}
+    if args.backfill:
+        result["backfilled"] = backfill(conn)
+    if args.compact:
+        result["checkpointed"] = compact(conn)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# ======================= Soverain Journal: Compressed Reflection Text =======================
+#
+# Journal bodies are the bulk of a heavy journaler's data, but most views only need a
+# snippet and search only needs the words. So when a reflection with Text is saved:
+#   - its Text moves out of the entry payload into the journal table, deflate-compressed
+#     with the profile's preset dictionary, with its snippet beside it
+#   - its words go into journal_words, a contentless FTS5 index (word sets only, no copy
+#     of the text); where SQLite lacks FTS5, search decompresses instead
+# Loaded profiles keep only {"Snippet", "TextId"} in place of Text; full text is read and
+# decompressed when an entry is opened. Hashes and bundles still cover the full entry.
+#
+# zlib has no dictionary trainer, so a profile's dictionary is built from the words and
+# word pairs that are most common in its first TRAIN_AFTER reflections, most valuable
+# last (nearest the data). Rows stored before the dictionary existed are recompressed.
+#
+#   python tools/bench_journal.py    # storage and memory on a synthetic journal
+
+import json
+import re
+import sqlite3
+import zlib
+from collections import Counter
+
+SNIPPET_CHARS = 80
+TRAIN_AFTER = 200
+TRAIN_SAMPLE = 2000
+DICT_SIZE = 32768  # deflate's window, the largest useful preset dictionary
+LEVEL = 9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    entry_id INTEGER PRIMARY KEY,
+    profile TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    dict_id INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_by_profile ON journal(profile, entry_id);
+CREATE TABLE IF NOT EXISTS journal_dicts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile TEXT NOT NULL UNIQUE,
+    zdict BLOB NOT NULL
+);
+"""
+WORDS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS journal_words USING fts5(text, content='', detail=none)"
+
+
+def _has_fts5():
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+FTS5 = _has_fts5()
+
+
+def setup(conn, entry_payload, entry_hash):
+    # A store from before the journal table gets its reflection text moved over once
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'journal'"
+    ).fetchone()
+    indexed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'journal_words'"
+    ).fetchone()
+    conn.executescript(SCHEMA)
+    if FTS5:
+        conn.execute(WORDS_SCHEMA)
+    if not existed:
+        migrate(conn, entry_payload, entry_hash)
+    elif FTS5 and not indexed:
+        # Journal written where SQLite had no FTS5
+        with conn:
+            ids = [i for (i,) in conn.execute("SELECT entry_id FROM journal")]
+            conn.executemany("INSERT INTO journal_words(rowid, text) VALUES (?, ?)", texts(conn, ids).items())
+
+
+def snippet(text):
+    return text[:SNIPPET_CHARS] + ("..." if len(text) > SNIPPET_CHARS else "")
+
+
+def split(kind, entry):
+    # (entry without Text, text) for a reflection with a body; (entry, None) otherwise
+    text = entry.get("Text")
+    if kind != "reflections" or not isinstance(text, str):
+        return entry, None
+    return {k: v for k, v in entry.items() if k != "Text"}, text
+
+
+def compact(entry, entry_id):
+    # The in-session form of a saved reflection: snippet and a handle instead of the text
+    stored, text = split("reflections", entry)
+    if text is None:
+        return entry
+    return {**stored, "Snippet": snippet(text), "TextId": entry_id}
+
+
+def snippet_of(entry):
+    # Short line for lists: the journal snippet, or what a pathway reflection was about
+    if "Snippet" in entry:
+        return entry["Snippet"]
+    if "Text" in entry:
+        return snippet(entry["Text"])
+    return " ".join(str(entry[k]) for k in ("Book", "Verse", "Situation") if entry.get(k)) or entry.get("Type", "Reflection")
+
+
+def _compress(text, zdict):
+    c = zlib.compressobj(LEVEL, zlib.DEFLATED, -15, zdict=zdict) if zdict else zlib.compressobj(LEVEL, zlib.DEFLATED, -15)
+    return c.compress(text.encode()) + c.flush()
+
+
+def _decompress(body, zdict):
+    d = zlib.decompressobj(-15, zdict=zdict) if zdict else zlib.decompressobj(-15)
+    return (d.decompress(body) + d.flush()).decode()
+
+
+def train(texts, size=DICT_SIZE):
+    # Preset dictionary from the most common words and word pairs, weighted by length
+    counts = Counter()
+    for text in texts:
+        words = re.findall(r"\S+", text)
+        counts.update(w + " " for w in words if len(w) > 2)
+        counts.update(f"{a} {b} " for a, b in zip(words, words[1:]))
+    pieces, used = [], 0
+    for piece, n in sorted(counts.items(), key=lambda kv: kv[1] * len(kv[0]), reverse=True):
+        if n < 2:
+            break
+        if used + len(piece.encode()) > size:
+            break
+        pieces.append(piece)
+        used += len(piece.encode())
+    return "".join(reversed(pieces)).encode()
+
+
+def _dictionary(conn, profile):
+    row = conn.execute("SELECT id, zdict FROM journal_dicts WHERE profile = ?", (profile,)).fetchone()
+    return row if row else (0, None)
+
+
+def _train_profile(conn, profile, incoming):
+    # Build the profile's dictionary and recompress what was stored without one
+    older = conn.execute(
+        "SELECT entry_id, body FROM journal WHERE profile = ? AND dict_id = 0", (profile,)
+    ).fetchall()
+    sample = [_decompress(body, None) for _, body in older[-TRAIN_SAMPLE:]] + incoming[:TRAIN_SAMPLE]
+    zdict = train(sample[:TRAIN_SAMPLE])
+    dict_id = conn.execute(
+        "INSERT INTO journal_dicts(profile, zdict) VALUES (?, ?)", (profile, zdict)
+    ).lastrowid
+    conn.executemany(
+        "UPDATE journal SET dict_id = ?, body = ? WHERE entry_id = ?",
+        [(dict_id, _compress(_decompress(body, None), zdict), i) for i, body in older]
+    )
+    return dict_id, zdict
+
+
+def store(conn, profile, rows):
+    # rows: (entry_id, text); called inside the store's save transaction
+    if not rows:
+        return
+    dict_id, zdict = _dictionary(conn, profile)
+    if not dict_id:
+        have = conn.execute("SELECT COUNT(*) FROM journal WHERE profile = ?", (profile,)).fetchone()[0]
+        if have + len(rows) >= TRAIN_AFTER:
+            dict_id, zdict = _train_profile(conn, profile, [text for _, text in rows])
+    conn.executemany(
+        "INSERT INTO journal(entry_id, profile, snippet, dict_id, body) VALUES (?, ?, ?, ?, ?)",
+        [(i, profile, snippet(text), dict_id, _compress(text, zdict)) for i, text in rows]
+    )
+    if FTS5:
+        conn.executemany("INSERT INTO journal_words(rowid, text) VALUES (?, ?)", rows)
+
+
+def texts(conn, entry_ids):
+    # {entry_id: full text} for the given entries
+    found = {}
+    zdicts = {0: None}
+    ids = list(entry_ids)
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        for i, dict_id, body in conn.execute(
+            f"SELECT entry_id, dict_id, body FROM journal WHERE entry_id IN ({', '.join('?' * len(chunk))})", chunk
+        ):
+            if dict_id not in zdicts:
+                zdicts[dict_id] = conn.execute("SELECT zdict FROM journal_dicts WHERE id = ?", (dict_id,)).fetchone()[0]
+            found[i] = _decompress(body, zdicts[dict_id])
+    return found
+
+
+def full_text(conn, entry):
+    # The entry's full reflection, decompressing it if it was loaded as a snippet
+    if "Text" in entry:
+        return entry["Text"]
+    if "TextId" in entry:
+        return texts(conn, [entry["TextId"]]).get(entry["TextId"], "")
+    return None
+
+
+def matching_ids(conn, profile, query):
+    # Ids of the profile's journal entries with a word starting with each word of `query`
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    if not FTS5:
+        ids = [i for (i,) in conn.execute("SELECT entry_id FROM journal WHERE profile = ?", (profile,))]
+        pattern = re.compile("".join(rf"(?=.*\b{re.escape(w)})" for w in words), re.S)
+        return {i for i, text in texts(conn, ids).items() if pattern.match(text.lower())}
+    return {i for (i,) in conn.execute(
+        "SELECT entry_id FROM journal WHERE profile = ? AND entry_id IN "
+        "(SELECT rowid FROM journal_words WHERE journal_words MATCH ?)",
+        (profile, " ".join(f'"{w}"*' for w in words))
+    )}
+
+
+def migrate(conn, entry_payload, entry_hash):
+    # Move reflection text that is still inline in entry payloads into the journal table
+    with conn:
+        rows = conn.execute(
+            "SELECT id, profile, kind, payload, hash FROM entries "
+            "WHERE kind = 'reflections' AND payload LIKE '%\"Text\"%' ORDER BY id"
+        ).fetchall()
+        by_profile, updates = {}, []
+        for i, profile, kind, payload, h in rows:
+            entry = json.loads(payload)
+            stored, text = split(kind, entry)
+            if text is None:
+                continue
+            updates.append((entry_payload(stored), h or entry_hash(kind, entry_payload(entry)), i))
+            by_profile.setdefault(profile, []).append((i, text))
+        conn.executemany("UPDATE entries SET payload = ?, hash = ? WHERE id = ?", updates)
+        for profile, texts_ in by_profile.items():
+            store(conn, profile, texts_)
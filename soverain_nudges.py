@@ -0,0 +1,220 @@
+# ======================= Soverain Nudges: Rules & Offline Scheduler =======================
+#
+# The nudge rules shown in Module 14, plus a scheduler that evaluates them for every
+# profile in the store and writes pending nudges to an outbox.
+#
+# The rules read each profile's last activity date and average of the last five scores
+# from the trend tables (soverain_trends.py), which every save keeps current, and are
+# evaluated in one SQL pass. An outbox row is unique per (profile, rule, last activity
+# date), so a nudge is queued once per quiet spell rather than once per run.
+#
+# A run only looks at profiles whose nudges can have changed since the last one: those
+# with events after the last run's high-water mark (every save appends one), and those
+# whose last activity crossed an inactivity threshold between the last run's day and
+# today. The first run, or --full (say after soverain_trends.py --rebuild, which changes
+# trends without events), evaluates every profile.
+#
+#   python soverain_nudges.py                  # one run, deliver to outbox.jsonl
+#   python soverain_nudges.py --every 3600     # keep running hourly
+
+import argparse
+import json
+import time
+from datetime import date
+
+import soverain_store
+
+# Thresholds shared by Module 14 and the scheduler
+INACTIVE_WARN_DAYS = 5
+INACTIVE_INFO_DAYS = 2
+LOW_AVERAGE = 6
+STRONG_AVERAGE = 8
+
+# rule -> (level, message template)
+MESSAGES = {
+    "inactive_long": ("warning", "It’s been {days} days since your last reflection. Consider revisiting a Scripture or journaling a moment of clarity."),
+    "inactive_short": ("info", "{days} days since your last entry. A moment of quiet could bring fresh insight."),
+    "low_average": ("warning", "Your recent average score is `{avg}`. You may be navigating a spiritually mixed season. Consider revisiting the **Obedience** or **Love** pathway."),
+    "strong_average": ("success", "Your recent average score is `{avg}`. You’re walking in strong alignment—consider journaling what’s sustaining you."),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL,
+    since TEXT NOT NULL,
+    created TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    UNIQUE (profile, rule, since)
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox(status, id);
+CREATE TABLE IF NOT EXISTS nudge_marks (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    event_id INTEGER NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trend_activity_by_date ON trend_activity(last_saved);
+"""
+
+
+def inactivity_rule(days_since):
+    if days_since is None:
+        return None
+    if days_since >= INACTIVE_WARN_DAYS:
+        return "inactive_long"
+    if days_since >= INACTIVE_INFO_DAYS:
+        return "inactive_short"
+    return None
+
+
+def average_rule(avg_score):
+    if avg_score is None:
+        return None
+    if avg_score < LOW_AVERAGE:
+        return "low_average"
+    if avg_score >= STRONG_AVERAGE:
+        return "strong_average"
+    return None
+
+
+def nudges_for(days_since, avg_score):
+    # [(level, message)] for one profile, in display order
+    nudges = []
+    rule = inactivity_rule(days_since)
+    if rule:
+        level, text = MESSAGES[rule]
+        nudges.append((level, text.format(days=days_since)))
+    rule = average_rule(avg_score)
+    if rule:
+        level, text = MESSAGES[rule]
+        nudges.append((level, text.format(avg=avg_score)))
+    return nudges
+
+
+def setup(conn):
+    conn.executescript(SCHEMA)
+
+
+def queue_nudges(conn, today=None, full=False):
+    # Evaluate the rules for profiles that may have changed and queue new nudges; returns
+    # count queued
+    today = (today or date.today()).isoformat()
+    # Read the mark before the candidates: events committed in between are scanned now
+    # and again next run, which the outbox's unique key makes harmless
+    latest = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+    mark = conn.execute("SELECT event_id, day FROM nudge_marks").fetchone()
+    scope = ""
+    if not full and mark and mark[1] <= today:
+        crossed = " OR ".join(
+            f"(a.last_saved > date(:since_day, '-{n} days') AND a.last_saved <= date(:today, '-{n} days'))"
+            for n in (INACTIVE_INFO_DAYS, INACTIVE_WARN_DAYS)
+        )
+        scope = f"WHERE a.profile IN (SELECT stream FROM events WHERE id > :since_event) OR {crossed}"
+    rows = conn.execute(
+        f"""
+        SELECT profile, last_date, days, recent_avg,
+               CASE WHEN days >= {INACTIVE_WARN_DAYS} THEN 'inactive_long'
+                    WHEN days >= {INACTIVE_INFO_DAYS} THEN 'inactive_short' END,
+               CASE WHEN recent_avg < {LOW_AVERAGE} THEN 'low_average'
+                    WHEN recent_avg >= {STRONG_AVERAGE} THEN 'strong_average' END
+        FROM (SELECT a.profile, a.last_saved AS last_date, ROUND(t.short_mean, 2) AS recent_avg,
+                     CAST(julianday(:today) - julianday(a.last_saved) AS INTEGER) AS days
+              FROM trend_activity a
+              LEFT JOIN trend_state t ON t.profile = a.profile AND t.pillar = 'Score'
+              {scope})
+        WHERE days >= {INACTIVE_INFO_DAYS} OR recent_avg < {LOW_AVERAGE} OR recent_avg >= {STRONG_AVERAGE}
+        """,
+        {"today": today, "since_event": mark[0] if mark else 0, "since_day": mark[1] if mark else today}
+    )
+    pending = []
+    for profile, last_date, days, avg, inactive, average in rows:
+        if inactive:
+            level, text = MESSAGES[inactive]
+            pending.append((profile, inactive, level, text.format(days=days), last_date, today))
+        if average:
+            level, text = MESSAGES[average]
+            pending.append((profile, average, level, text.format(avg=avg), last_date, today))
+    with conn:
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO outbox(profile, rule, level, message, since, created) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            pending
+        )
+        queued = conn.total_changes - before
+        conn.execute(
+            "INSERT INTO nudge_marks(id, event_id, day) VALUES (1, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET event_id = excluded.event_id, day = excluded.day",
+            (latest, today)
+        )
+        return queued
+
+
+class FileSink:
+    # Local stand-in for an email/push gateway: appends one JSON object per nudge
+
+    def __init__(self, path="outbox.jsonl"):
+        self.path = path
+
+    def send(self, nudges):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for n in nudges:
+                f.write(json.dumps(n, ensure_ascii=False) + "\n")
+
+
+def deliver(conn, sink, batch_size=5000):
+    # Hand pending outbox rows to the sink in batches and mark them sent
+    sent = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, profile, rule, level, message, since, created FROM outbox "
+            "WHERE status = 'pending' ORDER BY id LIMIT ?",
+            (batch_size,)
+        ).fetchall()
+        if not rows:
+            return sent
+        sink.send([
+            {"profile": p, "rule": r, "level": lv, "message": m, "since": s, "created": c}
+            for _, p, r, lv, m, s, c in rows
+        ])
+        with conn:
+            conn.executemany("UPDATE outbox SET status = 'sent' WHERE id = ?", [(r[0],) for r in rows])
+        sent += len(rows)
+
+
+def run_once(conn=None, sink=None, today=None, full=False):
+    conn = conn or soverain_store.connect()
+    setup(conn)
+    queued = queue_nudges(conn, today, full)
+    sent = deliver(conn, sink) if sink is not None else 0
+    return {"queued": queued, "sent": sent}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate Soverain nudges for every profile.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--outbox", default="outbox.jsonl", help="file sink for delivered nudges")
+    parser.add_argument("--no-deliver", action="store_true", help="queue nudges but leave them pending")
+    parser.add_argument("--every", type=float, default=0, help="repeat every N seconds")
+    parser.add_argument("--full", action="store_true", help="evaluate every profile on the first run")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    sink = None if args.no_deliver else FileSink(args.outbox)
+    full = args.full
+    while True:
+        started = time.perf_counter()
+        result = run_once(conn, sink, full=full)
+        full = False
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        print(json.dumps(result))
+        if not args.every:
+            break
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ======================= Soverain Pathways: Data-File Loader =======================
+#
+# Discipleship Pathways live in pathways/<Name>.csv, one step per row, with the same
+# columns as the scenario template: Book, Verse, Figure, Situation, C, H, F.
+# Listing pathways only reads the directory; a pathway's steps are parsed the first
+# time it is opened and cached per process until the file changes. Files are edited by
+# hand, so an empty file, a missing column or a C/H/F outside 0–1 raises PathwayError
+# naming the row, for the page to show instead of the step.
+
+import csv
+import os
+from functools import lru_cache
+
+PATHWAYS_DIR = os.environ.get(
+    "SOVERAIN_PATHWAYS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "pathways")
+)
+
+
+COLUMNS = ("Book", "Verse", "Figure", "Situation", "C", "H", "F")
+
+
+class PathwayError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=4)
+def _list_pathways(directory, mtime):
+    names = [f[:-4] for f in os.listdir(directory) if f.endswith(".csv")]
+    return tuple(sorted(names))
+
+
+def list_pathways(directory=None):
+    directory = directory or PATHWAYS_DIR
+    if not os.path.isdir(directory):
+        return ()
+    return _list_pathways(directory, os.stat(directory).st_mtime_ns)
+
+
+def _step(row, line):
+    missing = [c for c in COLUMNS if not (row.get(c) or "").strip()]
+    if missing:
+        raise PathwayError(f"row {line} is missing {', '.join(missing)}")
+    try:
+        pillars = tuple(float(row[c]) for c in "CHF")
+    except ValueError:
+        raise PathwayError(f"row {line}: C, H and F must be numbers")
+    if not all(0 <= v <= 1 for v in pillars):
+        raise PathwayError(f"row {line}: C, H and F must be between 0 and 1")
+    return (row["Book"], row["Verse"], row["Figure"], row["Situation"], *pillars)
+
+
+@lru_cache(maxsize=256)
+def _load_steps(path, mtime):
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            # Line 1 is the header
+            steps = tuple(_step(row, line) for line, row in enumerate(csv.DictReader(f), 2))
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise PathwayError(f"can't be read ({e})")
+    if not steps:
+        raise PathwayError("has no steps")
+    return steps
+
+
+def load_pathway(name, directory=None):
+    # Steps as (book, verse, figure, situation, C, H, F) tuples; PathwayError if the file is unusable
+    path = os.path.join(directory or PATHWAYS_DIR, f"{name}.csv")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        raise PathwayError("was removed")
+    return _load_steps(path, mtime)
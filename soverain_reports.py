@@ -0,0 +1,248 @@
+# ======================= Soverain Reports: Pre-Rendered Profile Pages =======================
+#
+# Leaders reviewing many profiles shouldn't wait for the Dashboard, Scoreboard and Legacy
+# Preview to be rebuilt on every profile switch. A report is one self-contained HTML page
+# per profile (summary, score charts and the legacy document for the last LEGACY_DAYS),
+# rendered in a process pool and stored zlib-compressed in the reports table together
+# with the data version it was built from.
+#
+# A profile's data version (soverain_store.data_version) is bumped in the same
+# transaction as every save, import, goal change and pathway step. A pass renders only the
+# profiles whose version differs from their report's, so a pass over an unchanged store
+# is one query.
+# The app checks every REFRESH_SECONDS from a background thread and, when reports are
+# stale, runs this script as a child process, so the pool is never started from inside
+# the Streamlit server (spawned workers would re-import its script).
+#
+#   python soverain_reports.py [--workers 4] [--every 60] [--out reports/]
+
+import argparse
+import html
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from multiprocessing import get_context
+
+import soverain_journal
+import soverain_store
+from soverain_store import data_version, data_versions
+from soverain_core import A_from_G, bar_html, chip_html, donut_html, label_from_score, line_svg_html, score_from_A
+
+LEGACY_DAYS = 90  # the Legacy Builder's default window
+REFRESH_SECONDS = 30
+WORKERS = int(os.environ.get("SOVERAIN_REPORT_WORKERS", min(4, os.cpu_count() or 1)))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    profile TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    rendered_at TEXT NOT NULL,
+    html BLOB NOT NULL
+);
+"""
+
+STYLE = """
+body { background:#0f172a; color:#f1f5f9; font-family:system-ui, sans-serif; margin:24px; }
+h1, h2 { color:#f1f5f9; } .muted { color:#94a3b8; font-size:0.85rem; }
+.grid { display:grid; grid-template-columns:repeat(auto-fit, minmax(260px, 1fr)); gap:16px; }
+.donut { width:140px; text-align:center; } .donut svg { width:140px; }
+.circle-bg { fill:none; stroke:#334155; stroke-width:3.8; }
+.circle { fill:none; stroke:#3b82f6; stroke-width:2.8; stroke-linecap:round; }
+.score-text { fill:#f1f5f9; text-anchor:middle; }
+details { background:#1e293b; border-radius:6px; padding:8px 12px; margin:6px 0; }
+summary { cursor:pointer; }
+"""
+
+
+def connect(db=None):
+    conn = soverain_store.connect(db)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def report_status(conn):
+    # {profile: (version, rendered_at)} for every stored report
+    return {p: (v, at) for p, v, at in conn.execute("SELECT profile, version, rendered_at FROM reports")}
+
+
+def stale_profiles(conn):
+    rendered = {p: v for p, (v, _) in report_status(conn).items()}
+    return [p for p, v in data_versions(conn).items() if rendered.get(p) != v]
+
+
+def load_report(conn, profile):
+    # (version, rendered_at, html) or None
+    row = conn.execute("SELECT version, rendered_at, html FROM reports WHERE profile = ?", (profile,)).fetchone()
+    return (row[0], row[1], zlib.decompress(row[2]).decode()) if row else None
+
+
+def save_report(conn, profile, version, rendered_at, page):
+    # Never replaces a report built from newer data (another process may render too)
+    with conn:
+        conn.execute(
+            "INSERT INTO reports(profile, version, rendered_at, html) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(profile) DO UPDATE SET version = excluded.version, "
+            "rendered_at = excluded.rendered_at, html = excluded.html WHERE excluded.version >= reports.version",
+            (profile, version, rendered_at, zlib.compress(page.encode(), 6))
+        )
+
+
+def _esc(value):
+    return html.escape(str(value))
+
+
+def _title(kind, entry):
+    return entry.get("Type") or {"scenarios": "Scenario", "assessments": "Assessment"}.get(kind, "Reflection")
+
+
+def page_html(profile, data, texts, version, rendered_at, today=None):
+    # The report page for a loaded profile; `texts` maps TextId to full reflection text
+    today = today or date.today()
+    scored = [(kind, e) for kind in soverain_store.ENTRY_KINDS for e in data[kind]
+              if e.get("Score") is not None and e.get("G") is not None]
+    parts = [
+        f"<h1>👤 {_esc(profile)}</h1>",
+        f'<div class="muted">Goal: {_esc(data["goal"])} · Rendered {rendered_at} from data version {version}</div>',
+        "<h2>🧑 Summary</h2>",
+        f"<p>Saved Scenarios: <b>{len(data['scenarios'])}</b> · Life Assessments: <b>{len(data['assessments'])}</b>"
+        f" · Reflections: <b>{len(data['reflections'])}</b></p>",
+    ]
+    if scored:
+        avg_score = round(sum(e["Score"] for _, e in scored) / len(scored), 2)
+        avg_G = round(sum(e["G"] for _, e in scored) / len(scored), 3)
+        score = score_from_A(A_from_G(avg_G))
+        parts.append(f"<p>Average Score: <b>{avg_score}</b> · Average G: <b>{avg_G}</b> · Average A: <b>{A_from_G(avg_G):.3f}</b></p>")
+        parts.append(
+            f'<div class="grid"><div>{donut_html(round(score * 10, 1), "Profile Alignment")}</div>'
+            f"<div>{chip_html(label_from_score(score))}{bar_html(avg_G, 'G Alignment')}</div></div>"
+        )
+
+        # Charts: daily average score and the average by entry type
+        by_day, by_type = {}, {}
+        for kind, e in scored:
+            by_day.setdefault(e["Saved"], []).append(e["Score"])
+            by_type.setdefault(_title(kind, e), []).append(e["Score"])
+        days = sorted(by_day)
+        parts.append("<h2>📈 Score Over Time</h2>")
+        parts.append(line_svg_html([sum(by_day[d]) / len(by_day[d]) for d in days], f"Daily average score, {days[0]} to {days[-1]}"))
+        parts.append("<h2>🧭 Score Breakdown by Type</h2>")
+        for kind, scores in sorted(by_type.items()):
+            avg = sum(scores) / len(scores)
+            parts.append(bar_html(avg / 10, f"{kind} · {avg:.2f} ({len(scores)} entries)", "#10b981"))
+    else:
+        parts.append("<p>No scored entries yet.</p>")
+
+    # Legacy document, newest first
+    start = (today - timedelta(days=LEGACY_DAYS)).isoformat()
+    legacy = [(kind, e) for kind in soverain_store.ENTRY_KINDS for e in data[kind] if e["Saved"] >= start]
+    legacy.sort(key=lambda ke: ke[1]["Saved"], reverse=True)
+    parts.append(f"<h2>📜 Legacy ({len(legacy)} entries since {start})</h2>")
+    for kind, e in legacy:
+        lines = [f"<summary>{_esc(e['Saved'])} — {_esc(_title(kind, e))} {_esc(e.get('Book', ''))} {_esc(e.get('Verse', ''))}</summary>"]
+        for key in ("Figure", "Situation", "Tags", "Score", "G", "Label"):
+            if e.get(key) not in (None, ""):
+                lines.append(f"<div><b>{key}:</b> {_esc(e[key])}</div>")
+        text = e.get("Text") or texts.get(e.get("TextId"))
+        if text:
+            lines.append(f"<p>{_esc(text)}</p>")
+        parts.append(f"<details>{''.join(lines)}</details>")
+
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Soverain · {_esc(profile)}</title>'
+        f"<style>{STYLE}</style></head><body>{''.join(parts)}</body></html>"
+    )
+
+
+def render(db, profile):
+    # Runs in a pool process. The version is read before the data, so a save landing in
+    # between leaves the report one version behind and the next pass renders it again.
+    conn = connect(db)
+    version = data_version(profile, conn)
+    data = soverain_store.load_profile(profile, conn)
+    start = (date.today() - timedelta(days=LEGACY_DAYS)).isoformat()
+    texts = soverain_journal.texts(conn, [r["TextId"] for r in data["reflections"] if "TextId" in r and r["Saved"] >= start])
+    rendered_at = datetime.now().isoformat(timespec="seconds")
+    return profile, version, rendered_at, page_html(profile, data, texts, version, rendered_at)
+
+
+def prerender(db=None, workers=WORKERS, profiles=None):
+    # Render the stale (or the given) profiles in a process pool; reports are saved as they finish
+    db = os.path.abspath(db or soverain_store.DB_PATH)
+    conn = connect(db)
+    todo = profiles if profiles is not None else stale_profiles(conn)
+    started = time.perf_counter()
+    if todo:
+        with ProcessPoolExecutor(min(workers, len(todo)), mp_context=get_context("spawn")) as pool:
+            for future in as_completed([pool.submit(render, db, p) for p in todo]):
+                save_report(conn, *future.result())
+    return {"rendered": len(todo), "seconds": round(time.perf_counter() - started, 3)}
+
+
+_prerenderer = None
+
+
+def start_prerenderer(db=None, interval=REFRESH_SECONDS, workers=WORKERS):
+    # Start one daemon thread per process that keeps reports current (SOVERAIN_REPORT_WORKERS=0 turns it off)
+    global _prerenderer
+    if _prerenderer is not None or workers < 1:
+        return _prerenderer
+    db = os.path.abspath(db or soverain_store.DB_PATH)
+
+    def loop():
+        while True:
+            # Failures are logged to stderr and retried next round
+            try:
+                if stale_profiles(connect(db)):
+                    result = subprocess.run(
+                        [sys.executable, os.path.abspath(__file__), "--db", db, "--workers", str(workers)],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+                    )
+                    if result.returncode:
+                        print(f"soverain_reports: render pass failed (exit {result.returncode})\n{result.stderr[-4000:]}",
+                              file=sys.stderr)
+            except Exception:
+                traceback.print_exc()
+            time.sleep(interval)
+
+    _prerenderer = threading.Thread(target=loop, name="soverain-prerenderer", daemon=True)
+    _prerenderer.start()
+    return _prerenderer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render Soverain profile reports.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--workers", type=int, default=max(WORKERS, 1), help="render processes")
+    parser.add_argument("--every", type=float, default=0, help="repeat every N seconds")
+    parser.add_argument("--all", action="store_true", help="re-render every profile, not just changed ones")
+    parser.add_argument("--out", help="also write each report to this directory as <profile>.html")
+    args = parser.parse_args()
+
+    while True:
+        conn = connect(args.db)
+        result = prerender(args.db, args.workers, list(data_versions(conn)) if args.all else None)
+        if args.out:
+            os.makedirs(args.out, exist_ok=True)
+            for profile in data_versions(conn):
+                found = load_report(conn, profile)
+                if found:
+                    name = re.sub(r"[^\w\- ]", "_", profile)
+                    with open(os.path.join(args.out, f"{name}.html"), "w", encoding="utf-8") as f:
+                        f.write(found[2])
+        print(json.dumps(result))
+        if not args.every:
+            break
+        time.sleep(args.every)
+        args.all = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+# ======================= Soverain Service: Batch Scoring & Ingestion API =======================
+#
+# A small asyncio HTTP/1.1 JSON service for tools that don't drive the Streamlit UI
+# (check-in kiosks, small-group apps). Endpoints:
+#   GET  /health
+#   POST /score                    {"items": [[C, H, F], ...]}  -> G, A, Score, Label per item
+#   POST /entries                  {"records": [{"profile", "kind", "C", "H", "F", ...}, ...]}
+#   GET  /profiles/<name>/summary  goal, entry counts, last activity, trends and nudges
+#
+# Scoring runs on the event loop with a memo of the scoring chain (sliders move in 0.01
+# steps, so triples repeat a lot). Store work runs on a fixed set of reader threads, each
+# holding one connection, and on a single writer thread, since SQLite has one writer:
+#   - concurrent /entries requests are queued and written together in one transaction; if
+#     that fails, each request is retried on its own so one bad request fails alone
+#   - concurrent summaries of the same profile share one in-flight read
+#
+#   python soverain_service.py --port 8765 [--db soverain.db] [--readers 4]
+
+import argparse
+import asyncio
+import json
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from urllib.parse import unquote
+
+import soverain_store
+from soverain_core import A_from_G, G_from_CHF, label_from_score, score_from_A
+from soverain_nudges import nudges_for
+from soverain_trends import last_activity, pillar_trends
+
+MAX_BODY = 64 * 2**20
+MAX_WRITE_BATCH = 20000  # records per coalesced write
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+TEXT_FIELDS = ("Type", "Book", "Verse", "Figure", "Situation", "Tags", "Text", "Label")
+SCORE_RANGES = {"Score": (0, 10), "G": (0, 1)}
+
+
+class RequestError(ValueError):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+@lru_cache(maxsize=65536)
+def score_triple(C, H, F):
+    # The app's scoring chain for one C/H/F triple
+    G = G_from_CHF(C, H, F)
+    A = A_from_G(G)
+    score = score_from_A(A)
+    return {"G": G, "A": A, "Score": score, "Label": label_from_score(score)}
+
+
+def _pillars(item, where):
+    # (C, H, F) from a [C, H, F] list or a {"C", "H", "F"} object, each within 0–1
+    try:
+        values = tuple(float(v) for v in (item if isinstance(item, list) else (item["C"], item["H"], item["F"])))
+    except (KeyError, TypeError, ValueError):
+        raise RequestError(400, f"{where}: expected [C, H, F] or {{\"C\", \"H\", \"F\"}}.")
+    if len(values) != 3 or not all(0 <= v <= 1 for v in values):
+        raise RequestError(400, f"{where}: C, H and F must be three numbers between 0 and 1.")
+    return values
+
+
+def score_items(items):
+    return [score_triple(*_pillars(item, f"items[{i}]")) for i, item in enumerate(items)]
+
+
+def entry_from_record(record, where):
+    # (profile, kind, entry) for one ingested record, scored the way the app's forms score it
+    if not isinstance(record, dict) or not isinstance(record.get("profile"), str) or not record["profile"].strip():
+        raise RequestError(400, f"{where}: every record needs a profile.")
+    kind = record.get("kind", "assessments")
+    if kind not in soverain_store.ENTRY_KINDS:
+        raise RequestError(400, f"{where}: kind must be one of {', '.join(soverain_store.ENTRY_KINDS)}.")
+    entry = {k: v for k, v in record.items() if k not in ("profile", "kind")}
+    if kind == "assessments":
+        entry.setdefault("Type", "Life Assessment")
+    if any(p in entry for p in ("C", "H", "F")):
+        C, H, F = _pillars(entry, where)
+        scored = score_triple(C, H, F)
+        entry.update(C=C, H=H, F=F, G=scored["G"], Score=scored["Score"], Label=scored["Label"])
+    elif kind != "reflections":
+        raise RequestError(400, f"{where}: scenarios and assessments need C, H and F.")
+    else:
+        # A reflection may carry its own Score or G; they feed trends and sketches as numbers
+        for field, (low, high) in SCORE_RANGES.items():
+            if field in entry:
+                value = entry[field]
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or not low <= value <= high:
+                    raise RequestError(400, f"{where}: {field} must be a number between {low} and {high}.")
+    for field in TEXT_FIELDS:
+        if field in entry and not isinstance(entry[field], str):
+            raise RequestError(400, f"{where}: {field} must be a string.")
+    # Stored as YYYY-MM-DD like the app's, since pages compare and parse it
+    saved = entry.get("Saved", date.today().isoformat())
+    try:
+        entry["Saved"] = date.fromisoformat(saved).isoformat()
+    except (TypeError, ValueError):
+        raise RequestError(400, f"{where}: Saved must be a date as YYYY-MM-DD.")
+    return record["profile"].strip(), kind, entry
+
+
+class Service:
+
+    def __init__(self, db=None, readers=4):
+        self.db = db or soverain_store.DB_PATH
+        # Each pool thread opens its own connection on first use (soverain_store.connect is
+        # per thread), so the pools hold `readers` read connections and one write connection
+        self.read_pool = ThreadPoolExecutor(readers, thread_name_prefix="soverain-read")
+        self.write_pool = ThreadPoolExecutor(1, thread_name_prefix="soverain-write")
+        self.writes = None
+        self.inflight = {}
+        self.writer = None
+
+    # ---- store work (runs on pool threads) ----
+
+    def _write(self, batch):
+        # batch: [(profile, kind, entry)] from one or more requests, in arrival order;
+        # written in one transaction, so a failure saves none of it
+        conn = soverain_store.connect(self.db)
+        by_profile = {}
+        for profile, kind, entry in batch:
+            payload = soverain_store.entry_payload(entry)
+            by_profile.setdefault(profile, []).append(
+                (kind, entry, payload, soverain_store.entry_hash(kind, payload))
+            )
+        soverain_store.save_batches(by_profile, conn)
+
+    def _summary(self, profile):
+        conn = soverain_store.connect(self.db)
+        info = soverain_store.load_profile_info(profile, conn)
+        counts = dict.fromkeys(soverain_store.ENTRY_KINDS, 0)
+        counts.update(conn.execute(
+            "SELECT kind, COUNT(*) FROM entries WHERE profile = ? GROUP BY kind", (profile,)
+        ).fetchall())
+        last_saved = last_activity(conn, profile)
+        trends = pillar_trends(conn, profile)
+        days_since = (date.today() - date.fromisoformat(last_saved)).days if last_saved else None
+        avg = round(trends["Score"]["short_mean"], 2) if "Score" in trends else None
+        return {
+            "profile": profile,
+            "goal": info["goal"],
+            "pathways": info["pathways"],
+            "counts": counts,
+            "last_saved": last_saved,
+            "recent_average": avg,
+            "trends": {
+                pillar: {k: t[k] for k in ("fast", "slow", "short_mean", "long_mean", "streak", "best_streak", "change", "change_at")}
+                for pillar, t in trends.items()
+            },
+            "nudges": [{"level": level, "message": message} for level, message in nudges_for(days_since, avg)],
+        }
+
+    # ---- coalescing ----
+
+    async def ingest(self, batch):
+        # Queue a request's records for the writer; resolves once they are committed
+        future = asyncio.get_running_loop().create_future()
+        await self.writes.put((batch, future))
+        return await future
+
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.writes.get()]
+            size = len(pending[0][0])
+            while size < MAX_WRITE_BATCH and not self.writes.empty():
+                pending.append(self.writes.get_nowait())
+                size += len(pending[-1][0])
+            try:
+                await loop.run_in_executor(self.write_pool, self._write, [r for batch, _ in pending for r in batch])
+            except Exception as e:
+                if len(pending) == 1:
+                    self._resolve(*pending[0], e)
+                    continue
+                # Nothing was saved; write each request alone so only the failing one fails
+                for batch, future in pending:
+                    try:
+                        await loop.run_in_executor(self.write_pool, self._write, batch)
+                    except Exception as e:
+                        self._resolve(batch, future, e)
+                    else:
+                        self._resolve(batch, future)
+            else:
+                for batch, future in pending:
+                    self._resolve(batch, future)
+
+    @staticmethod
+    def _resolve(batch, future, error=None):
+        if future.done():  # done if the client went away
+            return
+        if error is None:
+            future.set_result(len(batch))
+        else:
+            future.set_exception(error)
+
+    async def summary(self, profile):
+        # Concurrent summaries of one profile share a single read
+        task = self.inflight.get(profile)
+        if task is None:
+            loop = asyncio.get_running_loop()
+            task = loop.run_in_executor(self.read_pool, self._summary, profile)
+            self.inflight[profile] = task
+            task.add_done_callback(lambda _: self.inflight.pop(profile, None))
+        # Shielded so one caller going away doesn't cancel the read for the others
+        return await asyncio.shield(task)
+
+    # ---- HTTP ----
+
+    async def route(self, method, path, body):
+        if path == "/health":
+            return {"status": "ok"}
+        if path == "/score":
+            if method != "POST":
+                raise RequestError(405, "Use POST.")
+            items = body.get("items") if isinstance(body, dict) else None
+            if not isinstance(items, list):
+                raise RequestError(400, "Body must be {\"items\": [[C, H, F], ...]}.")
+            return {"results": score_items(items)}
+        if path == "/entries":
+            if method != "POST":
+                raise RequestError(405, "Use POST.")
+            records = body.get("records") if isinstance(body, dict) else None
+            if not isinstance(records, list):
+                raise RequestError(400, "Body must be {\"records\": [...]}.")
+            batch = [entry_from_record(r, f"records[{i}]") for i, r in enumerate(records)]
+            saved = await self.ingest(batch) if batch else 0
+            return {"saved": saved, "results": [
+                {k: entry.get(k) for k in ("G", "Score", "Label")} for _, _, entry in batch
+            ]}
+        parts = path.strip("/").split("/")
+        if len(parts) == 3 and parts[0] == "profiles" and parts[2] == "summary":
+            if method != "GET":
+                raise RequestError(405, "Use GET.")
+            return await self.summary(unquote(parts[1]))
+        raise RequestError(404, f"No endpoint at {path}.")
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, path, version = lines[0].split(" ", 2)
+                    headers = {k.strip().lower(): v.strip() for k, v in (l.split(":", 1) for l in lines[1:] if ":" in l)}
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    return  # not HTTP; drop the connection
+                try:
+                    if length < 0:
+                        raise RequestError(400, "Content-Length must not be negative.")
+                    if length > MAX_BODY:
+                        raise RequestError(413, f"Bodies are limited to {MAX_BODY} bytes.")
+                    raw = await reader.readexactly(length) if length else b""
+                    try:
+                        body = json.loads(raw) if raw else None
+                    except ValueError:
+                        raise RequestError(400, "Body is not valid JSON.")
+                    status, result = 200, await self.route(method, path.split("?", 1)[0], body)
+                except RequestError as e:
+                    status, result = e.status, {"error": str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except Exception:
+                    traceback.print_exc()
+                    status, result = 500, {"error": "Internal error."}
+                data = json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive or status == 413:
+                    return
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.writes = asyncio.Queue()
+        self.writer = asyncio.create_task(self._write_loop())
+        return await asyncio.start_server(self.handle, host, port)
+
+    def close(self):
+        if self.writer:
+            self.writer.cancel()
+        self.read_pool.shutdown(wait=False)
+        self.write_pool.shutdown(wait=True)
+
+
+async def serve(host, port, db, readers):
+    service = Service(db, readers)
+    server = await service.start(host, port)
+    print(json.dumps({"listening": f"http://{host}:{server.sockets[0].getsockname()[1]}", "db": service.db}))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Soverain scoring and ingestion over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--readers", type=int, default=4, help="read connections")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.db, args.readers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
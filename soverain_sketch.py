@@ -0,0 +1,79 @@
+# ======================= Soverain Sketch: Quantile Sketch =======================
+#
+# A small KLL sketch (Karnin, Lang & Liberty). Items live in levels; an item on level h
+# stands for 2**h original values. When a level fills up it is sorted and every other
+# item is promoted, so memory stays around a few times k no matter how many values are
+# added. The cohort uses it only for quantiles (P10/median/P90); percentile ranks come
+# from per-profile averages in soverain_cohort, so the sketch has no merge or rank API.
+
+import math
+import random
+
+
+class KLLSketch:
+
+    def __init__(self, k=200):
+        self.k = k
+        self.n = 0
+        self.levels = [[]]
+        self._room = self._capacity(0)
+
+    def _capacity(self, h):
+        # Lower levels get less room; the top level always keeps k items
+        depth = len(self.levels) - h - 1
+        return max(8, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compact(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                level.sort()
+                # An odd item out stays on this level so no weight is lost
+                keep = [level.pop()] if len(level) % 2 else []
+                offset = random.getrandbits(1)
+                self.levels[h + 1].extend(level[offset::2])
+                self.levels[h] = keep
+            h += 1
+        self._room = self._capacity(0)
+
+    def update(self, value):
+        self.levels[0].append(value)
+        self.n += 1
+        if len(self.levels[0]) >= self._room:
+            self._compact()
+
+    def update_many(self, values):
+        # One sort-and-promote pass per level instead of one check per value
+        self.levels[0].extend(values)
+        self.n += len(values)
+        if len(self.levels[0]) >= self._room:
+            self._compact()
+
+    def _weighted(self):
+        return sorted((v, 1 << h) for h, level in enumerate(self.levels) for v in level)
+
+    def quantile(self, q):
+        items = self._weighted()
+        if not items:
+            return None
+        target = q * sum(w for _, w in items)
+        seen = 0
+        for v, w in items:
+            seen += w
+            if seen >= target:
+                return v
+        return items[-1][0]
+
+    def to_dict(self):
+        return {"k": self.k, "n": self.n, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["k"])
+        sketch.n = data["n"]
+        sketch.levels = data["levels"]
+        sketch._room = sketch._capacity(0)
+        return sketch
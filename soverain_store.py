@@ -0,0 +1,281 @@
+# ======================= Soverain Store: Local Profile Persistence =======================
+#
+# A small SQLite store that mirrors what the app keeps in session state, so that
+# profiles survive a session and background jobs (nudges, reports) can see them.
+# Only the standard library is used; point SOVERAIN_DB at a shared path to use it
+# from several processes.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+import soverain_cohort
+import soverain_compare
+import soverain_events
+import soverain_journal
+import soverain_tags
+import soverain_trends
+
+DB_PATH = os.environ.get("SOVERAIN_DB", "soverain.db")
+
+# Session-state lists an entry can belong to
+ENTRY_KINDS = ("scenarios", "assessments", "reflections")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    goal TEXT NOT NULL DEFAULT '—'
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    saved TEXT NOT NULL,
+    score REAL,
+    g REAL,
+    payload TEXT NOT NULL,
+    hash TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_by_profile ON entries(profile, id);
+CREATE TABLE IF NOT EXISTS profile_versions (
+    profile TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pathway_progress (
+    profile TEXT NOT NULL,
+    pathway TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    PRIMARY KEY (profile, pathway)
+);
+"""
+
+_local = threading.local()
+
+
+def connect(path=None):
+    # One connection per thread and path; Streamlit runs each session in its own thread
+    path = path or DB_PATH
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    if path not in conns:
+        conn = sqlite3.connect(path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MB; keeps bulk imports off the disk
+        versioned = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'profile_versions'"
+        ).fetchone()
+        conn.executescript(SCHEMA)
+        if "hash" not in [c[1] for c in conn.execute("PRAGMA table_info(entries)")]:
+            conn.execute("ALTER TABLE entries ADD COLUMN hash TEXT")
+        soverain_cohort.setup(conn)
+        soverain_compare.setup(conn)
+        soverain_events.setup(conn)
+        if not versioned:
+            # Versions continue from each profile's latest event id, which is what stored
+            # reports were versioned by before this table existed
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO profile_versions(profile, version) "
+                    "SELECT name, COALESCE((SELECT MAX(id) FROM events WHERE stream = name), 0) FROM profiles"
+                )
+        soverain_trends.setup(conn)
+        soverain_tags.setup(conn)
+        soverain_journal.setup(conn, entry_payload, entry_hash)
+        conns[path] = conn
+    return conns[path]
+
+
+def empty_profile(goal="—"):
+    return {
+        "scenarios": [],
+        "assessments": [],
+        "reflections": [],
+        "pathways": {},
+        "goal": goal,
+        "last_score": "—"
+    }
+
+
+def entry_payload(entry):
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def entry_hash(kind, payload):
+    # Content hash of an entry; identical entries in the same list hash the same, so
+    # repeats are told apart by how many of them a profile holds (see entry_hashes)
+    return hashlib.sha1(f"{kind}\n{payload}".encode()).hexdigest()
+
+
+def bump_version(conn, profile):
+    # Called inside every save transaction; views cached for the old version are not served again
+    conn.execute(
+        "INSERT INTO profile_versions(profile, version) VALUES (?, 1) "
+        "ON CONFLICT(profile) DO UPDATE SET version = version + 1",
+        (profile,)
+    )
+
+
+def data_version(profile, conn=None):
+    # A number that rises with every save to the profile (0 before the first)
+    conn = conn or connect()
+    row = conn.execute("SELECT version FROM profile_versions WHERE profile = ?", (profile,)).fetchone()
+    return row[0] if row else 0
+
+
+def data_versions(conn=None):
+    conn = conn or connect()
+    return dict(conn.execute("SELECT profile, version FROM profile_versions"))
+
+
+def save_entry(profile, kind, entry, conn=None):
+    # Reflection text is kept compressed in the journal table; the hash covers the full entry
+    conn = conn or connect()
+    stored, text = soverain_journal.split(kind, entry)
+    with conn:
+        conn.execute(
+            "INSERT OR IGNORE INTO profiles(name) VALUES (?)", (profile,)
+        )
+        cur = conn.execute(
+            "INSERT INTO entries(profile, kind, saved, score, g, payload, hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (profile, kind, entry["Saved"], entry.get("Score"), entry.get("G"),
+             entry_payload(stored), entry_hash(kind, entry_payload(entry)))
+        )
+        if text is not None:
+            soverain_journal.store(conn, profile, [(cur.lastrowid, text)])
+        bump_version(conn, profile)
+        soverain_events.append(conn, profile, "entry_saved", {"kind": kind, "entry_id": cur.lastrowid})
+        soverain_cohort.record(conn, profile, kind, entry)
+        soverain_compare.record(conn, profile, kind, entry)
+        soverain_trends.record(conn, profile, kind, entry)
+        soverain_tags.record(conn, profile, kind, entry, cur.lastrowid)
+    return cur.lastrowid
+
+
+def save_entries(profile, items, conn=None):
+    # Bulk save_entry for imports: items are (kind, entry, payload, hash) tuples
+    save_batches({profile: items}, conn)
+
+
+def save_batches(batches, conn=None):
+    # save_entries for several profiles ({profile: items}) in one transaction: all or nothing
+    conn = conn or connect()
+    batches = {profile: items for profile, items in batches.items() if items}
+    if not batches:
+        return
+    with conn:
+        for profile, items in batches.items():
+            _insert_entries(conn, profile, items)
+
+
+def _insert_entries(conn, profile, items):
+    # Called inside a save transaction
+    split = [soverain_journal.split(kind, entry) for kind, entry, _, _ in items]
+    conn.execute(
+        "INSERT OR IGNORE INTO profiles(name) VALUES (?)", (profile,)
+    )
+    conn.executemany(
+        "INSERT INTO entries(profile, kind, saved, score, g, payload, hash) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(profile, kind, entry["Saved"], entry.get("Score"), entry.get("G"),
+          payload if text is None else entry_payload(stored), h)
+         for (kind, entry, payload, h), (stored, text) in zip(items, split)]
+    )
+    # One event per batch; ids are consecutive since the transaction holds the write lock
+    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    first_id = last_id - len(items) + 1
+    soverain_journal.store(conn, profile, [
+        (first_id + i, text) for i, (_, text) in enumerate(split) if text is not None
+    ])
+    counts = {}
+    for kind, _, _, _ in items:
+        counts[kind] = counts.get(kind, 0) + 1
+    bump_version(conn, profile)
+    soverain_events.append(conn, profile, "entries_imported", {
+        "counts": counts, "first_id": first_id, "last_id": last_id
+    })
+    pairs = [(kind, entry) for kind, entry, _, _ in items]
+    soverain_cohort.record_many(conn, profile, pairs)
+    soverain_compare.record_many(conn, profile, pairs)
+    soverain_trends.record_many(conn, profile, pairs)
+    soverain_tags.record_many(conn, profile, pairs, first_id)
+
+
+def entry_hashes(profile, conn=None):
+    # {content hash: number of entries with it} for a profile. Entries saved before
+    # hashing get their payload rewritten in canonical form and hashed on first use.
+    conn = conn or connect()
+    missing = conn.execute(
+        "SELECT id, kind, payload FROM entries WHERE profile = ? AND hash IS NULL", (profile,)
+    ).fetchall()
+    if missing:
+        updates = []
+        for i, kind, payload in missing:
+            payload = entry_payload(json.loads(payload))
+            updates.append((payload, entry_hash(kind, payload), i))
+        with conn:
+            conn.executemany("UPDATE entries SET payload = ?, hash = ? WHERE id = ?", updates)
+    return dict(conn.execute("SELECT hash, COUNT(*) FROM entries WHERE profile = ? GROUP BY hash", (profile,)))
+
+
+def save_goal(profile, goal, conn=None):
+    conn = conn or connect()
+    with conn:
+        conn.execute(
+            "INSERT INTO profiles(name, goal) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET goal = excluded.goal",
+            (profile, goal)
+        )
+        bump_version(conn, profile)
+        soverain_events.append(conn, profile, "goal_changed", {"goal": goal})
+
+
+def save_catalog_entry(entry, conn=None):
+    # Scripture Catalog Editor additions are shared by every profile
+    conn = conn or connect()
+    with conn:
+        soverain_events.append(conn, soverain_events.CATALOG_STREAM, "catalog_added", {"entry": list(entry)})
+
+
+def load_profile_info(profile, conn=None):
+    # Goal and pathway progress without the entries
+    conn = conn or connect()
+    row = conn.execute("SELECT goal FROM profiles WHERE name = ?", (profile,)).fetchone()
+    data = empty_profile(row[0] if row else "—")
+    data["pathways"] = dict(conn.execute(
+        "SELECT pathway, step FROM pathway_progress WHERE profile = ?", (profile,)
+    ).fetchall())
+    return data
+
+
+def load_profile(profile, conn=None):
+    # Reflections come back with their journal snippet and a TextId, not the full text
+    conn = conn or connect()
+    data = load_profile_info(profile, conn)
+    for i, kind, payload, snippet in conn.execute(
+        "SELECT e.id, e.kind, e.payload, j.snippet FROM entries e LEFT JOIN journal j ON j.entry_id = e.id "
+        "WHERE e.profile = ? ORDER BY e.id", (profile,)
+    ):
+        entry = json.loads(payload)
+        if snippet is not None:
+            entry["Snippet"], entry["TextId"] = snippet, i
+        data[kind].append(entry)
+    return data
+
+
+def save_pathway_step(profile, pathway, step, conn=None):
+    conn = conn or connect()
+    with conn:
+        conn.execute(
+            "INSERT INTO pathway_progress(profile, pathway, step) VALUES (?, ?, ?) "
+            "ON CONFLICT(profile, pathway) DO UPDATE SET step = excluded.step",
+            (profile, pathway, step)
+        )
+        bump_version(conn, profile)
+
+
+def list_profiles(conn=None):
+    conn = conn or connect()
+    return [name for (name,) in conn.execute("SELECT name FROM profiles ORDER BY name")]
@@ -0,0 +1,267 @@
+# ======================= Soverain Tags: Normalized Tag Taxonomy =======================
+#
+# Journal tags are free text ("Obedience, #prayer; Psalms 23"). They are parsed once:
+# split on commas, semicolons and "#", lower-cased, trimmed, and mapped through
+# tag_aliases.csv (Alias,Tag) so "forgive", "forgiving" and "Forgiveness" are one tag.
+# Parsed tag strings are cached per process, so reruns never re-split a tag string.
+#
+# Every saved entry with tags updates, in the same transaction:
+#   - tags          one interned id per canonical tag
+#   - entry_tags    which tags each entry carries
+#   - tag_counts    per profile and tag: entries, scored entries, score total
+#   - tag_pairs     per profile: how often two tags appear on the same entry
+#   - tag_profiles  per profile totals, the baseline for low-alignment themes
+#
+#   python soverain_tags.py --rebuild    # backfill from the entries table
+
+import argparse
+import csv
+import json
+import os
+import re
+from functools import lru_cache
+
+ALIASES_PATH = os.environ.get(
+    "SOVERAIN_TAG_ALIASES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tag_aliases.csv")
+)
+
+# A theme is "linked to low alignment" when its average is this far below the profile's
+LOW_THEME_MARGIN = 1.0
+LOW_THEME_MIN_ENTRIES = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    entry_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (entry_id, tag_id)
+);
+CREATE TABLE IF NOT EXISTS tag_counts (
+    profile TEXT NOT NULL,
+    tag_id INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    scored INTEGER NOT NULL,
+    total REAL NOT NULL,
+    PRIMARY KEY (profile, tag_id)
+);
+CREATE TABLE IF NOT EXISTS tag_pairs (
+    profile TEXT NOT NULL,
+    a INTEGER NOT NULL,
+    b INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (profile, a, b)
+);
+CREATE TABLE IF NOT EXISTS tag_profiles (
+    profile TEXT PRIMARY KEY,
+    n INTEGER NOT NULL,
+    scored INTEGER NOT NULL,
+    total REAL NOT NULL
+);
+"""
+
+
+def setup(conn):
+    # A store whose entries predate the tag tables is backfilled once
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tag_counts'"
+    ).fetchone()
+    conn.executescript(SCHEMA)
+    if not existed:
+        rebuild(conn)
+
+
+@lru_cache(maxsize=4)
+def _load_aliases(path, mtime):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return {_clean(row["Alias"]): _clean(row["Tag"]) for row in csv.DictReader(f)}
+
+
+def aliases(path=None):
+    path = path or ALIASES_PATH
+    if not os.path.exists(path):
+        return {}
+    return _load_aliases(path, os.stat(path).st_mtime_ns)
+
+
+def _clean(text):
+    return re.sub(r"\s+", " ", text).strip(" \t.,;:!?\"'()[]").lower()
+
+
+@lru_cache(maxsize=65536)
+def _canonical(raw, alias_version):
+    names = []
+    alias = aliases()
+    for part in re.split(r"[,;#\n]", raw):
+        name = _clean(part)
+        name = alias.get(name, name)
+        if name and name not in names:
+            names.append(name)
+    return tuple(names)
+
+
+def canonical_tags(raw):
+    # Canonical tag names of a tag string (or list), in the order written
+    if not raw:
+        return ()
+    if isinstance(raw, (list, tuple)):
+        raw = ",".join(map(str, raw))
+    path = ALIASES_PATH
+    return _canonical(raw, os.stat(path).st_mtime_ns if os.path.exists(path) else 0)
+
+
+def intern(conn, names):
+    # Tag ids for canonical names, creating any that are new
+    conn.executemany("INSERT OR IGNORE INTO tags(name) VALUES (?)", [(n,) for n in names])
+    ids = {}
+    for i in range(0, len(names), 500):
+        chunk = names[i:i + 500]
+        ids.update(conn.execute(
+            f"SELECT name, id FROM tags WHERE name IN ({', '.join('?' * len(chunk))})", chunk
+        ).fetchall())
+    return [ids[n] for n in names]
+
+
+def record(conn, profile, kind, entry, entry_id):
+    # Called inside the store's save transaction
+    record_many(conn, profile, [(kind, entry)], entry_id)
+
+
+def record_many(conn, profile, items, first_id):
+    # Items are (kind, entry) pairs whose entry ids run from first_id upwards
+    tagged = [(first_id + i, entry, canonical_tags(entry.get("Tags")))
+              for i, (_, entry) in enumerate(items)]
+    tagged = [t for t in tagged if t[2]]
+    if not tagged:
+        return
+    names = sorted({n for _, _, entry_names in tagged for n in entry_names})
+    ids = dict(zip(names, intern(conn, names)))
+
+    links, counts, pairs = [], {}, {}
+    scored = total = 0
+    for entry_id, entry, entry_names in tagged:
+        tag_ids = [ids[n] for n in entry_names]
+        score = entry.get("Score")
+        if score is not None:
+            scored += 1
+            total += score
+        for t in tag_ids:
+            links.append((entry_id, t))
+            c = counts.setdefault(t, [0, 0, 0.0])
+            c[0] += 1
+            if score is not None:
+                c[1] += 1
+                c[2] += score
+        ordered = sorted(tag_ids)
+        for i, a in enumerate(ordered):
+            for b in ordered[i + 1:]:
+                pairs[a, b] = pairs.get((a, b), 0) + 1
+
+    conn.executemany("INSERT OR IGNORE INTO entry_tags(entry_id, tag_id) VALUES (?, ?)", links)
+    conn.executemany(
+        "INSERT INTO tag_counts(profile, tag_id, n, scored, total) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(profile, tag_id) DO UPDATE SET "
+        "n = n + excluded.n, scored = scored + excluded.scored, total = total + excluded.total",
+        [(profile, t, n, s, tot) for t, (n, s, tot) in counts.items()]
+    )
+    conn.executemany(
+        "INSERT INTO tag_pairs(profile, a, b, n) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(profile, a, b) DO UPDATE SET n = n + excluded.n",
+        [(profile, a, b, n) for (a, b), n in pairs.items()]
+    )
+    conn.execute(
+        "INSERT INTO tag_profiles(profile, n, scored, total) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(profile) DO UPDATE SET "
+        "n = n + excluded.n, scored = scored + excluded.scored, total = total + excluded.total",
+        (profile, len(tagged), scored, total)
+    )
+
+
+def rebuild(conn, chunk_size=50000):
+    # Recompute everything from the entries table, e.g. after editing tag_aliases.csv
+    with conn:
+        for table in ("entry_tags", "tag_counts", "tag_pairs", "tag_profiles"):
+            conn.execute(f"DELETE FROM {table}")
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, profile, kind, payload FROM entries WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            for entry_id, profile, kind, payload in rows:
+                if '"Tags"' in payload:
+                    record_many(conn, profile, [(kind, json.loads(payload))], entry_id)
+
+
+def tag_cloud(conn, profile, limit=40):
+    # [{Tag, Entries, Average}] by use, most used first
+    return [
+        {"Tag": name, "Entries": n, "Average": round(total / scored, 2) if scored else None}
+        for name, n, scored, total in conn.execute(
+            "SELECT t.name, c.n, c.scored, c.total FROM tag_counts c JOIN tags t ON t.id = c.tag_id "
+            "WHERE c.profile = ? ORDER BY c.n DESC, t.name LIMIT ?",
+            (profile, limit)
+        )
+    ]
+
+
+def related_tags(conn, profile, name, limit=3):
+    # Tags that most often appear alongside `name`
+    return [other for other, _ in conn.execute(
+        """
+        SELECT t.name, p.n FROM tag_pairs p
+        JOIN tags me ON me.name = ?
+        JOIN tags t ON t.id = CASE WHEN p.a = me.id THEN p.b ELSE p.a END
+        WHERE p.profile = ? AND (p.a = me.id OR p.b = me.id)
+        ORDER BY p.n DESC, t.name LIMIT ?
+        """,
+        (name, profile, limit)
+    )]
+
+
+def low_alignment_themes(conn, profile, margin=LOW_THEME_MARGIN, min_entries=LOW_THEME_MIN_ENTRIES):
+    # Tags whose average score sits at least `margin` below the profile's tagged average
+    row = conn.execute("SELECT scored, total FROM tag_profiles WHERE profile = ?", (profile,)).fetchone()
+    if not row or not row[0]:
+        return []
+    baseline = row[1] / row[0]
+    themes = []
+    for name, scored, total in conn.execute(
+        "SELECT t.name, c.scored, c.total FROM tag_counts c JOIN tags t ON t.id = c.tag_id "
+        "WHERE c.profile = ? AND c.scored >= ? AND c.total < (? - ?) * c.scored "
+        "ORDER BY c.total / c.scored, t.name",
+        (profile, min_entries, baseline, margin)
+    ):
+        themes.append({
+            "Tag": name,
+            "Average": round(total / scored, 2),
+            "Baseline": round(baseline, 2),
+            "Entries": scored,
+            "Often With": related_tags(conn, profile, name),
+        })
+    return themes
+
+
+def main():
+    import soverain_store
+
+    parser = argparse.ArgumentParser(description="Maintain Soverain tag statistics.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from all entries")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    if args.rebuild:
+        rebuild(conn)
+    tags = conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0]
+    tagged = conn.execute("SELECT COUNT(DISTINCT entry_id) FROM entry_tags").fetchone()[0]
+    print(json.dumps({"tags": tags, "tagged_entries": tagged}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# ======================= Soverain Trends: Per-Pillar Rolling Trends =======================
+#
+# Every saved entry updates, in the same transaction, one small row per (profile, pillar)
+# for the C, H and F pillars and the overall Score:
+#   - fast and slow exponentially weighted averages
+#   - the last WINDOW values, with rolling means over the last SHORT_WINDOW and WINDOW
+#   - the current and best alignment streak (consecutive values at or above "Aligned")
+#   - a two-sided CUSUM against the slow average that flags a sustained shift up or down
+# plus each profile's last activity date. Each save touches a fixed number of rows and
+# values, however long the history, and readers (the Trends page, Module 14 and the
+# nudge scheduler) read these rows instead of the entries.
+#
+#   python soverain_trends.py --rebuild    # backfill from the entries table
+
+import argparse
+import json
+
+PILLARS = ("C", "H", "F", "Score")
+
+FAST_ALPHA = 0.3
+SLOW_ALPHA = 0.05
+SHORT_WINDOW = 5  # the nudges' "recent average"
+WINDOW = 30
+
+# Pillars are 0–1 and Score is 0–10; thresholds below are in pillar units
+SCALE = {"C": 1.0, "H": 1.0, "F": 1.0, "Score": 10.0}
+ALIGNED = 0.7  # label_from_score's "Aligned" cut-off
+CUSUM_SLACK = 0.05
+CUSUM_LIMIT = 0.4
+WARMUP = 5  # entries before change-points are flagged
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_state (
+    profile TEXT NOT NULL,
+    pillar TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    last REAL NOT NULL,
+    fast REAL NOT NULL,
+    slow REAL NOT NULL,
+    short_mean REAL NOT NULL,
+    long_mean REAL NOT NULL,
+    window TEXT NOT NULL,
+    streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    cusum_up REAL NOT NULL,
+    cusum_down REAL NOT NULL,
+    change TEXT,
+    change_at TEXT,
+    PRIMARY KEY (profile, pillar)
+);
+CREATE TABLE IF NOT EXISTS trend_activity (
+    profile TEXT PRIMARY KEY,
+    last_saved TEXT NOT NULL,
+    entries INTEGER NOT NULL
+);
+"""
+
+COLUMNS = ("n", "last", "fast", "slow", "short_mean", "long_mean", "window",
+           "streak", "best_streak", "cusum_up", "cusum_down", "change", "change_at")
+
+
+def setup(conn):
+    # A store whose entries predate the trend tables is backfilled once
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trend_state'"
+    ).fetchone()
+    conn.executescript(SCHEMA)
+    if not existed:
+        rebuild(conn)
+
+
+def pillar_values(kind, entry):
+    # (pillar, value) pairs an entry contributes; Score follows the nudges' recent average,
+    # which only counts scenarios and assessments
+    for pillar in PILLARS:
+        if pillar == "Score" and kind not in ("scenarios", "assessments"):
+            continue
+        value = entry.get(pillar)
+        if value is not None:
+            yield pillar, float(value)
+
+
+def new_state(value):
+    return {
+        "n": 0, "last": value, "fast": value, "slow": value,
+        "short_mean": value, "long_mean": value, "window": [],
+        "streak": 0, "best_streak": 0, "cusum_up": 0.0, "cusum_down": 0.0,
+        "change": None, "change_at": None,
+    }
+
+
+def update(state, pillar, value, saved):
+    # Fold one value into a pillar's state
+    scale = SCALE[pillar]
+    state["n"] += 1
+    state["last"] = value
+    state["fast"] += FAST_ALPHA * (value - state["fast"])
+
+    # CUSUM on deviations from the slow average, taken before it absorbs this value
+    deviation = (value - state["slow"]) / scale
+    state["cusum_up"] = max(0.0, state["cusum_up"] + deviation - CUSUM_SLACK)
+    state["cusum_down"] = max(0.0, state["cusum_down"] - deviation - CUSUM_SLACK)
+    if state["n"] > WARMUP and max(state["cusum_up"], state["cusum_down"]) > CUSUM_LIMIT:
+        state["change"] = "up" if state["cusum_up"] > state["cusum_down"] else "down"
+        state["change_at"] = saved
+        state["cusum_up"] = state["cusum_down"] = 0.0
+        state["slow"] = state["fast"]  # restart the baseline at the new level
+    else:
+        state["slow"] += SLOW_ALPHA * (value - state["slow"])
+
+    window = state["window"]
+    window.append(value)
+    if len(window) > WINDOW:
+        del window[0]
+    recent = window[-SHORT_WINDOW:]
+    state["short_mean"] = sum(recent) / len(recent)
+    state["long_mean"] = sum(window) / len(window)
+
+    state["streak"] = state["streak"] + 1 if value >= ALIGNED * scale else 0
+    state["best_streak"] = max(state["best_streak"], state["streak"])
+    return state
+
+
+def _load(conn, profile):
+    states = {}
+    for row in conn.execute(
+        f"SELECT pillar, {', '.join(COLUMNS)} FROM trend_state WHERE profile = ?", (profile,)
+    ):
+        state = dict(zip(COLUMNS, row[1:]))
+        state["window"] = json.loads(state["window"])
+        states[row[0]] = state
+    return states
+
+
+def _store(conn, profile, states):
+    conn.executemany(
+        f"INSERT OR REPLACE INTO trend_state(profile, pillar, {', '.join(COLUMNS)}) "
+        f"VALUES (?, ?, {', '.join('?' * len(COLUMNS))})",
+        [(profile, pillar, *(json.dumps(s[c]) if c == "window" else s[c] for c in COLUMNS))
+         for pillar, s in states.items()]
+    )
+
+
+def record(conn, profile, kind, entry):
+    # Called inside the store's save transaction
+    record_many(conn, profile, [(kind, entry)])
+
+
+def record_many(conn, profile, items):
+    # Items are folded in save order; one load and store per batch
+    if not items:
+        return
+    states = _load(conn, profile)
+    for kind, entry in items:
+        for pillar, value in pillar_values(kind, entry):
+            if pillar not in states:
+                states[pillar] = new_state(value)
+            update(states[pillar], pillar, value, entry["Saved"])
+    _store(conn, profile, states)
+    conn.execute(
+        "INSERT INTO trend_activity(profile, last_saved, entries) VALUES (?, ?, ?) "
+        "ON CONFLICT(profile) DO UPDATE SET "
+        "last_saved = MAX(last_saved, excluded.last_saved), entries = entries + excluded.entries",
+        (profile, max(entry["Saved"] for _, entry in items), len(items))
+    )
+
+
+def rebuild(conn, chunk_size=50000):
+    # Recompute every profile's trends from the entries table, in save order
+    with conn:
+        conn.execute("DELETE FROM trend_state")
+        conn.execute("DELETE FROM trend_activity")
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, profile, kind, payload FROM entries WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            by_profile = {}
+            for _, profile, kind, payload in rows:
+                by_profile.setdefault(profile, []).append((kind, json.loads(payload)))
+            for profile, items in by_profile.items():
+                record_many(conn, profile, items)
+
+
+def last_activity(conn, profile):
+    row = conn.execute("SELECT last_saved FROM trend_activity WHERE profile = ?", (profile,)).fetchone()
+    return row[0] if row else None
+
+
+def pillar_trends(conn, profile):
+    # {pillar: state} for the pillars this profile has values for
+    return _load(conn, profile)
+
+
+def main():
+    import soverain_store
+
+    parser = argparse.ArgumentParser(description="Maintain Soverain pillar trends.")
+    parser.add_argument("--db", default=soverain_store.DB_PATH, help="profile store path")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from all entries")
+    args = parser.parse_args()
+
+    conn = soverain_store.connect(args.db)
+    if args.rebuild:
+        rebuild(conn)
+    profiles = conn.execute("SELECT COUNT(*) FROM trend_activity").fetchone()[0]
+    changes = conn.execute("SELECT COUNT(*) FROM trend_state WHERE change IS NOT NULL").fetchone()[0]
+    print(json.dumps({"profiles": profiles, "flagged_pillars": changes}))
+
+
+if __name__ == "__main__":
+    main()
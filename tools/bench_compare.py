@@ -0,0 +1,102 @@
+# ======================= Profile Comparison Benchmark =======================
+#
+# Seeds a throwaway store with `--profiles` profiles saving `--per-day` scored entries a
+# day for `--years` years, then times the Profile Comparison query on the daily and the
+# weekly grid against loading every profile and resampling its entries directly.
+#
+#   python tools/bench_compare.py                         # 20 profiles, 5 years
+#   python tools/bench_compare.py --profiles 50 --per-day 5
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+import soverain_store
+from soverain_compare import compare, summary
+from soverain_core import A_from_G, G_from_CHF, label_from_score, score_from_A
+
+
+def seed(conn, profiles, years, per_day, rng):
+    start = date.today() - timedelta(days=365 * years)
+    for p in range(profiles):
+        items = []
+        drift = rng.uniform(-0.2, 0.2)
+        for d in range(365 * years):
+            saved = (start + timedelta(days=d)).isoformat()
+            for _ in range(rng.randint(0, per_day * 2)):
+                C, H, F = (round(min(1, max(0, rng.gauss(0.7 + drift * d / (365 * years), 0.15))), 2) for _ in range(3))
+                G = G_from_CHF(C, H, F)
+                score = score_from_A(A_from_G(G))
+                entry = {"Book": "Luke", "C": C, "H": H, "F": F, "G": G, "Score": score,
+                         "Label": label_from_score(score), "Saved": saved}
+                payload = soverain_store.entry_payload(entry)
+                items.append(("scenarios", entry, payload, soverain_store.entry_hash("scenarios", payload)))
+        for i in range(0, len(items), 20000):
+            soverain_store.save_entries(f"Profile {p}", items[i:i + 20000], conn)
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - started)
+    return result, round(statistics.median(times) * 1000, 1)
+
+
+def direct(conn, profiles, freq):
+    # Without the daily table: load every profile and resample its entries
+    frames = []
+    for p in profiles:
+        data = soverain_store.load_profile(p, conn)
+        df = pd.DataFrame([(e["Saved"], e["Score"]) for e in data["scenarios"]], columns=["Date", "Score"])
+        df["Date"] = pd.to_datetime(df["Date"])
+        frames.append(df.set_index("Date")["Score"].resample(freq).mean().rename(p))
+    return pd.concat(frames, axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Profile Comparison view.")
+    parser.add_argument("--profiles", type=int, default=20)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--per-day", type=int, default=2, help="average entries per profile per day")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = soverain_store.connect(os.path.join(tmp, "bench.db"))
+        seed(conn, args.profiles, args.years, args.per_day, random.Random(args.seed))
+        profiles = soverain_store.list_profiles(conn)
+        report = {
+            "profiles": len(profiles),
+            "entries": conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0],
+            "daily_rows": conn.execute("SELECT COUNT(*) FROM daily_values WHERE metric = 'Score'").fetchone()[0],
+        }
+        for name, freq in (("daily", "D"), ("weekly", "W")):
+            (values, counts), ms = timed(lambda: compare(conn, profiles, "Score", freq), args.repeat)
+            _, summary_ms = timed(lambda: summary(values, counts), args.repeat)
+            report[f"{name}_grid"] = list(values.shape)
+            report[f"{name}_ms"] = ms
+            report[f"{name}_summary_ms"] = summary_ms
+        expected, report["direct_weekly_ms"] = timed(lambda: direct(conn, profiles, "W-SUN"), 1)
+        values, _ = compare(conn, profiles, "Score", "W")
+        # The direct weeks are labelled by their Sunday, the grid's by their Monday
+        report["max_weekly_difference"] = float((values - expected.set_axis(values.index)).abs().max().max())
+        conn.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# ======================= Journal Storage Benchmark =======================
+#
+# Builds a synthetic journal (default 50,000 reflections from a Zipf-distributed
+# vocabulary) twice in throwaway stores: once with the text inline in each entry's
+# payload, as the store kept it before, and once through soverain_store, which keeps it
+# compressed in the journal table. Reports storage, the memory a loaded profile holds,
+# and the time to load, search and open one entry.
+#
+#   python tools/bench_journal.py                     # defaults below
+#   python tools/bench_journal.py --entries 10000 --words 120
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import soverain_journal
+import soverain_store
+
+PROFILE = "Journaler"
+COMMON = ("the and to of i a in that is was for it with my me be on not he as you do at this "
+          "but his by from they we say her she or an will what all would there their so up out "
+          "if about who get which go when make can like time just him know take people into "
+          "year your good some could them see other than then now look only come its over think "
+          "also back after use two how our work first well way even new want because any these "
+          "give day most us").split()
+FAITH = ("god lord jesus prayer pray prayed grace mercy faith hope love peace forgive forgiveness "
+         "obedience obey trust scripture psalm verse heart spirit holy worship thankful grateful "
+         "repent sin strength wisdom patience kindness gentle humble humility joy fear doubt "
+         "surrender church family neighbor serve service calling purpose light darkness truth "
+         "promise covenant blessing blessed praise healing comfort struggle temptation").split()
+
+
+def synthetic_texts(n, words, seed):
+    # Reflections of about `words` words, drawn Zipf-like from common and faith vocabularies
+    rng = random.Random(seed)
+    rare = [f"{rng.choice('bcdfghklmnprstvw')}{rng.choice('aeiou')}{rng.choice('lmnrst')}{rng.choice('aeiouy')}{rng.choice(['', 'ing', 'ed', 'ness'])}"
+            for _ in range(4000)]
+    vocab = COMMON + FAITH + rare
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    texts = []
+    for _ in range(n):
+        length = max(5, int(rng.gauss(words, words / 3)))
+        drawn = rng.choices(vocab, weights, k=length)
+        sentences, start = [], 0
+        while start < length:
+            end = start + rng.randint(6, 16)
+            sentences.append(" ".join(drawn[start:end]).capitalize() + ".")
+            start = end
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def reflections(texts, seed):
+    rng = random.Random(seed)
+    tags = ["obedience", "forgiveness", "prayer", "family", "work", "Psalm 23", "gratitude", "fear"]
+    return [{
+        "Text": text,
+        "Tags": ", ".join(rng.sample(tags, rng.randint(0, 2))),
+        "LinkedTo": "None",
+        "Score": None,
+        "G": None,
+        "Saved": f"20{20 + i * 6 // len(texts):02d}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+    } for i, text in enumerate(texts)]
+
+
+def db_bytes(conn):
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
+    return conn.execute("PRAGMA page_count").fetchone()[0] * conn.execute("PRAGMA page_size").fetchone()[0]
+
+
+def loaded_bytes(load):
+    # Memory still held by a loaded profile, measured with tracemalloc
+    tracemalloc.start()
+    started = time.perf_counter()
+    data = load()
+    seconds = time.perf_counter() - started
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return data, held, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure compressed journal storage.")
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--words", type=int, default=90, help="average words per reflection")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    texts = synthetic_texts(args.entries, args.words, args.seed)
+    entries = reflections(texts, args.seed)
+    raw = sum(len(t.encode()) for t in texts)
+    report = {"entries": args.entries, "text_mb": round(raw / 2**20, 2)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Before: the text inline in each payload
+        inline = sqlite3.connect(os.path.join(tmp, "inline.db"))
+        inline.executescript(soverain_store.SCHEMA)
+        with inline:
+            inline.executemany(
+                "INSERT INTO entries(profile, kind, saved, payload, hash) VALUES (?, 'reflections', ?, ?, ?)",
+                [(PROFILE, e["Saved"], p, soverain_store.entry_hash("reflections", p))
+                 for e, p in zip(entries, map(soverain_store.entry_payload, entries))]
+            )
+
+        # After: through the store
+        conn = soverain_store.connect(os.path.join(tmp, "journal.db"))
+        items = []
+        for e in entries:
+            payload = soverain_store.entry_payload(e)
+            items.append(("reflections", e, payload, soverain_store.entry_hash("reflections", payload)))
+        started = time.perf_counter()
+        for i in range(0, len(items), 10000):
+            soverain_store.save_entries(PROFILE, items[i:i + 10000], conn)
+        report["save_entries_per_s"] = round(len(items) / (time.perf_counter() - started))
+
+        plain = sum(len(soverain_journal._compress(t, None)) for t in texts)
+        with_dict = conn.execute("SELECT SUM(LENGTH(body)) FROM journal").fetchone()[0]
+        report["text_deflate_mb"] = round(plain / 2**20, 2)
+        report["text_deflate_dict_mb"] = round(with_dict / 2**20, 2)
+        report["db_inline_mb"] = round(db_bytes(inline) / 2**20, 2)
+        report["db_journal_mb"] = round(db_bytes(conn) / 2**20, 2)
+
+        _, before, before_s = loaded_bytes(lambda: [
+            json.loads(p) for (p,) in inline.execute("SELECT payload FROM entries WHERE profile = ? ORDER BY id", (PROFILE,))
+        ])
+        profile, after, after_s = loaded_bytes(lambda: soverain_store.load_profile(PROFILE, conn))
+        report["loaded_inline_mb"] = round(before / 2**20, 2)
+        report["loaded_journal_mb"] = round(after / 2**20, 2)
+        report["load_inline_ms"] = round(before_s * 1000)
+        report["load_journal_ms"] = round(after_s * 1000)
+
+        started = time.perf_counter()
+        hits = soverain_journal.matching_ids(conn, PROFILE, "forgive prayer")
+        report["search_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        report["search_hits"] = len(hits)
+        expected = {i + 1 for i, t in enumerate(texts) if {"forgive", "prayer"} <= {w.strip(".").lower() for w in t.split()}}
+        if not expected <= hits:
+            raise RuntimeError("Journal search missed entries containing every search word.")
+
+        sample = random.Random(args.seed).sample(profile["reflections"], 200)
+        started = time.perf_counter()
+        for e in sample:
+            if soverain_journal.full_text(conn, e) != texts[e["TextId"] - 1]:
+                raise RuntimeError(f"Entry {e['TextId']} did not decompress to its text.")
+        report["open_entry_ms"] = round((time.perf_counter() - started) * 1000 / len(sample), 3)
+        inline.close()
+        conn.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
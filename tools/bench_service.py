@@ -0,0 +1,140 @@
+# ======================= Scoring Service Benchmark =======================
+#
+# Starts soverain_service against a throwaway store in this process and drives it
+# with keep-alive clients on the same event loop (so client and server share one core).
+# Reports records per second and request latency for batch scoring, batch ingestion and
+# concurrent profile summaries, then checks that every ingested record was stored.
+#
+#   python tools/bench_service.py                       # defaults below
+#   python tools/bench_service.py --batch 5000 --clients 8 --requests 20
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import soverain_store
+from soverain_service import Service
+
+
+class Client:
+    # Minimal keep-alive HTTP/1.1 JSON client
+
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+
+    @classmethod
+    async def open(cls, port):
+        return cls(*await asyncio.open_connection("127.0.0.1", port))
+
+    async def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+        )
+        await self.writer.drain()
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        length = int(next(l.split(b":", 1)[1] for l in head.split(b"\r\n") if l.lower().startswith(b"content-length")))
+        return status, json.loads(await self.reader.readexactly(length))
+
+    def close(self):
+        self.writer.close()
+
+
+async def phase(port, clients, requests, make_request):
+    # Runs `requests` requests on each of `clients` connections; returns latencies (s) and wall time
+    latencies = []
+
+    async def run(c):
+        client = await Client.open(port)
+        for i in range(requests):
+            method, path, body = make_request(c, i)
+            started = time.perf_counter()
+            status, result = await client.request(method, path, body)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                raise RuntimeError(f"{path}: {status} {result}")
+        client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run(c) for c in range(clients)))
+    return latencies, time.perf_counter() - started
+
+
+def stats(name, latencies, wall, records):
+    ms = sorted(t * 1000 for t in latencies)
+    return {
+        "phase": name,
+        "requests": len(ms),
+        "records_per_s": round(records / wall),
+        "p50_ms": round(statistics.median(ms), 1),
+        "p95_ms": round(ms[min(len(ms) - 1, int(0.95 * len(ms)))], 1),
+    }
+
+
+async def bench(args, db):
+    rng = random.Random(args.seed)
+    service = Service(db, args.readers)
+    server = await service.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    triple = lambda: [round(rng.random(), 2) for _ in range(3)]
+    profiles = [f"Group {i}" for i in range(args.clients)]
+    report = []
+    try:
+        n = args.clients * args.requests * args.batch
+        lat, wall = await phase(port, args.clients, args.requests, lambda c, i: (
+            "POST", "/score", {"items": [triple() for _ in range(args.batch)]}
+        ))
+        report.append(stats("score", lat, wall, n))
+
+        lat, wall = await phase(port, args.clients, args.requests, lambda c, i: (
+            "POST", "/entries", {"records": [
+                dict(zip("CHF", triple()), profile=profiles[c]) for _ in range(args.batch)
+            ]}
+        ))
+        report.append(stats("ingest", lat, wall, n))
+
+        lat, wall = await phase(port, args.clients * 4, args.requests, lambda c, i: (
+            "GET", f"/profiles/{profiles[c % len(profiles)].replace(' ', '%20')}/summary", None
+        ))
+        report.append(stats("summary", lat, wall, len(lat)))
+
+        stored = await asyncio.get_running_loop().run_in_executor(
+            service.read_pool,
+            lambda: soverain_store.connect(db).execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        )
+        if stored != n:
+            raise RuntimeError(f"Ingested {n} records but the store holds {stored}.")
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Soverain scoring service.")
+    parser.add_argument("--batch", type=int, default=2000, help="records per request")
+    parser.add_argument("--clients", type=int, default=4, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=10, help="requests per connection")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = asyncio.run(bench(args, os.path.join(tmp, "bench.db")))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
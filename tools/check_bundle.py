@@ -0,0 +1,106 @@
+# ======================= Backup Round-Trip Check =======================
+#
+# Builds a throwaway profile with repeated entries (the same scenario and the same
+# reflection saved twice on one day), exports it, restores the bundle into an empty
+# profile and fails unless every kind comes back with the same count. Restoring the
+# bundle again must add nothing, and truncated or damaged bundles (including entries
+# that match their hash but aren't entries, and a malformed header) must be refused
+# with a BundleError the Legacy Builder can show.
+#
+#   python tools/check_bundle.py
+
+import io
+import json
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import soverain_store
+from soverain_bundle import FORMAT, MAGIC, BundleError, _encode_chunk, _write_frame, export_profile, restore_profile
+
+
+def counts(conn, profile):
+    data = soverain_store.load_profile(profile, conn)
+    return {kind: len(data[kind]) for kind in soverain_store.ENTRY_KINDS}
+
+
+def seed(conn, profile):
+    scenario = {"Book": "Luke", "Verse": "15:20", "Figure": "Father", "Situation": "Runs to his son",
+                "C": 0.85, "H": 0.85, "F": 0.85, "G": 0.85, "Score": 8.5, "Label": "Aligned", "Saved": "2026-01-05"}
+    reflection = {"Type": "Reflection", "Text": "Grace again today.", "Tags": "grace", "Saved": "2026-01-05"}
+    for _ in range(2):
+        soverain_store.save_entry(profile, "scenarios", dict(scenario), conn)
+        soverain_store.save_entry(profile, "reflections", dict(reflection), conn)
+    soverain_store.save_entry(profile, "assessments", {**scenario, "Type": "Assessment"}, conn)
+    soverain_store.save_goal(profile, "Walk in love daily", conn)
+
+
+def crafted(payloads, pathways=None):
+    # A well-formed bundle of reflections whose payloads match their hashes
+    f = io.BytesIO()
+    f.write(MAGIC)
+    _write_frame(f, {"format": FORMAT, "profile": "Crafted", "goal": "—", "pathways": pathways or {}})
+    _write_frame(f, _encode_chunk([("reflections", p, soverain_store.entry_hash("reflections", p)) for p in payloads]))
+    _write_frame(f, {"entries": len(payloads)})
+    return f.getvalue()
+
+
+DAMAGED = {
+    "payload_not_json": crafted(["{not json"]),
+    "payload_not_object": crafted(["[1,2]"]),
+    "payload_without_saved": crafted(['{"Text":"hi"}']),
+    "payload_bad_saved": crafted(['{"Saved":"yesterday","Text":"hi"}']),
+    "payload_bad_tags": crafted(['{"Saved":"2026-01-05","Tags":["a"]}']),
+    "pathways_not_dict": crafted([], pathways=["Love"]),
+    "pathway_step_not_int": crafted([], pathways={"Love": "3"}),
+}
+
+
+def refused(conn, data):
+    try:
+        restore_profile(io.BytesIO(data), into="Damaged", conn=conn)
+    except BundleError:
+        return True
+    except Exception:
+        return False
+    return False
+
+
+def main():
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = soverain_store.connect(os.path.join(tmp, "bundle.db"))
+        seed(conn, "Source")
+        bundle = io.BytesIO()
+        export_profile("Source", bundle, conn)
+        data = bundle.getvalue()
+
+        first = restore_profile(io.BytesIO(data), into="Copy", conn=conn)
+        again = restore_profile(io.BytesIO(data), into="Copy", conn=conn)
+        report = {
+            "source": counts(conn, "Source"),
+            "restored": counts(conn, "Copy"),
+            "first_restore": first,
+            "second_restore": again,
+            "truncated_refused": refused(conn, data[:len(data) - 7]),
+            "garbage_refused": refused(conn, MAGIC + b"\x00\x00\x00\x05junk!"),
+            "damaged_refused": {name: refused(conn, data) for name, data in DAMAGED.items()},
+        }
+        conn.close()
+
+    if report["restored"] != report["source"]:
+        failures.append("restored entry counts differ from the exported profile")
+    if again["added"]:
+        failures.append("restoring the same bundle twice added entries")
+    if not (report["truncated_refused"] and report["garbage_refused"] and all(report["damaged_refused"].values())):
+        failures.append("a damaged bundle was not refused with BundleError")
+    report["failures"] = failures
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
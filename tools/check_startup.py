@@ -0,0 +1,71 @@
+# ======================= Startup Budget Check =======================
+#
+# Times the first run of a fresh session of soverain_app.py (time to first paint)
+# in a clean interpreter, the way an autoscaled container sees it, and fails if the
+# median is over budget or if pandas was imported just to render the default page.
+#
+#   python tools/check_startup.py                 # budget from SOVERAIN_STARTUP_BUDGET (s)
+#   python tools/check_startup.py --app old.py    # measure another revision
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+preloaded = "pandas" in sys.modules
+at = AppTest.from_file(sys.argv[1], default_timeout=60)
+started = time.perf_counter()
+at.run()
+print(json.dumps({
+    "first_paint": time.perf_counter() - started,
+    "pandas_loaded": not preloaded and "pandas" in sys.modules,
+    "exceptions": len(at.exception),
+}))
+"""
+
+
+def measure(app, runs):
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Without the report renderer, which would start render processes mid-measurement
+        env = dict(os.environ, SOVERAIN_DB=os.path.join(tmp, "startup.db"), SOVERAIN_REPORT_WORKERS="0")
+        for _ in range(runs):
+            out = subprocess.run(
+                [sys.executable, "-c", PROBE, app],
+                cwd=ROOT, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            samples.append(json.loads(out.strip().splitlines()[-1]))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check Soverain's cold-start budget.")
+    parser.add_argument("--app", default=os.path.join(ROOT, "soverain_app.py"))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=float(os.environ.get("SOVERAIN_STARTUP_BUDGET", "0.5")))
+    args = parser.parse_args()
+
+    samples = measure(os.path.abspath(args.app), args.runs)
+    report = {
+        "app": os.path.relpath(args.app, ROOT),
+        "median_first_paint": round(statistics.median(s["first_paint"] for s in samples), 3),
+        "max_first_paint": round(max(s["first_paint"] for s in samples), 3),
+        "pandas_loaded": any(s["pandas_loaded"] for s in samples),
+        "exceptions": max(s["exceptions"] for s in samples),
+        "budget": args.budget,
+    }
+    print(json.dumps(report, indent=2))
+    failed = report["median_first_paint"] > args.budget or report["pandas_loaded"] or report["exceptions"]
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# ======================= Concurrent-Session Load Test =======================
+#
+# Simulates concurrent users of soverain_app.py with in-process AppTest sessions spread
+# over a process pool. Each user runs a scripted visit: switch profile, drag the Instant
+# Calculator sliders, save a Scripture Catalog scenario, save a journal entry and search.
+# Every step is one rerun; the report gives rerun latency percentiles, throughput and
+# resident memory per session for each (history size, user count) pair.
+#
+# Sessions assigned to a worker are kept open side by side, the way one server process
+# holds them, so the worker's RSS growth divided by its sessions is the per-session cost.
+#
+#   python tools/loadtest.py --users 1 4 16 --history 0 1000 --out loadtest.json
+#   python tools/loadtest.py --users 4 --compare loadtest.json   # diff against a run
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The app's report renderer would spawn render processes alongside the sessions being
+# measured; reports are timed on their own (soverain_reports.py)
+os.environ["SOVERAIN_REPORT_WORKERS"] = "0"
+
+PROFILES = ["Me", "Team", "Mentor", "Board"]
+WORDS = ["grace", "obedience", "forgiveness", "patience", "mercy", "courage", "prayer", "humility"]
+
+
+def rss_mb():
+    # Current resident set size of this process
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def seed_history(db, per_profile, seed):
+    # Give every profile `per_profile` scenarios and reflections spread over the last year
+    import soverain_store
+    from soverain_core import SCRIPTURE_CATALOG, A_from_G, G_from_CHF, label_from_score, score_from_A
+
+    rng = random.Random(seed)
+    conn = soverain_store.connect(db)
+    for profile in PROFILES:
+        items = []
+        for i in range(per_profile):
+            saved = (date.today() - timedelta(days=rng.randrange(365))).isoformat()
+            if i % 3:
+                book, verse, figure, situation, C, H, F, ref = rng.choice(SCRIPTURE_CATALOG)
+                G = G_from_CHF(C, H, F)
+                score = score_from_A(A_from_G(G))
+                kind, entry = "scenarios", {
+                    "Book": book, "Verse": verse, "Figure": figure, "Situation": situation,
+                    "C": C, "H": H, "F": F, "G": G, "Score": score,
+                    "Label": label_from_score(score), "Ref": ref, "Saved": saved,
+                }
+            else:
+                kind, entry = "reflections", {
+                    "Text": " ".join(rng.choice(WORDS) for _ in range(40)),
+                    "Tags": ", ".join(rng.sample(WORDS, 2)), "LinkedTo": "None",
+                    "Score": None, "G": None, "Saved": saved,
+                }
+            payload = soverain_store.entry_payload(entry)
+            items.append((kind, entry, payload, soverain_store.entry_hash(kind, payload)))
+        soverain_store.save_entries(profile, items, conn)
+
+
+def _worker_init(db, app):
+    os.environ["SOVERAIN_DB"] = db
+    os.chdir(ROOT)
+    # Load the app's imports once so they are not billed to the first measured rerun
+    from streamlit.testing.v1 import AppTest
+    main = sys.modules["__main__"]
+    AppTest.from_file(app, default_timeout=120).run()
+    sys.modules["__main__"] = main  # the script runner replaces it; the pool unpickles from it
+
+
+def open_page(at, title):
+    # AppTest.switch_page() only resolves file pages, so pick the st.Page by title
+    at._page_hash = next(
+        h for h, info in at._registered_pages.items() if info["page_name"] == title
+    )
+
+
+def _widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def script(rng, user):
+    # One user's visit as (step name, action) pairs; each action is followed by a rerun
+    profile = PROFILES[user % len(PROFILES)]
+    query = rng.choice(WORDS)
+    return [
+        ("open", lambda at: None),
+        ("switch_profile", lambda at: _widget(at.selectbox, "Choose Profile").set_value(profile)),
+        ("open_instant", lambda at: open_page(at, "Instant Calculator")),
+        ("drag_slider", lambda at: at.slider(key="instant_C_slider").set_value(round(rng.random(), 2))),
+        ("drag_slider", lambda at: at.slider(key="instant_H_slider").set_value(round(rng.random(), 2))),
+        ("drag_slider", lambda at: at.slider(key="instant_F_slider").set_value(round(rng.random(), 2))),
+        ("open_scripture", lambda at: open_page(at, "Scripture Catalog")),
+        ("save_scenario", lambda at: _widget(at.button, "💾 Save This Scenario").click()),
+        ("open_journal", lambda at: open_page(at, "Journaling")),
+        # Form values are only sent with the submit, so filling and saving is one rerun
+        ("save_journal", lambda at: (
+            at.text_area[0].input(" ".join(rng.choice(WORDS) for _ in range(30))),
+            _widget(at.text_input, "Tags (optional)").input(query),
+            _widget(at.button, "💾 Save Reflection").click(),
+        )),
+        ("open_search", lambda at: open_page(at, "Tags & Search")),
+        ("search", lambda at: _widget(at.text_input, "Search by keyword, book, figure, or tag").input(query)),
+    ]
+
+
+def run_sessions(users, app, seed):
+    # Runs the given users' scripts interleaved in this process; returns timings and memory
+    from streamlit.testing.v1 import AppTest
+
+    main = sys.modules["__main__"]
+    baseline = rss_mb()
+    sessions = []
+    for user in users:
+        rng = random.Random(seed * 1000 + user)
+        sessions.append((AppTest.from_file(app, default_timeout=120), script(rng, user)))
+    latencies = {}
+    errors = 0
+    for step in range(max(len(steps) for _, steps in sessions)):
+        for at, steps in sessions:
+            if step >= len(steps):
+                continue
+            name, action = steps[step]
+            try:
+                action(at)
+                started = time.perf_counter()
+                at.run()
+                latencies.setdefault(name, []).append(time.perf_counter() - started)
+                errors += len(at.exception)
+            except Exception:
+                errors += 1
+    sys.modules["__main__"] = main
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "sessions": len(sessions),
+        "rss_growth": rss_mb() - baseline,
+        "rss": rss_mb(),
+    }
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def measure(app, users, history, workers, seed):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "loadtest.db")
+        seed_history(db, history, seed)
+        workers = min(workers, users)
+        shares = [list(range(users))[w::workers] for w in range(workers)]
+        with ProcessPoolExecutor(workers, initializer=_worker_init, initargs=(db, app)) as pool:
+            started = time.perf_counter()
+            results = list(pool.map(run_sessions, shares, [app] * workers, [seed] * workers))
+            wall = time.perf_counter() - started
+
+    every = [t for r in results for ts in r["latencies"].values() for t in ts]
+    steps = {}
+    for r in results:
+        for name, ts in r["latencies"].items():
+            steps.setdefault(name, []).extend(ts)
+    ms = lambda s: round(s * 1000, 1)
+    return {
+        "users": users,
+        "history": history,
+        "workers": workers,
+        "reruns": len(every),
+        "errors": sum(r["errors"] for r in results),
+        "p50_ms": ms(percentile(every, 0.50)),
+        "p95_ms": ms(percentile(every, 0.95)),
+        "p99_ms": ms(percentile(every, 0.99)),
+        "throughput_rps": round(len(every) / wall, 2),
+        "rss_per_session_mb": round(statistics.mean(r["rss_growth"] / r["sessions"] for r in results), 1),
+        "rss_max_mb": round(max(r["rss"] for r in results), 1),
+        "steps_p95_ms": {name: ms(percentile(ts, 0.95)) for name, ts in sorted(steps.items())},
+    }
+
+
+def compare(rows, baseline):
+    # Percent change of the headline numbers against an earlier report
+    old = {(r["users"], r["history"]): r for r in baseline["runs"]}
+    for row in rows:
+        before = old.get((row["users"], row["history"]))
+        if not before:
+            continue
+        changes = []
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps", "rss_per_session_mb"):
+            if before[metric]:
+                changes.append(f"{metric} {100 * (row[metric] - before[metric]) / before[metric]:+.0f}%")
+        print(f"users={row['users']} history={row['history']}: " + ", ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test Soverain with concurrent AppTest sessions.")
+    parser.add_argument("--app", default=os.path.join(ROOT, "soverain_app.py"))
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 1000], help="entries per profile")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="write the JSON report here")
+    parser.add_argument("--compare", help="earlier JSON report to diff against")
+    args = parser.parse_args()
+
+    app = os.path.abspath(args.app)
+    rows = [measure(app, users, history, args.workers, args.seed)
+            for history in args.history for users in args.users]
+    report = {
+        "app": os.path.relpath(app, ROOT),
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "runs": rows,
+    }
+    # Sorted keys and one run per entry keep reports line-diffable between releases
+    text = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    print(text)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(rows, json.load(f))
+    sys.exit(1 if any(r["errors"] for r in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()